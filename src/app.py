@@ -1,10 +1,11 @@
 import sys
 
 from PySide6.QtWidgets import QApplication, QMainWindow, QStackedWidget
-from PySide6.QtGui import QFontDatabase, QIcon, QShortcut, QKeySequence
+from PySide6.QtGui import QFontDatabase, QIcon, QShortcut, QKeySequence, QPixmapCache
 from PySide6.QtCore import Qt
 
 import src.utils.config as cfg
+from src.models import storage
 from src.utils.config import FONTS_DIR, STYLES_DIR, COURSES_DIR, ASSETS_DIR
 from src.views.home_view import HomeView
 from src.views.lecture_view import LectureView
@@ -87,6 +88,11 @@ class MainWindow(QMainWindow):
             self._back_to_lecture()
         # HomeView: do nothing
 
+    def closeEvent(self, event):
+        self._lecture.flush()
+        self._review.shutdown()
+        super().closeEvent(event)
+
     def _back_to_lecture(self):
         self._lecture.refresh_session()
         self._stack.setCurrentWidget(self._lecture)
@@ -150,10 +156,12 @@ def create_app() -> QApplication:
     app.setApplicationDisplayName("gloss")
     _set_dock_name("gloss")
     _register_fonts()
+    QPixmapCache.setCacheLimit(20 * 1024)  # KB — drag snapshots, thumbnails
     _apply_theme(app, DEFAULT_FONT_SIZE)
     _load_icon(app)
     COURSES_DIR.mkdir(parents=True, exist_ok=True)
     window = MainWindow()
     window.show()
+    app.aboutToQuit.connect(storage.flush_writes)
     app._window = window
     return app
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import sys
 import unicodedata
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -23,13 +24,26 @@ class Course:
     name: str
     created_at: str
     order: int = 0
+    color: int = -1  # index into the course palette; -1 = not yet assigned
 
     def to_dict(self) -> dict:
-        return {"id": self.id, "name": self.name, "created_at": self.created_at, "order": self.order}
+        return {
+            "id": self.id,
+            "name": self.name,
+            "created_at": self.created_at,
+            "order": self.order,
+            "color": self.color,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> Course:
-        return cls(id=data["id"], name=data["name"], created_at=data["created_at"], order=data.get("order", 0))
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            created_at=data["created_at"],
+            order=data.get("order", 0),
+            color=data.get("color", -1),
+        )
 
 
 @dataclass
@@ -135,7 +149,7 @@ class Session:
     def from_dict(cls, data: dict) -> Session:
         slides = {}
         for k, v in data.get("slides", {}).items():
-            slides[k] = SlideData.from_dict(v)
+            slides[sys.intern(k)] = SlideData.from_dict(v)
         return cls(
             id=data["id"],
             title=data["title"],
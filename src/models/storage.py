@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import threading
+import traceback
 from datetime import datetime
 from pathlib import Path
+from typing import NamedTuple
 
 from src.models.session import Course, Group, Session, SlideData, slugify
 from src.utils.config import COURSES_DIR
@@ -16,9 +20,132 @@ def _read_json(path: Path) -> dict:
         return json.load(f)
 
 
+def _dump_json(data: dict) -> str:
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 def _write_json(path: Path, data: dict) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _write_text(path, _dump_json(data))
+
+
+def _write_text(path: Path, text: str) -> None:
+    # Write-then-rename so a concurrent reader never sees a half-written file
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+# path -> last content handed to the writer, minus updated_at. An entry is
+# dropped if its write fails, so the next save of the same content retries.
+_saved_sessions: dict[Path, dict] = {}
+
+
+def _forget_saved_sessions(root: Path) -> None:
+    """Drop dedupe entries for session files under *root* (deleted or moved away)."""
+    for path in list(_saved_sessions):
+        if path.is_relative_to(root):
+            _saved_sessions.pop(path, None)
+
+
+class _SessionWriter:
+    """Writes session files on a background thread, latest write per path wins.
+
+    An entry stays in the pending map until it is on disk, so get() always
+    returns the newest content for a path whose write hasn't landed yet.
+    """
+
+    def __init__(self):
+        self._pending: dict[Path, str] = {}
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, path: Path, text: str) -> None:
+        with self._cond:
+            self._pending[path] = text
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="session-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def get(self, path: Path) -> str | None:
+        with self._cond:
+            return self._pending.get(path)
+
+    def flush(self) -> None:
+        """Block until every submitted write is on disk."""
+        with self._cond:
+            while self._pending:
+                self._cond.wait()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                path, text = next(iter(self._pending.items()))
+            try:
+                _write_text(path, text)
+            except OSError:
+                traceback.print_exc()
+                _saved_sessions.pop(path, None)
+            with self._cond:
+                # A newer save may have replaced the entry while we were writing
+                if self._pending.get(path) is text:
+                    del self._pending[path]
+                self._cond.notify_all()
+
+
+_session_writer = _SessionWriter()
+
+
+def flush_writes() -> None:
+    """Wait for background session saves to reach disk (call before quitting)."""
+    _session_writer.flush()
+
+
+# path -> ((inode, mtime_ns, size), parsed JSON)
+_json_cache: dict[Path, tuple[tuple[int, int, int], dict]] = {}
+
+
+def _read_json_cached(path: Path) -> dict:
+    """Like _read_json, but reuses the last parse while the file is unchanged on disk.
+
+    Every write replaces the file, so a stat() is enough to tell. The returned
+    dict is shared between callers and must not be mutated.
+    """
+    st = os.stat(path)
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    hit = _json_cache.get(path)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    data = _read_json(path)
+    _json_cache[path] = (stamp, data)
+    return data
+
+
+def _scan_dir(parent: Path, filename: str, cached: bool = True) -> list[tuple[Path, dict]]:
+    """Return (subdir, parsed JSON) for every subdirectory of *parent* holding *filename*.
+
+    Uses a single scandir() pass; missing directories and files are skipped.
+    With *cached*, unchanged files are served from _read_json_cached.
+    """
+    read = _read_json_cached if cached else _read_json
+    found = []
+    try:
+        entries = os.scandir(parent)
+    except FileNotFoundError:
+        return found
+    with entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            d = Path(entry.path)
+            try:
+                found.append((d, read(d / filename)))
+            except FileNotFoundError:
+                continue
+    return found
 
 
 # -- Path helpers --------------------------------------------------------------
@@ -57,23 +184,39 @@ def create_course(name: str) -> Course:
     now = datetime.now().isoformat(timespec="seconds")
     existing = list_courses()
     order = max((c.order for c in existing), default=-1) + 1
-    course = Course(id=course_id, name=name, created_at=now, order=order)
+    # Colors are handed out round-robin and then stay with the course
+    color = max((c.color for c in existing), default=-1) + 1
+    course = Course(id=course_id, name=name, created_at=now, order=order, color=color)
     _write_json(course_dir / "course.json", course.to_dict())
     return course
 
 
 def list_courses() -> list[Course]:
-    if not COURSES_DIR.exists():
-        return []
-    courses = []
-    for d in COURSES_DIR.iterdir():
-        cj = d / "course.json"
-        if d.is_dir() and cj.exists():
-            courses.append(Course.from_dict(_read_json(cj)))
+    courses = [Course.from_dict(data) for _, data in _scan_dir(COURSES_DIR, "course.json")]
     courses.sort(key=lambda c: (c.order, c.created_at))
+    _assign_missing_colors(courses)
     return courses
 
 
+def load_course(course_id: str) -> Course:
+    return Course.from_dict(_read_json_cached(COURSES_DIR / course_id / "course.json"))
+
+
+def _assign_missing_colors(courses: list[Course]) -> None:
+    """Pin a color on courses created before colors were stored.
+
+    They get the color their list position used to give them, so nothing
+    changes on screen; *courses* must be in display order.
+    """
+    for i, course in enumerate(courses):
+        if course.color < 0:
+            course.color = i
+            cj = COURSES_DIR / course.id / "course.json"
+            data = _read_json(cj)
+            data["color"] = i
+            _write_json(cj, data)
+
+
 def rename_course(course_id: str, new_name: str) -> None:
     course_dir = COURSES_DIR / course_id
     cj = course_dir / "course.json"
@@ -92,8 +235,26 @@ def reorder_courses(ordered_ids: list[str]) -> None:
             _write_json(cj, data)
 
 
+def move_course(course_id: str, new_index: int) -> None:
+    """Move one course to *new_index*, rewriting only the course.json files whose order changes."""
+    courses = list_courses()
+    moving = next((c for c in courses if c.id == course_id), None)
+    if moving is None:
+        return
+    courses.remove(moving)
+    courses.insert(new_index, moving)
+    for i, course in enumerate(courses):
+        if course.order != i:
+            cj = COURSES_DIR / course.id / "course.json"
+            data = _read_json(cj)
+            data["order"] = i
+            _write_json(cj, data)
+
+
 def delete_course(course_id: str) -> None:
+    _session_writer.flush()
     course_dir = COURSES_DIR / course_id
+    _forget_saved_sessions(course_dir)
     if course_dir.exists():
         shutil.rmtree(course_dir)
 
@@ -124,14 +285,7 @@ def create_group(course_id: str, name: str) -> Group:
 
 
 def list_groups(course_id: str) -> list[Group]:
-    groups_dir = COURSES_DIR / course_id / "groups"
-    if not groups_dir.exists():
-        return []
-    groups = []
-    for d in groups_dir.iterdir():
-        gj = d / "group.json"
-        if d.is_dir() and gj.exists():
-            groups.append(Group.from_dict(_read_json(gj)))
+    groups = [Group.from_dict(data) for _, data in _scan_dir(COURSES_DIR / course_id / "groups", "group.json")]
     groups.sort(key=lambda g: (g.order, g.created_at))
     return groups
 
@@ -154,11 +308,56 @@ def reorder_groups(course_id: str, ordered_ids: list[str]) -> None:
 
 
 def delete_group(course_id: str, group_id: str) -> None:
+    _session_writer.flush()
     group_dir = COURSES_DIR / course_id / "groups" / group_id
+    _forget_saved_sessions(group_dir)
     if group_dir.exists():
         shutil.rmtree(group_dir)
 
 
+# -- Home snapshot -------------------------------------------------------------
+
+
+class CourseSnapshot(NamedTuple):
+    course: Course
+    lectures: list[Session]  # ungrouped; slide notes/reviews are not loaded
+    groups: list[tuple[Group, list[Session]]]
+
+
+def load_home_snapshot() -> list[CourseSnapshot]:
+    """Everything the home screen shows, read in one walk of the courses tree."""
+    snapshots = [
+        _course_snapshot(course_dir, data)
+        for course_dir, data in _scan_dir(COURSES_DIR, "course.json")
+    ]
+    snapshots.sort(key=lambda snap: (snap.course.order, snap.course.created_at))
+    _assign_missing_colors([snap.course for snap in snapshots])
+    return snapshots
+
+
+def load_course_snapshot(course_id: str) -> CourseSnapshot | None:
+    """Snapshot of a single course, or None if it no longer exists."""
+    course_dir = COURSES_DIR / course_id
+    try:
+        data = _read_json_cached(course_dir / "course.json")
+    except FileNotFoundError:
+        return None
+    return _course_snapshot(course_dir, data)
+
+
+def _course_snapshot(course_dir: Path, data: dict) -> CourseSnapshot:
+    groups = [
+        (Group.from_dict(gdata), _load_sessions(group_dir / "lectures", slides=False))
+        for group_dir, gdata in _scan_dir(course_dir / "groups", "group.json")
+    ]
+    groups.sort(key=lambda pair: (pair[0].order, pair[0].created_at))
+    return CourseSnapshot(
+        course=Course.from_dict(data),
+        lectures=_load_sessions(course_dir / "lectures", slides=False),
+        groups=groups,
+    )
+
+
 # -- Lectures ------------------------------------------------------------------
 
 
@@ -178,7 +377,7 @@ def create_lecture(course_id: str, title: str, pdf_path: str, group_id: str | No
     shutil.copy2(pdf_path, lecture_dir / "slides.pdf")
 
     now = datetime.now().isoformat(timespec="seconds")
-    existing = list_lectures(course_id, group_id=group_id)
+    existing = _load_sessions(lectures_dir, slides=False)
     order = max((s.order for s in existing), default=-1) + 1
     session = Session(
         id=lecture_id,
@@ -193,19 +392,23 @@ def create_lecture(course_id: str, title: str, pdf_path: str, group_id: str | No
 
 
 def list_lectures(course_id: str, group_id: str | None = None) -> list[Session]:
-    lectures_dir = _lectures_dir(course_id, group_id)
-    if not lectures_dir.exists():
-        return []
-    sessions = []
-    for d in lectures_dir.iterdir():
-        sj = d / "session.json"
-        if d.is_dir() and sj.exists():
-            sessions.append(Session.from_dict(_read_json(sj)))
+    return _load_sessions(_lectures_dir(course_id, group_id))
+
+
+def _load_sessions(lectures_dir: Path, slides: bool = True) -> list[Session]:
+    """Sessions under *lectures_dir*; ``slides=False`` skips parsing notes and reviews."""
+    # Full sessions are handed to callers that edit them, so they get a fresh parse
+    entries = _scan_dir(lectures_dir, "session.json", cached=not slides)
+    if slides:
+        sessions = [Session.from_dict(data) for _, data in entries]
+    else:
+        sessions = [Session.from_dict({**data, "slides": {}, "finalized_notes": {}}) for _, data in entries]
     sessions.sort(key=lambda s: (s.order, s.created_at))
     return sessions
 
 
 def reorder_lectures(course_id: str, ordered_ids: list[str], group_id: str | None = None) -> None:
+    _session_writer.flush()
     for i, lid in enumerate(ordered_ids):
         sj = lecture_dir_path(course_id, lid, group_id) / "session.json"
         if sj.exists():
@@ -215,6 +418,7 @@ def reorder_lectures(course_id: str, ordered_ids: list[str], group_id: str | Non
 
 
 def rename_lecture(course_id: str, lecture_id: str, new_title: str, group_id: str | None = None) -> None:
+    _session_writer.flush()
     sj = lecture_dir_path(course_id, lecture_id, group_id) / "session.json"
     if sj.exists():
         data = _read_json(sj)
@@ -223,25 +427,41 @@ def rename_lecture(course_id: str, lecture_id: str, new_title: str, group_id: st
 
 
 def delete_lecture(course_id: str, lecture_id: str, group_id: str | None = None) -> None:
+    _session_writer.flush()
     ld = lecture_dir_path(course_id, lecture_id, group_id)
+    _forget_saved_sessions(ld)
     if ld.exists():
         shutil.rmtree(ld)
 
 
 def load_session(course_id: str, lecture_id: str, group_id: str | None = None) -> Session:
     path = lecture_dir_path(course_id, lecture_id, group_id) / "session.json"
+    pending = _session_writer.get(path)
+    if pending is not None:
+        return Session.from_dict(json.loads(pending))
     return Session.from_dict(_read_json(path))
 
 
 def save_session(course_id: str, session: Session, group_id: str | None = None) -> None:
-    session.updated_at = datetime.now().isoformat(timespec="seconds")
+    """Serialize *session* now and write it in the background.
+
+    Saves identical to the previous one for the same file are skipped.
+    """
     path = lecture_dir_path(course_id, session.id, group_id) / "session.json"
-    _write_json(path, session.to_dict())
+    data = session.to_dict()
+    content = {k: v for k, v in data.items() if k != "updated_at"}
+    if _saved_sessions.get(path) == content:
+        return
+    _saved_sessions[path] = content
+    session.updated_at = data["updated_at"] = datetime.now().isoformat(timespec="seconds")
+    _session_writer.submit(path, _dump_json(data))
 
 
 def move_lecture(course_id: str, lecture_id: str, from_group_id: str | None, to_group_id: str | None) -> None:
     """Move a lecture directory between ungrouped and grouped (or group to group)."""
+    _session_writer.flush()
     src = lecture_dir_path(course_id, lecture_id, from_group_id)
+    _forget_saved_sessions(src)
     if not src.exists():
         return
     dst_parent = _lectures_dir(course_id, to_group_id)
@@ -1,10 +1,10 @@
-"""LLM provider abstraction and background review worker."""
+"""LLM provider abstraction and background review workers."""
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, Signal, Slot
 
 from src.models.session import ReviewItem, FollowupMessage
 from src.services.note_parser import ParsedNote
@@ -59,48 +59,71 @@ class LLMProvider(ABC):
         ...
 
 
-class FollowupWorker(QThread):
-    """Send a single follow-up question to the LLM in the background."""
+class _LLMDispatcher(QObject):
+    """Hands finished provider calls to their callbacks on the GUI thread.
 
-    done = Signal(str)
-    error = Signal(str)
+    It lives as long as the pool and holds each call's callbacks until the
+    result arrives, so closures and partials work as receivers. Nothing
+    short-lived has to outlive the QRunnable that emits.
+    """
 
-    def __init__(
-        self,
-        provider: LLMProvider,
-        pdf_base64: str,
-        slide_number: int,
-        note_type: str,
-        original_note: str,
-        initial_response: str,
-        history: list[FollowupMessage],
-        question: str,
-        parent=None,
-    ):
-        super().__init__(parent)
-        self._provider = provider
-        self._pdf_base64 = pdf_base64
-        self._slide_number = slide_number
-        self._note_type = note_type
-        self._original_note = original_note
-        self._initial_response = initial_response
-        self._history = history
-        self._question = question
+    finished = Signal(int, bool, object)  # call id, succeeded, result or error message
+
+    def __init__(self):
+        super().__init__()
+        self._callbacks: dict[int, tuple] = {}
+        self._next_id = 0
+        self.finished.connect(self._deliver)  # queued: emitted from pool threads
+
+    def register(self, done, error) -> int:
+        call_id = self._next_id
+        self._next_id += 1
+        self._callbacks[call_id] = (done, error)
+        return call_id
+
+    @Slot(int, bool, object)
+    def _deliver(self, call_id: int, ok: bool, payload):
+        done, error = self._callbacks.pop(call_id)
+        (done if ok else error)(payload)
+
+
+class LLMTask(QRunnable):
+    """Run one provider call (a regenerate or follow-up) on the shared LLM pool."""
+
+    def __init__(self, dispatcher: _LLMDispatcher, call_id: int, fn, *args):
+        super().__init__()
+        self._dispatcher = dispatcher
+        self._call_id = call_id
+        self._fn = fn
+        self._args = args
 
     def run(self):
         try:
-            result = self._provider.follow_up(
-                self._pdf_base64,
-                self._slide_number,
-                self._note_type,
-                self._original_note,
-                self._initial_response,
-                self._history,
-                self._question,
-            )
-            self.done.emit(result)
+            result = self._fn(*self._args)
         except Exception as exc:
-            self.error.emit(_friendly_error(exc))
+            self._dispatcher.finished.emit(self._call_id, False, _friendly_error(exc))
+            return
+        self._dispatcher.finished.emit(self._call_id, True, result)
+
+
+_llm_pool: QThreadPool | None = None
+_llm_dispatcher: _LLMDispatcher | None = None
+
+
+def run_llm_task(fn, *args, done, error) -> None:
+    """Call ``fn(*args)`` on a small shared thread pool.
+
+    Threads are reused across requests and their number stays bounded however
+    many cards fire at once. *done* gets the result and *error* a friendly
+    message, both on the GUI thread. Any callable works as either.
+    """
+    global _llm_pool, _llm_dispatcher
+    if _llm_pool is None:
+        _llm_pool = QThreadPool()
+        _llm_pool.setMaxThreadCount(4)
+        _llm_dispatcher = _LLMDispatcher()  # first call is on the GUI thread
+    call_id = _llm_dispatcher.register(done, error)
+    _llm_pool.start(LLMTask(_llm_dispatcher, call_id, fn, *args))
 
 
 class ReviewWorker(QThread):
@@ -28,6 +28,8 @@ def parse_notes(raw_notes: str) -> list[ParsedNote]:
     """
     if not raw_notes or not raw_notes.strip():
         return []
+    if not any(sym in raw_notes for sym in SYMBOL_MAP):
+        return []  # no block can start without a symbol; skip the line scan
 
     notes: list[ParsedNote] = []
     current_type: str | None = None
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+from functools import lru_cache
 from pathlib import Path
 
 MAX_PDF_SIZE = 32 * 1024 * 1024  # 32 MB Anthropic limit
@@ -10,7 +11,10 @@ MAX_PDF_SIZE = 32 * 1024 * 1024  # 32 MB Anthropic limit
 
 def validate_pdf(pdf_path: Path) -> None:
     """Raise ValueError if the PDF exceeds the Anthropic size limit."""
-    size = pdf_path.stat().st_size
+    _check_size(pdf_path.stat().st_size)
+
+
+def _check_size(size: int) -> None:
     if size > MAX_PDF_SIZE:
         mb = size / (1024 * 1024)
         raise ValueError(
@@ -20,6 +24,18 @@ def validate_pdf(pdf_path: Path) -> None:
 
 
 def load_pdf_base64(pdf_path: Path) -> str:
-    """Read a PDF file and return its base64-encoded content."""
-    validate_pdf(pdf_path)
-    return base64.standard_b64encode(pdf_path.read_bytes()).decode("ascii")
+    """Read a PDF file and return its base64-encoded content.
+
+    Reuses the last encoding while the file's mtime and size are unchanged,
+    so re-entering review mode for the same lecture skips the read. Only the
+    most recent PDF is kept; its base64 can run to ~43 MB.
+    """
+    st = pdf_path.stat()
+    _check_size(st.st_size)
+    return _encode_pdf(str(pdf_path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1)
+def _encode_pdf(path: str, mtime_ns: int, size: int) -> str:
+    # mtime_ns and size are only part of the cache key
+    return base64.standard_b64encode(Path(path).read_bytes()).decode("ascii")
@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 from platformdirs import user_data_dir
@@ -25,8 +26,11 @@ def _read_config() -> dict:
 
 def _write_config(data: dict) -> None:
     CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+    # Write-then-rename so a reader never sees a truncated file
+    tmp = CONFIG_FILE.with_name(CONFIG_FILE.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, CONFIG_FILE)
 
 
 # ---------------------------------------------------------------------------
@@ -146,3 +150,18 @@ def save_gemini_model(model_id: str) -> None:
     data = _read_config()
     data["gemini_model"] = model_id
     _write_config(data)
+
+
+# ---------------------------------------------------------------------------
+# Home screen
+# ---------------------------------------------------------------------------
+
+def load_collapsed_groups() -> set[str]:
+    """Return the "course_id/group_id" keys of groups collapsed on the home screen."""
+    return set(_read_config().get("collapsed_groups", []))
+
+
+def save_collapsed_groups(keys: set[str]) -> None:
+    data = _read_config()
+    data["collapsed_groups"] = sorted(keys)
+    _write_config(data)
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import bisect
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Callable, Iterable, NamedTuple
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -20,12 +25,17 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QCheckBox,
 )
-from PySide6.QtCore import Signal, Qt, QMimeData, QPoint, QEvent, QUrl, QTimer
-from PySide6.QtGui import QDrag, QPixmap, QPainter, QColor, QDesktopServices
+from PySide6.QtCore import (
+    Signal, Slot, Qt, QMimeData, QPoint, QEvent, QUrl, QTimer, QRect, QSize,
+    QObject, QRunnable, QThreadPool,
+)
+from PySide6.QtGui import (
+    QDrag, QPixmap, QPixmapCache, QPainter, QColor, QCursor, QDesktopServices, QFont, QFontMetrics,
+)
 
 import src.utils.config as cfg
 from src.models import storage
-from src.models.session import Group, Session
+from src.models.session import Course, Group, Session
 from src.utils.config import (
     load_api_key, save_api_key, load_model, save_model, AVAILABLE_MODELS,
     load_openai_api_key, save_openai_api_key, load_openai_model, save_openai_model,
@@ -45,23 +55,66 @@ COURSE_COLORS = [
     "#f5c2e7",  # Pink
 ]
 
-_MENU_QSS = (
-    "QMenu {"
-    "  background-color: #313244;"
-    "  color: #cdd6f4;"
-    "  border: 1px solid #45475a;"
-    "  border-radius: 8px;"
-    "  padding: 6px 0px;"
-    "}"
-    "QMenu::item {"
-    "  padding: 8px 24px;"
-    "  margin: 2px 6px;"
-    "  border-radius: 4px;"
-    "}"
-    "QMenu::item:selected {"
-    "  background-color: #45475a;"
-    "}"
-)
+
+_DEFAULT_COURSE_COLOR = "#cdd6f4"
+
+
+def course_color(course: Course) -> str:
+    """Accent color stored for *course* — stable across reorders."""
+    if course.color < 0:
+        return _DEFAULT_COURSE_COLOR
+    return COURSE_COLORS[course.color % len(COURSE_COLORS)]
+
+
+# Accent-colored home widgets carry role/accent properties and are styled by
+# one sheet on the scroll container, parsed once instead of per widget.
+
+def _build_home_qss() -> str:
+    rules = [
+        'QLabel[role="lecture-title"] { color: #bac2de; border-radius: 4px; padding: 2px 4px; }',
+        'QLabel[role="lecture-title"]:hover { background-color: #313244; }',
+        'QPushButton[role="collapse"] { color: #585b70; background: transparent; padding: 0; }',
+        'QPushButton[role="add"] { padding: 3px 10px; color: #585b70; background: transparent; }',
+        "_CourseSection { padding-left: 8px; }",
+    ]
+    for color in (*COURSE_COLORS, _DEFAULT_COURSE_COLOR):
+        rules += [
+            f'QLabel[role="lecture-title"][accent="{color}"]:hover {{ color: {color}; }}',
+            f'QPushButton[accent="{color}"]:hover {{ color: {color}; }}',
+            f'_CourseSection[accent="{color}"] {{ border-left: 3px solid {color}; }}',
+        ]
+    return "\n".join(rules)
+
+
+_HOME_QSS = _build_home_qss()
+
+
+# Font-size dependent stylesheets — keyed by cfg.font_size so zooming just misses once
+
+@lru_cache(maxsize=None)
+def _title_qss(base: int) -> str:
+    return f"font-weight: bold; font-size: {base * 3}pt; color: #b4befe;"
+
+
+@lru_cache(maxsize=None)
+def _course_name_qss(base: int, color: str) -> str:
+    return f"font-weight: bold; color: {color}; font-size: {base + 4}pt;"
+
+
+@lru_cache(maxsize=None)
+def _group_name_qss(base: int, color: str) -> str:
+    return f"font-weight: bold; color: {color}; font-size: {base + 1}pt; opacity: 0.85;"
+
+
+_DATE_COLOR = QColor("#6c7086")
+
+
+@lru_cache(maxsize=None)
+def _date_font(base: int) -> tuple[QFont, QFontMetrics]:
+    font = QFont("JetBrains Mono")
+    font.setPointSize(max(base - 2, 8))
+    return font, QFontMetrics(font)
+
 
 _DROP_INDICATOR_QSS = "background-color: #89b4fa; border-radius: 1px;"
 
@@ -86,17 +139,48 @@ _CONFIRM_BTN = (
 )
 
 
+_input_dialog: QInputDialog | None = None
+
+
+def _forget_input_dialog():
+    global _input_dialog
+    _input_dialog = None
+
+
+def _shared_input_dialog(parent) -> QInputDialog:
+    """The one text-input dialog, styled once and owned by *parent*'s window."""
+    global _input_dialog
+    window = parent.window()
+    if _input_dialog is None:
+        _input_dialog = QInputDialog(window)
+        _input_dialog.setStyleSheet(_DIALOG_QSS)
+        _input_dialog.setMinimumWidth(400)
+        _input_dialog.resize(400, _input_dialog.minimumSizeHint().height())
+        _input_dialog.destroyed.connect(_forget_input_dialog)
+    elif _input_dialog.parentWidget() is not window:
+        _input_dialog.setParent(window, _input_dialog.windowFlags())
+    return _input_dialog
+
+
 def _get_text(parent, title: str, label: str, text: str = "") -> tuple[str, bool]:
     """Show a QInputDialog with a smaller font size."""
-    dialog = QInputDialog(parent)
+    dialog = _shared_input_dialog(parent)
     dialog.setWindowTitle(title)
     dialog.setLabelText(label)
     dialog.setTextValue(text)
-    dialog.setStyleSheet(_DIALOG_QSS)
-    dialog.setMinimumWidth(400)
-    dialog.resize(400, dialog.minimumSizeHint().height())
     ok = dialog.exec()
-    return dialog.textValue(), ok == QInputDialog.DialogCode.Accepted
+    value = dialog.textValue()
+    dialog.setTextValue("")
+    return value, ok == QInputDialog.DialogCode.Accepted
+
+
+def _pick_pdf(parent, on_selected: Callable[[str], None]):
+    """Open a PDF picker without blocking the event loop; *on_selected* gets the chosen path."""
+    dialog = QFileDialog(parent, "Select lecture PDF", "", "PDF Files (*.pdf)")
+    dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+    dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+    dialog.fileSelected.connect(on_selected)
+    dialog.open()
 
 
 def _confirm(parent, title: str, text: str) -> bool:
@@ -121,13 +205,13 @@ def _confirm(parent, title: str, text: str) -> bool:
 
     no_btn = QPushButton("No")
     no_btn.setStyleSheet(_CONFIRM_BTN.format(color="#f38ba8"))
-    no_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+    no_btn.setCursor(_hand_cursor())
     no_btn.clicked.connect(dlg.reject)
     btn_row.addWidget(no_btn)
 
     yes_btn = QPushButton("Yes")
     yes_btn.setStyleSheet(_CONFIRM_BTN.format(color="#a6e3a1"))
-    yes_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+    yes_btn.setCursor(_hand_cursor())
     yes_btn.clicked.connect(dlg.accept)
     btn_row.addWidget(yes_btn)
 
@@ -137,6 +221,22 @@ def _confirm(parent, title: str, text: str) -> bool:
     return dlg.exec() == QDialog.DialogCode.Accepted
 
 
+def _prompt_name(parent, title: str, label: str, prefill: str = "", noun: str = "Name") -> str | None:
+    """Ask for a name until it fits MAX_NAME_LENGTH. Returns the stripped name, or None if cancelled."""
+    while True:
+        text, ok = _get_text(parent, title, label, text=prefill)
+        if not ok:
+            return None
+        name = text.strip()
+        if not name:
+            return None
+        if len(name) > MAX_NAME_LENGTH:
+            _warning(parent, f"{noun} too long", f"{noun} must be {MAX_NAME_LENGTH} characters or fewer.")
+            prefill = text
+            continue
+        return name
+
+
 def _warning(parent, title: str, text: str) -> None:
     """Show a themed warning dialog."""
     dlg = QDialog(parent)
@@ -159,7 +259,7 @@ def _warning(parent, title: str, text: str) -> None:
 
     ok_btn = QPushButton("Ok")
     ok_btn.setStyleSheet(_CONFIRM_BTN.format(color="#89b4fa"))
-    ok_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+    ok_btn.setCursor(_hand_cursor())
     ok_btn.clicked.connect(dlg.accept)
     btn_row.addWidget(ok_btn)
 
@@ -169,6 +269,265 @@ def _warning(parent, title: str, text: str) -> None:
     dlg.exec()
 
 
+@lru_cache(maxsize=4096)
+def _fmt_date(iso: str) -> str:
+    """Short row date ("Mar 04") for an ISO timestamp; "" if it doesn't parse."""
+    try:
+        return datetime.fromisoformat(iso).strftime("%b %d")
+    except ValueError:
+        return ""
+
+
+@lru_cache(maxsize=1)
+def _start_drag_distance() -> int:
+    """Platform drag threshold, read once instead of on every mouse move."""
+    return QApplication.startDragDistance()
+
+
+@lru_cache(maxsize=None)
+def _hand_cursor() -> QCursor:
+    """One pointing-hand cursor shared by every clickable widget on the home screen."""
+    return QCursor(Qt.CursorShape.PointingHandCursor)
+
+
+def _row_height_hint() -> int:
+    """Approximate height of a _LectureRow at the current font size."""
+    return _row_height_for(cfg.font_size)
+
+
+@lru_cache(maxsize=None)
+def _row_height_for(base: int) -> int:
+    font = QFont("JetBrains Mono")
+    font.setPointSize(base)
+    return QFontMetrics(font).height() + 12  # row margins + label padding
+
+
+_LECTURE_MIME = "application/x-gloss-lecture"
+_GROUP_MIME = "application/x-gloss-group"
+_COURSE_MIME = "application/x-gloss-course"
+
+
+def _drag_kind(event) -> str:
+    """Return the gloss MIME type carried by a drag event, or "" if none.
+
+    In-app drags are classified by the type of their source widget, which is
+    far cheaper than Qt's format-list scan; hasFormat() is only the fallback
+    for drags without a source.
+    """
+    src = event.source()
+    if isinstance(src, _LectureRow):
+        return _LECTURE_MIME
+    if isinstance(src, _GroupSection):
+        return _GROUP_MIME
+    if isinstance(src, _CourseSection):
+        return _COURSE_MIME
+    if src is None:
+        mime = event.mimeData()
+        for fmt in (_LECTURE_MIME, _GROUP_MIME, _COURSE_MIME):
+            if mime.hasFormat(fmt):
+                return fmt
+    return ""
+
+
+# -- Background storage writes ------------------------------------------------
+
+
+class _StorageSignals(QObject):
+    done = Signal()
+
+
+class _StorageTask(QRunnable):
+    """Runs one storage call off the GUI thread and emits ``signals.done`` after."""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.signals = _StorageSignals()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self):
+        try:
+            self._fn(*self._args, **self._kwargs)
+        finally:
+            self.signals.done.emit()
+
+
+_collapsed: set[str] | None = None
+
+
+def _collapsed_groups() -> set[str]:
+    """Collapsed group keys, read from config once and kept in sync by _GroupSection."""
+    global _collapsed
+    if _collapsed is None:
+        _collapsed = cfg.load_collapsed_groups()
+    return _collapsed
+
+
+def _forget_collapsed(course_id: str, group_id: str | None = None) -> None:
+    """Drop the collapsed-state key of a deleted group, or of every group in a deleted course."""
+    collapsed = _collapsed_groups()
+    if group_id is not None:
+        stale = {f"{course_id}/{group_id}"} & collapsed
+    else:
+        stale = {key for key in collapsed if key.startswith(f"{course_id}/")}
+    if stale:
+        collapsed -= stale
+        cfg.save_collapsed_groups(collapsed)
+
+
+_storage_pool: QThreadPool | None = None
+
+
+def _run_storage(fn, *args, done=None, **kwargs):
+    """Queue a storage write on a single-thread pool so writes land in order.
+
+    Every home-screen mutation goes through here, keeping disk I/O (and PDF
+    copies on lecture creation) off the GUI thread.
+
+    *done* (a signal or slot) is invoked on the GUI thread once the call finishes.
+    """
+    global _storage_pool
+    if _storage_pool is None:
+        _storage_pool = QThreadPool()
+        _storage_pool.setMaxThreadCount(1)
+    task = _StorageTask(fn, *args, **kwargs)
+    if done is not None:
+        task.signals.done.connect(done)
+    _storage_pool.start(task)
+
+
+def _reorder_widgets(layout, widgets: dict[str, QWidget], new_ids: list[str]) -> dict[str, QWidget]:
+    """Rearrange a contiguous run of *widgets* in *layout* to follow *new_ids*.
+
+    *widgets* maps id -> widget in current layout order; returns the
+    mapping in the new order.
+    """
+    if not widgets or list(widgets) == new_ids:
+        return widgets
+    first = min(layout.indexOf(w) for w in widgets.values())
+    for w in widgets.values():
+        layout.removeWidget(w)
+    reordered = {i: widgets[i] for i in new_ids}
+    for offset, w in enumerate(reordered.values()):
+        layout.insertWidget(first + offset, w)
+    return reordered
+
+
+def _center_ys(widgets: Iterable[QWidget]) -> list[int]:
+    """Vertical centres of *widgets*, for bisecting a drop position."""
+    return [w.geometry().center().y() for w in widgets]
+
+
+@contextmanager
+def _updates_paused(widget: QWidget):
+    """Batch several layout mutations under *widget* into a single repaint."""
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+def _discard_widget(layout, widget: QWidget):
+    """Take *widget* out of *layout* and hide it now, so it can't be laid out or painted before deleteLater() runs."""
+    layout.removeWidget(widget)
+    widget.hide()
+    widget.deleteLater()
+
+
+def _place_widgets(layout, widgets: Iterable[QWidget], anchor: int):
+    """Ensure *widgets* occupy *layout* positions anchor, anchor+1, ... in order.
+
+    Widgets already in place are left alone; only out-of-place ones are moved.
+    """
+    for offset, w in enumerate(widgets):
+        index = anchor + offset
+        if layout.indexOf(w) != index:
+            layout.removeWidget(w)
+            layout.insertWidget(index, w)
+
+
+def _materialize_rows(layout, rows: dict, make_row, visible: QRect | None) -> bool:
+    """Replace placeholders in *rows* that intersect *visible* with real rows.
+
+    ``None`` for *visible* replaces them all. Returns True if any were swapped.
+    """
+    swapped = False
+    for lecture_id, w in rows.items():
+        if isinstance(w, _RowPlaceholder) and (visible is None or w.geometry().intersects(visible)):
+            row = make_row(w.session)
+            layout.replaceWidget(w, row)
+            rows[lecture_id] = row  # same key, so order is kept
+            w.hide()
+            w.deleteLater()
+            swapped = True
+    return swapped
+
+
+def _rename_row(rows: dict, lectures_by_id: dict[str, Session], lecture_id: str, title: str):
+    """Apply a lecture rename to the in-memory session and its row."""
+    session = lectures_by_id.get(lecture_id)
+    row = rows.get(lecture_id)
+    if session is None or row is None:
+        return
+    session.title = title
+    row.set_session(session)
+
+
+def _sync_rows(layout, rows: dict, lectures: list[Session], make_row, anchor: int) -> tuple[dict, list]:
+    """Bring a run of lecture rows in line with *lectures*, reusing rows by id.
+
+    Returns the new id -> row mapping and the rows that were created.
+    """
+    existing = dict(rows)
+    new_rows, created = {}, []
+    for session in lectures:
+        row = existing.pop(session.id, None)
+        if row is None:
+            row = make_row(session)
+            created.append(row)
+        else:
+            row.set_session(session)
+        new_rows[session.id] = row
+    for row in existing.values():
+        _discard_widget(layout, row)
+    _place_widgets(layout, new_rows.values(), anchor)
+    return new_rows, created
+
+
+def _dim_overlay(size: QSize, dpr: float) -> QPixmap:
+    """Translucent black layer of *size* device pixels, shared via QPixmapCache."""
+    key = f"dim:{size.width()}x{size.height()}@{dpr}"
+    cached = QPixmapCache.find(key)
+    if cached is not None and not cached.isNull():
+        return cached
+    overlay = QPixmap(size)
+    overlay.fill(QColor(0, 0, 0, 80))
+    overlay.setDevicePixelRatio(dpr)
+    QPixmapCache.insert(key, overlay)
+    return overlay
+
+
+def _drag_pixmap(widget: QWidget, key: str | None = None) -> QPixmap:
+    """Dimmed snapshot of *widget* for use as a drag pixmap.
+
+    When *key* is given the raster is shared through QPixmapCache, so widgets
+    that look identical reuse one pixmap instead of grabbing their own.
+    """
+    if key is not None:
+        cached = QPixmapCache.find(key)
+        if cached is not None and not cached.isNull():
+            return cached
+    pixmap = widget.grab()
+    painter = QPainter(pixmap)
+    painter.drawPixmap(0, 0, _dim_overlay(pixmap.size(), pixmap.devicePixelRatio()))
+    painter.end()
+    if key is not None:
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
 def _encode_lecture_mime(lecture_id: str, group_id: str = "") -> bytes:
     """Encode lecture_id and source group_id into drag mime data."""
     return f"{lecture_id}:{group_id}".encode()
@@ -184,55 +543,103 @@ def _decode_lecture_mime(data: bytes) -> tuple[str, str]:
 
 
 class _DropIndicator(QWidget):
-    """Thin colored line shown at the drop target position."""
+    """Thin colored line shown at the drop target position.
+
+    HomeView owns a single instance; sections position it in their own
+    coordinates through show_at().
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(3)
         self.setStyleSheet(_DROP_INDICATOR_QSS)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         self.hide()
+        self._rect = QRect()  # reused for every move
+
+    def show_at(self, source: QWidget, x: int, y: int, width: int):
+        """Show the line at (*x*, *y*) in *source* coordinates, *width* wide."""
+        pos = source.mapTo(self.parentWidget(), QPoint(x, y))
+        self._rect.setRect(pos.x(), pos.y(), width, 3)
+        if self.geometry() != self._rect:
+            self.setGeometry(self._rect)
+        if not self.isVisible():
+            self.raise_()
+            self.show()
+
+
+class _RowPlaceholder(QWidget):
+    """Fixed-height stand-in for a _LectureRow that hasn't scrolled into view yet."""
+
+    def __init__(self, session: Session, height: int, parent=None):
+        super().__init__(parent)
+        self.session = session
+        self.setFixedHeight(height)
+
+    def set_session(self, session: Session):
+        self.session = session
 
 
 class _LectureRow(QWidget):
     """A single clickable lecture entry."""
 
-    clicked = Signal()
-    rename_requested = Signal()
-    delete_requested = Signal()
+    # Each carries the lecture id so owners connect bound methods, not per-row closures
+    clicked = Signal(str)
+    rename_requested = Signal(str)
+    delete_requested = Signal(str)
 
     def __init__(self, session: Session, color: str = "#89b4fa", group_id: str = "", parent=None):
         super().__init__(parent)
         self.lecture_id = session.id
         self._color = color
         self._group_id = group_id
+        self._mime_payload = _encode_lecture_mime(session.id, group_id)  # ids never change
+        self.setMouseTracking(False)
+        self.setTabletTracking(False)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._context_menu)
 
+        # The date is painted in paintEvent rather than held in a child QLabel
+        self._date = _fmt_date(session.created_at or "")
+        self._date_font, metrics = _date_font(cfg.font_size)
+        self._date_width = metrics.horizontalAdvance(self._date)
+
         layout = QHBoxLayout(self)
-        layout.setContentsMargins(28, 4, 12, 4)
+        layout.setContentsMargins(28, 4, 12 + self._date_width + 8, 4)
 
         self._title = QLabel(session.title)
-        self._title.setStyleSheet(
-            "QLabel { color: #bac2de; border-radius: 4px; padding: 2px 4px; }"
-            f"QLabel:hover {{ background-color: #313244; color: {color}; }}"
-        )
-        self._title.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._title.setProperty("role", "lecture-title")
+        self._title.setProperty("accent", color)
+        self._title.setCursor(_hand_cursor())
         self._title.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
         self._title.setMinimumWidth(0)
-        layout.addWidget(self._title)
-        layout.addStretch()
-
-        try:
-            dt = datetime.fromisoformat(session.created_at)
-            date_str = dt.strftime("%b %d")
-        except (ValueError, TypeError):
-            date_str = ""
-        date_label = QLabel(date_str)
-        base = cfg.font_size
-        date_label.setStyleSheet(f"color: #6c7086; font-size: {max(base - 2, 8)}pt;")
-        layout.addWidget(date_label)
+        # Left alignment rather than a trailing stretch: one layout item per row, not two
+        layout.addWidget(self._title, 0, Qt.AlignmentFlag.AlignLeft)
 
         self._drag_start: QPoint | None = None
+        self._drag_snapshot: QPixmap | None = None  # dropped on resize/rename
+
+    def set_session(self, session: Session):
+        """Refresh the row for updated session data (e.g. after a rename)."""
+        if self._title.text() != session.title:
+            self._title.setText(session.title)
+            self._drag_snapshot = None
+
+    def resizeEvent(self, event):
+        self._drag_snapshot = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        p = QPainter(self)
+        p.setFont(self._date_font)
+        p.setPen(_DATE_COLOR)
+        p.drawText(
+            self.rect().adjusted(0, 0, -12, 0),
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+            self._date,
+        )
+        p.end()
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -242,40 +649,43 @@ class _LectureRow(QWidget):
     def mouseMoveEvent(self, event):
         if self._drag_start is None:
             return
-        if (event.position().toPoint() - self._drag_start).manhattanLength() < QApplication.startDragDistance():
+        if (event.position().toPoint() - self._drag_start).manhattanLength() < _start_drag_distance():
             return
         drag = QDrag(self)
         mime = QMimeData()
-        mime.setData("application/x-gloss-lecture", _encode_lecture_mime(self.lecture_id, self._group_id))
+        mime.setData(_LECTURE_MIME, self._mime_payload)
         drag.setMimeData(mime)
-        # Semi-transparent snapshot as drag pixmap
-        pixmap = self.grab()
-        painter = QPainter(pixmap)
-        painter.fillRect(pixmap.rect(), QColor(0, 0, 0, 80))
-        painter.end()
-        drag.setPixmap(pixmap)
+        # Semi-transparent snapshot as drag pixmap, shared between look-alike rows;
+        # the key covers everything paintEvent and the title's :hover rule draw
+        if self._drag_snapshot is None:
+            key = (
+                f"lec:{self._color}:{self.width()}x{self.height()}@{self.devicePixelRatioF()}"
+                f":{cfg.font_size}:{self._title.underMouse():d}:{self._date}:{self._title.text()}"
+            )
+            self._drag_snapshot = _drag_pixmap(self, key)
+        drag.setPixmap(self._drag_snapshot)
         drag.exec(Qt.DropAction.MoveAction)
         self._drag_start = None
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton and self._drag_start is not None:
             # Only emit click if we didn't drag and clicked on the title
-            if (event.position().toPoint() - self._drag_start).manhattanLength() < QApplication.startDragDistance():
+            if (event.position().toPoint() - self._drag_start).manhattanLength() < _start_drag_distance():
                 if self._title.geometry().contains(event.position().toPoint()):
-                    self.clicked.emit()
+                    self.clicked.emit(self.lecture_id)
             self._drag_start = None
         super().mouseReleaseEvent(event)
 
-    def _context_menu(self, pos):
+    @Slot(QPoint)
+    def _context_menu(self, pos: QPoint):
         menu = QMenu(self)
-        menu.setStyleSheet(_MENU_QSS)
         rename_action = menu.addAction("Rename lecture")
         delete_action = menu.addAction("Delete lecture")
         action = menu.exec(self.mapToGlobal(pos))
         if action == rename_action:
-            self.rename_requested.emit()
+            self.rename_requested.emit(self.lecture_id)
         elif action == delete_action:
-            self.delete_requested.emit()
+            self.delete_requested.emit(self.lecture_id)
 
 
 class _GroupSection(QWidget):
@@ -284,14 +694,27 @@ class _GroupSection(QWidget):
     lecture_clicked = Signal(str, str, str)  # course_id, lecture_id, group_id
     refresh_needed = Signal()
 
-    def __init__(self, course_id: str, group: Group, lectures: list[Session], color: str, parent=None):
+    def __init__(
+        self,
+        course_id: str,
+        group: Group,
+        lectures: list[Session],
+        color: str,
+        drop_indicator: _DropIndicator,
+        parent=None,
+    ):
         super().__init__(parent)
         self._course_id = course_id
         self._group = group
+        self._mime_payload = group.id.encode()
         self._color = color
-        self._collapsed = False
+        self._drop_indicator = drop_indicator
+        # Collapsed groups never materialize their rows, so they start out cheap
+        self._collapse_key = f"{course_id}/{group.id}"
+        self._collapsed = self._collapse_key in _collapsed_groups()
         self._lectures_by_id = {s.id: s for s in lectures}
-        self._lecture_ids = [s.id for s in lectures]
+        self.setMouseTracking(False)
+        self.setTabletTracking(False)
         self.setAcceptDrops(True)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._context_menu)
@@ -305,66 +728,105 @@ class _GroupSection(QWidget):
         header_layout = QHBoxLayout(self._header)
         header_layout.setContentsMargins(0, 0, 0, 0)
 
-        self._collapse_btn = QPushButton("v")
+        self._collapse_btn = QPushButton(">" if self._collapsed else "v")
         self._collapse_btn.setFixedWidth(24)
-        self._collapse_btn.setStyleSheet(
-            f"QPushButton {{ color: #585b70; background: transparent; padding: 0; }}"
-            f"QPushButton:hover {{ color: {color}; }}"
-        )
-        self._collapse_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._collapse_btn.setProperty("role", "collapse")
+        self._collapse_btn.setProperty("accent", color)
+        self._collapse_btn.setCursor(_hand_cursor())
         self._collapse_btn.clicked.connect(self._toggle_collapse)
         header_layout.addWidget(self._collapse_btn)
 
-        base = cfg.font_size
-        name_label = QLabel(group.name)
-        name_label.setStyleSheet(f"font-weight: bold; color: {color}; font-size: {base + 1}pt; opacity: 0.85;")
-        name_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        name_label.setMinimumWidth(0)
-        header_layout.addWidget(name_label)
+        self._name_label = QLabel(group.name)
+        self._name_label.setStyleSheet(_group_name_qss(cfg.font_size, color))
+        self._name_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self._name_label.setMinimumWidth(0)
+        header_layout.addWidget(self._name_label)
 
         self._body_layout.addWidget(self._header)
 
-        # Drop indicator
-        self._drop_indicator = _DropIndicator(self)
-
-        # Lecture rows
-        self._rows: list[_LectureRow] = []
-        if not lectures:
-            self._empty_hint = QLabel("No lectures")
-            self._empty_hint.setStyleSheet("color: #45475a; font-style: italic;")
-            self._empty_hint.setContentsMargins(28, 2, 0, 2)
-            self._body_layout.addWidget(self._empty_hint)
-        else:
-            self._empty_hint = None
-            for session in lectures:
-                self._add_lecture_row(session)
+        # Lecture rows, preceded by a hint shown while the group is empty
+        self._empty_hint = QLabel("No lectures")
+        self._empty_hint.setStyleSheet("color: #45475a; font-style: italic;")
+        self._empty_hint.setContentsMargins(28, 2, 0, 2)
+        self._empty_hint.setVisible(not lectures and not self._collapsed)
+        self._body_layout.addWidget(self._empty_hint)
+
+        # Placeholders until scrolled into view, as for ungrouped rows
+        self._rows: dict[str, _LectureRow | _RowPlaceholder] = {}  # by lecture id, in display order
+        for session in lectures:
+            placeholder = self._make_placeholder(session)
+            placeholder.setVisible(not self._collapsed)
+            self._body_layout.addWidget(placeholder)
+            self._rows[session.id] = placeholder
 
         # Drag state for group header
         self._drag_start: QPoint | None = None
+        self._drag_snapshot: QPixmap | None = None
+        self._row_centers: list[int] | None = None  # cached per drag
+        self._last_drop_idx = -1  # index the indicator currently marks
 
     @property
     def group_id(self) -> str:
         return self._group.id
 
-    def _add_lecture_row(self, session: Session):
+    def _make_placeholder(self, session: Session) -> _RowPlaceholder:
+        return _RowPlaceholder(session, _row_height_hint(), self)
+
+    def _make_row(self, session: Session) -> _LectureRow:
         row = _LectureRow(session, self._color, group_id=self._group.id, parent=self)
-        sid = session.id
-        gid = self._group.id
-        row.clicked.connect(lambda s=sid, g=gid: self.lecture_clicked.emit(self._course_id, s, g))
-        row.rename_requested.connect(lambda s=sid: self._rename_lecture(s))
-        row.delete_requested.connect(lambda s=sid: self._delete_lecture(s))
-        self._body_layout.addWidget(row)
-        self._rows.append(row)
+        row.clicked.connect(self._emit_lecture_clicked)
+        row.rename_requested.connect(self._rename_lecture)
+        row.delete_requested.connect(self._delete_lecture)
+        return row
+
+    @Slot(str)
+    def _emit_lecture_clicked(self, lecture_id: str):
+        self.lecture_clicked.emit(self._course_id, lecture_id, self._group.id)
+
+    def update_group(self, group: Group, lectures: list[Session]):
+        """Apply fresh data from storage, touching only rows that changed."""
+        self._group = group
+        if self._name_label.text() != group.name:
+            self._name_label.setText(group.name)
+        self._lectures_by_id = {s.id: s for s in lectures}
+        anchor = self._body_layout.indexOf(self._empty_hint) + 1
+        self._rows, created = _sync_rows(
+            self._body_layout, self._rows, lectures, self._make_placeholder, anchor,
+        )
+        for row in created:
+            row.setVisible(not self._collapsed)
+        self._empty_hint.setVisible(not self._rows and not self._collapsed)
+        self._drag_snapshot = None
+
+    def materialize_visible(self, visible: QRect | None):
+        """Swap placeholders intersecting *visible* (group coordinates) for real rows.
+
+        ``None`` materializes every row.
+        """
+        if self._collapsed:
+            return
+        if _materialize_rows(self._body_layout, self._rows, self._make_row, visible):
+            self._drag_snapshot = None
 
     # -- Collapse ----------------------------------------------------------------
 
+    @Slot()
     def _toggle_collapse(self):
         self._collapsed = not self._collapsed
         self._collapse_btn.setText(">" if self._collapsed else "v")
-        for row in self._rows:
+        collapsed = _collapsed_groups()
+        if self._collapsed:
+            collapsed.add(self._collapse_key)
+        else:
+            collapsed.discard(self._collapse_key)
+        # GUI thread: config.json is tiny, and other config writers run here too
+        cfg.save_collapsed_groups(collapsed)
+        if not self._collapsed:
+            # Expanding may not move the scrollbar, so build the rows now
+            self.materialize_visible(None)
+        for row in self._rows.values():
             row.setVisible(not self._collapsed)
-        if self._empty_hint:
-            self._empty_hint.setVisible(not self._collapsed)
+        self._empty_hint.setVisible(not self._rows and not self._collapsed)
 
     # -- Group header drag -------------------------------------------------------
 
@@ -378,17 +840,15 @@ class _GroupSection(QWidget):
     def mouseMoveEvent(self, event):
         if self._drag_start is None:
             return
-        if (event.position().toPoint() - self._drag_start).manhattanLength() < QApplication.startDragDistance():
+        if (event.position().toPoint() - self._drag_start).manhattanLength() < _start_drag_distance():
             return
         drag = QDrag(self)
         mime = QMimeData()
-        mime.setData("application/x-gloss-group", self._group.id.encode())
+        mime.setData(_GROUP_MIME, self._mime_payload)
         drag.setMimeData(mime)
-        pixmap = self.grab()
-        painter = QPainter(pixmap)
-        painter.fillRect(pixmap.rect(), QColor(0, 0, 0, 80))
-        painter.end()
-        drag.setPixmap(pixmap)
+        if self._drag_snapshot is None:
+            self._drag_snapshot = _drag_pixmap(self)
+        drag.setPixmap(self._drag_snapshot)
         drag.exec(Qt.DropAction.MoveAction)
         self._drag_start = None
 
@@ -396,110 +856,122 @@ class _GroupSection(QWidget):
         self._drag_start = None
         super().mouseReleaseEvent(event)
 
+    def resizeEvent(self, event):
+        self._drag_snapshot = None
+        super().resizeEvent(event)
+
     # -- Lecture drop target (within group) --------------------------------------
 
     def _drop_index(self, pos: QPoint) -> int:
-        for i, row in enumerate(self._rows):
-            row_rect = row.geometry()
-            if pos.y() < row_rect.center().y():
-                return i
-        return len(self._rows)
+        if self._row_centers is None:
+            self._row_centers = _center_ys(self._rows.values())
+        return bisect.bisect_right(self._row_centers, pos.y())
 
     def dragEnterEvent(self, event):
-        if event.mimeData().hasFormat("application/x-gloss-lecture"):
+        # Row geometry is fixed for the duration of a drag
+        self._row_centers = None
+        self._last_drop_idx = -1
+        if _drag_kind(event) == _LECTURE_MIME:
             event.acceptProposedAction()
 
     def dragMoveEvent(self, event):
-        if not event.mimeData().hasFormat("application/x-gloss-lecture"):
+        if _drag_kind(event) != _LECTURE_MIME:
             return
         event.acceptProposedAction()
         idx = self._drop_index(event.position().toPoint())
-        if self._rows:
-            if idx < len(self._rows):
-                ref = self._rows[idx]
-                y = ref.geometry().top() - 2
+        if idx == self._last_drop_idx:
+            return
+        self._last_drop_idx = idx
+        rows = list(self._rows.values())
+        if rows:
+            if idx < len(rows):
+                y = rows[idx].geometry().top() - 2
             else:
-                ref = self._rows[-1]
-                y = ref.geometry().bottom() + 1
+                y = rows[-1].geometry().bottom() + 1
         else:
             y = self._header.geometry().bottom() + 4
-        self._drop_indicator.setGeometry(28, y, self.width() - 40, 3)
-        self._drop_indicator.show()
+        self._drop_indicator.show_at(self, 28, y, self.width() - 40)
 
     def dragLeaveEvent(self, event):
         self._drop_indicator.hide()
+        self._row_centers = None
+        self._last_drop_idx = -1
 
     def dropEvent(self, event):
         self._drop_indicator.hide()
-        if not event.mimeData().hasFormat("application/x-gloss-lecture"):
+        self._last_drop_idx = -1
+        if _drag_kind(event) != _LECTURE_MIME:
             return
+        self._drop_at(event)
+        self._row_centers = None
+
+    def _drop_at(self, event):
         lecture_id, source_group = _decode_lecture_mime(
-            bytes(event.mimeData().data("application/x-gloss-lecture"))
+            bytes(event.mimeData().data(_LECTURE_MIME))
         )
         if source_group != self._group.id:
             # Cross-group move: move lecture into this group
-            storage.move_lecture(
+            _run_storage(
+                storage.move_lecture,
                 self._course_id, lecture_id,
                 from_group_id=source_group or None,
                 to_group_id=self._group.id,
+                done=self.refresh_needed,
             )
             event.acceptProposedAction()
-            self.refresh_needed.emit()
             return
         # Same group reorder
-        if lecture_id not in self._lecture_ids:
+        if lecture_id not in self._rows:
             return
         idx = self._drop_index(event.position().toPoint())
-        ids = [lid for lid in self._lecture_ids if lid != lecture_id]
+        ids = [lid for lid in self._rows if lid != lecture_id]
         ids.insert(idx, lecture_id)
-        storage.reorder_lectures(self._course_id, ids, group_id=self._group.id)
+        # Widgets are already in their new order; just persist it
+        self._rows = _reorder_widgets(self._body_layout, self._rows, ids)
+        _run_storage(storage.reorder_lectures, self._course_id, ids, group_id=self._group.id)
         event.acceptProposedAction()
-        self.refresh_needed.emit()
 
     # -- Lecture CRUD ------------------------------------------------------------
 
+    @Slot()
     def _add_lecture(self):
-        prefill = ""
-        while True:
-            title, ok = _get_text(self, "New Lecture", "Lecture title:", text=prefill)
-            if not ok or not title.strip():
-                return
-            if len(title.strip()) > MAX_NAME_LENGTH:
-                _warning(self, "Title too long", f"Title must be {MAX_NAME_LENGTH} characters or fewer.")
-                prefill = title
-                continue
-            break
-        pdf_path, _ = QFileDialog.getOpenFileName(
-            self, "Select lecture PDF", "", "PDF Files (*.pdf)"
-        )
+        title = _prompt_name(self, "New Lecture", "Lecture title:", noun="Title")
+        if title is None:
+            return
+        _pick_pdf(self, partial(self._create_lecture, title))
+
+    def _create_lecture(self, title: str, pdf_path: str):
         if not pdf_path:
             return
-        storage.create_lecture(self._course_id, title.strip(), pdf_path, group_id=self._group.id)
-        self.refresh_needed.emit()
+        _run_storage(
+            storage.create_lecture, self._course_id, title, pdf_path, group_id=self._group.id,
+            done=self.refresh_needed,
+        )
 
+    @Slot(str)
     def _rename_lecture(self, lecture_id: str):
         existing = self._lectures_by_id[lecture_id].title if lecture_id in self._lectures_by_id else ""
-        prefill = existing
-        while True:
-            new_title, ok = _get_text(self, "Rename Lecture", "New title:", text=prefill)
-            if not ok or not new_title.strip():
-                return
-            if len(new_title.strip()) > MAX_NAME_LENGTH:
-                _warning(self, "Title too long", f"Title must be {MAX_NAME_LENGTH} characters or fewer.")
-                prefill = new_title
-                continue
-            break
-        storage.rename_lecture(self._course_id, lecture_id, new_title.strip(), group_id=self._group.id)
-        self.refresh_needed.emit()
+        new_title = _prompt_name(self, "Rename Lecture", "New title:", prefill=existing, noun="Title")
+        if new_title is None:
+            return
+        # Only the label changes — patch it directly rather than reloading the course
+        _rename_row(self._rows, self._lectures_by_id, lecture_id, new_title)
+        self._drag_snapshot = None
+        _run_storage(
+            storage.rename_lecture, self._course_id, lecture_id, new_title, group_id=self._group.id,
+        )
 
+    @Slot(str)
     def _delete_lecture(self, lecture_id: str):
         if _confirm(self, "Delete lecture", "Delete this lecture and all its notes?"):
-            storage.delete_lecture(self._course_id, lecture_id, group_id=self._group.id)
-            self.refresh_needed.emit()
+            _run_storage(
+                storage.delete_lecture, self._course_id, lecture_id, group_id=self._group.id,
+                done=self.refresh_needed,
+            )
 
-    def _context_menu(self, pos):
+    @Slot(QPoint)
+    def _context_menu(self, pos: QPoint):
         menu = QMenu(self)
-        menu.setStyleSheet(_MENU_QSS)
         add_lecture_action = menu.addAction("Add lecture")
         menu.addSeparator()
         rename_action = menu.addAction("Rename group")
@@ -508,29 +980,27 @@ class _GroupSection(QWidget):
         if action == add_lecture_action:
             self._add_lecture()
         elif action == rename_action:
-            prefill = self._group.name
-            while True:
-                new_name, ok = _get_text(self, "Rename Group", "New name:", text=prefill)
-                if not ok or not new_name.strip():
-                    break
-                if len(new_name.strip()) > MAX_NAME_LENGTH:
-                    _warning(self, "Name too long", f"Name must be {MAX_NAME_LENGTH} characters or fewer.")
-                    prefill = new_name
-                    continue
-                storage.rename_group(self._course_id, self._group.id, new_name.strip())
-                self.refresh_needed.emit()
-                break
+            new_name = _prompt_name(self, "Rename Group", "New name:", prefill=self._group.name)
+            if new_name is not None:
+                _run_storage(
+                    storage.rename_group, self._course_id, self._group.id, new_name,
+                    done=self.refresh_needed,
+                )
         elif action == delete_action:
             if _confirm(self, "Delete group", "Delete this group and all its lectures?"):
-                storage.delete_group(self._course_id, self._group.id)
-                self.refresh_needed.emit()
+                _forget_collapsed(self._course_id, self._group.id)
+                _run_storage(
+                    storage.delete_group, self._course_id, self._group.id,
+                    done=self.refresh_needed,
+                )
 
 
 class _CourseSection(QWidget):
     """A course header with its lecture list and groups."""
 
     lecture_clicked = Signal(str, str, str)  # course_id, lecture_id, group_id
-    refresh_needed = Signal()
+    course_changed = Signal(str)  # course_id — only this course's contents changed
+    course_removed = Signal(str)  # course_id
 
     def __init__(
         self,
@@ -539,21 +1009,23 @@ class _CourseSection(QWidget):
         lectures: list[Session],
         groups_data: list[tuple[Group, list[Session]]],
         color: str,
+        drop_indicator: _DropIndicator,
         parent=None,
     ):
         super().__init__(parent)
         self._course_id = course_id
+        self._mime_payload = course_id.encode()
         self._course_name = course_name
         self._color = color
+        self._drop_indicator = drop_indicator
         self._lectures_by_id = {s.id: s for s in lectures}
-        self._lecture_ids = [s.id for s in lectures]
+        self.setMouseTracking(False)
+        self.setTabletTracking(False)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._context_menu)
         self.setAcceptDrops(True)
 
-        self.setStyleSheet(
-            f"_CourseSection {{ border-left: 3px solid {color}; padding-left: 8px; }}"
-        )
+        self.setProperty("accent", color)
 
         self._body_layout = QVBoxLayout(self)
         self._body_layout.setContentsMargins(0, 0, 0, 12)
@@ -564,69 +1036,130 @@ class _CourseSection(QWidget):
         header_layout = QHBoxLayout(self._header)
         header_layout.setContentsMargins(0, 0, 0, 0)
 
-        name_label = QLabel(course_name)
-        base = cfg.font_size
-        name_label.setStyleSheet(f"font-weight: bold; color: {color}; font-size: {base + 4}pt;")
-        name_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        name_label.setMinimumWidth(0)
-        header_layout.addWidget(name_label)
+        self._name_label = QLabel(course_name)
+        self._name_label.setStyleSheet(_course_name_qss(cfg.font_size, color))
+        self._name_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self._name_label.setMinimumWidth(0)
+        header_layout.addWidget(self._name_label)
 
         add_group_btn = QPushButton("+ group")
-        add_group_btn.setStyleSheet(
-            "QPushButton { padding: 3px 10px; color: #585b70; background: transparent; }"
-            f"QPushButton:hover {{ color: {color}; }}"
-        )
-        add_group_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        add_group_btn.setProperty("role", "add")
+        add_group_btn.setProperty("accent", color)
+        add_group_btn.setCursor(_hand_cursor())
         add_group_btn.clicked.connect(self._add_group)
         header_layout.addWidget(add_group_btn)
 
         add_btn = QPushButton("+ lecture")
-        add_btn.setStyleSheet(
-            "QPushButton { padding: 3px 10px; color: #585b70; background: transparent; }"
-            f"QPushButton:hover {{ color: {color}; }}"
-        )
-        add_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        add_btn.setProperty("role", "add")
+        add_btn.setProperty("accent", color)
+        add_btn.setCursor(_hand_cursor())
         add_btn.clicked.connect(self._add_lecture)
         header_layout.addWidget(add_btn)
 
         self._body_layout.addWidget(self._header)
 
-        # Drop indicator
-        self._drop_indicator = _DropIndicator(self)
+        # Hint shown while the course has neither lectures nor groups
+        self._empty_hint = QLabel("No lectures yet")
+        self._empty_hint.setStyleSheet("color: #6c7086; font-style: italic;")
+        self._empty_hint.setContentsMargins(28, 4, 0, 4)
+        self._empty_hint.setVisible(not lectures and not groups_data)
+        self._body_layout.addWidget(self._empty_hint)
 
-        # Ungrouped lecture rows
-        self._rows: list[_LectureRow] = []
-        if not lectures and not groups_data:
-            hint = QLabel("No lectures yet")
-            hint.setStyleSheet("color: #6c7086; font-style: italic;")
-            hint.setContentsMargins(28, 4, 0, 4)
-            self._body_layout.addWidget(hint)
-        else:
-            for session in lectures:
-                row = _LectureRow(session, color, group_id="", parent=self)
-                sid = session.id
-                row.clicked.connect(lambda s=sid: self.lecture_clicked.emit(self._course_id, s, ""))
-                row.rename_requested.connect(lambda s=sid: self._rename_lecture(s))
-                row.delete_requested.connect(lambda s=sid: self._delete_lecture(s))
-                self._body_layout.addWidget(row)
-                self._rows.append(row)
+        # Ungrouped lecture rows — placeholders until scrolled into view
+        self._rows: dict[str, _LectureRow | _RowPlaceholder] = {}  # by lecture id, in display order
+        for session in lectures:
+            placeholder = self._make_placeholder(session)
+            self._body_layout.addWidget(placeholder)
+            self._rows[session.id] = placeholder
 
         # Group sections
         self._group_sections: list[_GroupSection] = []
         for group, group_lectures in groups_data:
-            gs = _GroupSection(course_id, group, group_lectures, color, self)
-            gs.lecture_clicked.connect(self.lecture_clicked.emit)
-            gs.refresh_needed.connect(self.refresh_needed.emit)
+            gs = self._make_group_section(group, group_lectures)
             self._body_layout.addWidget(gs)
             self._group_sections.append(gs)
 
         # Drag state for course header
         self._drag_start: QPoint | None = None
+        self._drag_snapshot: QPixmap | None = None
+        self._row_centers: list[int] | None = None  # cached per drag
+        self._group_centers: list[int] | None = None
+        self._last_drop: tuple[str, int] | None = None  # (mime kind, index) under the indicator
 
     @property
     def course_id(self) -> str:
         return self._course_id
 
+    @Slot()
+    def _emit_changed(self):
+        self.course_changed.emit(self._course_id)
+
+    # -- Incremental updates -------------------------------------------------
+
+    def update_data(self, snap: storage.CourseSnapshot):
+        """Apply fresh data from storage, touching only widgets that changed."""
+        with _updates_paused(self):
+            self._apply_snapshot(snap)
+
+    def _apply_snapshot(self, snap: storage.CourseSnapshot):
+        self._course_name = snap.course.name
+        if self._name_label.text() != snap.course.name:
+            self._name_label.setText(snap.course.name)
+
+        self._lectures_by_id = {s.id: s for s in snap.lectures}
+        rows_anchor = self._body_layout.indexOf(self._empty_hint) + 1
+        self._rows, _ = _sync_rows(
+            self._body_layout, self._rows, snap.lectures, self._make_placeholder, rows_anchor,
+        )
+
+        existing = {gs.group_id: gs for gs in self._group_sections}
+        group_sections = []
+        for group, lectures in snap.groups:
+            gs = existing.pop(group.id, None)
+            if gs is None:
+                gs = self._make_group_section(group, lectures)
+            else:
+                gs.update_group(group, lectures)
+            group_sections.append(gs)
+        for gs in existing.values():
+            _discard_widget(self._body_layout, gs)
+        _place_widgets(self._body_layout, group_sections, rows_anchor + len(self._rows))
+        self._group_sections = group_sections
+
+        self._empty_hint.setVisible(not self._rows and not self._group_sections)
+        self._drag_snapshot = None
+
+    def _make_group_section(self, group: Group, lectures: list[Session]) -> _GroupSection:
+        gs = _GroupSection(self._course_id, group, lectures, self._color, self._drop_indicator, self)
+        gs.lecture_clicked.connect(self.lecture_clicked)
+        gs.refresh_needed.connect(self._emit_changed)
+        return gs
+
+    # -- Lazy rows -----------------------------------------------------------
+
+    def _make_placeholder(self, session: Session) -> _RowPlaceholder:
+        return _RowPlaceholder(session, _row_height_hint(), self)
+
+    def _make_row(self, session: Session) -> _LectureRow:
+        row = _LectureRow(session, self._color, group_id="", parent=self)
+        row.clicked.connect(self._emit_lecture_clicked)
+        row.rename_requested.connect(self._rename_lecture)
+        row.delete_requested.connect(self._delete_lecture)
+        return row
+
+    @Slot(str)
+    def _emit_lecture_clicked(self, lecture_id: str):
+        self.lecture_clicked.emit(self._course_id, lecture_id, "")
+
+    def materialize_visible(self, visible: QRect):
+        """Swap placeholders intersecting *visible* (section coordinates) for real rows."""
+        if _materialize_rows(self._body_layout, self._rows, self._make_row, visible):
+            self._drag_snapshot = None
+        for gs in self._group_sections:
+            geo = gs.geometry()
+            if geo.intersects(visible):
+                gs.materialize_visible(visible.translated(-geo.x(), -geo.y()))
+
     # -- Course header drag --------------------------------------------------
 
     def mousePressEvent(self, event):
@@ -640,17 +1173,15 @@ class _CourseSection(QWidget):
     def mouseMoveEvent(self, event):
         if self._drag_start is None:
             return
-        if (event.position().toPoint() - self._drag_start).manhattanLength() < QApplication.startDragDistance():
+        if (event.position().toPoint() - self._drag_start).manhattanLength() < _start_drag_distance():
             return
         drag = QDrag(self)
         mime = QMimeData()
-        mime.setData("application/x-gloss-course", self._course_id.encode())
+        mime.setData(_COURSE_MIME, self._mime_payload)
         drag.setMimeData(mime)
-        pixmap = self.grab()
-        painter = QPainter(pixmap)
-        painter.fillRect(pixmap.rect(), QColor(0, 0, 0, 80))
-        painter.end()
-        drag.setPixmap(pixmap)
+        if self._drag_snapshot is None:
+            self._drag_snapshot = _drag_pixmap(self)
+        drag.setPixmap(self._drag_snapshot)
         drag.exec(Qt.DropAction.MoveAction)
         self._drag_start = None
 
@@ -658,48 +1189,58 @@ class _CourseSection(QWidget):
         self._drag_start = None
         super().mouseReleaseEvent(event)
 
+    def resizeEvent(self, event):
+        self._drag_snapshot = None
+        super().resizeEvent(event)
+
     # -- Drop target ---------------------------------------------------------
 
     def _drop_index(self, pos: QPoint) -> int:
         """Return the insertion index for an ungrouped lecture drop."""
-        for i, row in enumerate(self._rows):
-            row_rect = row.geometry()
-            if pos.y() < row_rect.center().y():
-                return i
-        return len(self._rows)
+        if self._row_centers is None:
+            self._row_centers = _center_ys(self._rows.values())
+        return bisect.bisect_right(self._row_centers, pos.y())
 
     def _group_drop_index(self, pos: QPoint) -> int:
         """Return the insertion index for a group drop."""
-        for i, gs in enumerate(self._group_sections):
-            gs_rect = gs.geometry()
-            if pos.y() < gs_rect.center().y():
-                return i
-        return len(self._group_sections)
+        if self._group_centers is None:
+            self._group_centers = _center_ys(self._group_sections)
+        return bisect.bisect_right(self._group_centers, pos.y())
+
+    def _reset_drop_centers(self):
+        self._row_centers = None
+        self._group_centers = None
+        self._last_drop = None
 
     def dragEnterEvent(self, event):
-        mime = event.mimeData()
-        if mime.hasFormat("application/x-gloss-lecture") or mime.hasFormat("application/x-gloss-group"):
+        # Row and group geometry is fixed for the duration of a drag
+        self._reset_drop_centers()
+        if _drag_kind(event) in (_LECTURE_MIME, _GROUP_MIME):
             event.acceptProposedAction()
 
     def dragMoveEvent(self, event):
-        mime = event.mimeData()
-        if mime.hasFormat("application/x-gloss-lecture"):
+        kind = _drag_kind(event)
+        if kind == _LECTURE_MIME:
             event.acceptProposedAction()
             idx = self._drop_index(event.position().toPoint())
-            if self._rows:
-                if idx < len(self._rows):
-                    ref = self._rows[idx]
-                    y = ref.geometry().top() - 2
+            if self._last_drop == (kind, idx):
+                return
+            self._last_drop = (kind, idx)
+            rows = list(self._rows.values())
+            if rows:
+                if idx < len(rows):
+                    y = rows[idx].geometry().top() - 2
                 else:
-                    ref = self._rows[-1]
-                    y = ref.geometry().bottom() + 1
+                    y = rows[-1].geometry().bottom() + 1
             else:
                 y = self._header.geometry().bottom() + 4
-            self._drop_indicator.setGeometry(28, y, self.width() - 40, 3)
-            self._drop_indicator.show()
-        elif mime.hasFormat("application/x-gloss-group"):
+            self._drop_indicator.show_at(self, 28, y, self.width() - 40)
+        elif kind == _GROUP_MIME:
             event.acceptProposedAction()
             idx = self._group_drop_index(event.position().toPoint())
+            if self._last_drop == (kind, idx):
+                return
+            self._last_drop = (kind, idx)
             if self._group_sections:
                 if idx < len(self._group_sections):
                     ref = self._group_sections[idx]
@@ -708,136 +1249,126 @@ class _CourseSection(QWidget):
                     ref = self._group_sections[-1]
                     y = ref.geometry().bottom() + 1
             elif self._rows:
-                ref = self._rows[-1]
-                y = ref.geometry().bottom() + 4
+                y = list(self._rows.values())[-1].geometry().bottom() + 4
             else:
                 y = self._header.geometry().bottom() + 4
-            self._drop_indicator.setGeometry(28, y, self.width() - 40, 3)
-            self._drop_indicator.show()
+            self._drop_indicator.show_at(self, 28, y, self.width() - 40)
 
     def dragLeaveEvent(self, event):
         self._drop_indicator.hide()
+        self._reset_drop_centers()
 
     def dropEvent(self, event):
         self._drop_indicator.hide()
+        self._drop_at(event)
+        self._reset_drop_centers()
+
+    def _drop_at(self, event):
         mime = event.mimeData()
+        kind = _drag_kind(event)
 
-        if mime.hasFormat("application/x-gloss-lecture"):
+        if kind == _LECTURE_MIME:
             lecture_id, source_group = _decode_lecture_mime(
-                bytes(mime.data("application/x-gloss-lecture"))
+                bytes(mime.data(_LECTURE_MIME))
             )
             if source_group:
                 # Moving from a group to ungrouped
-                storage.move_lecture(
+                _run_storage(
+                    storage.move_lecture,
                     self._course_id, lecture_id,
                     from_group_id=source_group,
                     to_group_id=None,
+                    done=self._emit_changed,
                 )
                 event.acceptProposedAction()
-                self.refresh_needed.emit()
                 return
             # Same-area reorder (ungrouped)
-            if lecture_id not in self._lecture_ids:
+            if lecture_id not in self._rows:
                 return
             idx = self._drop_index(event.position().toPoint())
-            ids = [lid for lid in self._lecture_ids if lid != lecture_id]
+            ids = [lid for lid in self._rows if lid != lecture_id]
             ids.insert(idx, lecture_id)
-            storage.reorder_lectures(self._course_id, ids)
+            # Widgets are already in their new order; just persist it
+            self._rows = _reorder_widgets(self._body_layout, self._rows, ids)
+            _run_storage(storage.reorder_lectures, self._course_id, ids)
             event.acceptProposedAction()
-            self.refresh_needed.emit()
 
-        elif mime.hasFormat("application/x-gloss-group"):
-            group_id = bytes(mime.data("application/x-gloss-group")).decode()
-            current_ids = [gs.group_id for gs in self._group_sections]
-            if group_id not in current_ids:
+        elif kind == _GROUP_MIME:
+            group_id = bytes(mime.data(_GROUP_MIME)).decode()
+            current = {gs.group_id: gs for gs in self._group_sections}
+            if group_id not in current:
                 return
             idx = self._group_drop_index(event.position().toPoint())
-            ids = [gid for gid in current_ids if gid != group_id]
+            ids = [gid for gid in current if gid != group_id]
             ids.insert(idx, group_id)
-            storage.reorder_groups(self._course_id, ids)
+            self._group_sections = list(_reorder_widgets(self._body_layout, current, ids).values())
+            _run_storage(storage.reorder_groups, self._course_id, ids)
             event.acceptProposedAction()
-            self.refresh_needed.emit()
 
     # -- Lecture CRUD --------------------------------------------------------
 
+    @Slot()
     def _add_lecture(self):
-        prefill = ""
-        while True:
-            title, ok = _get_text(self,"New Lecture", "Lecture title:", text=prefill)
-            if not ok or not title.strip():
-                return
-            if len(title.strip()) > MAX_NAME_LENGTH:
-                _warning(self, "Title too long", f"Title must be {MAX_NAME_LENGTH} characters or fewer.")
-                prefill = title
-                continue
-            break
-        pdf_path, _ = QFileDialog.getOpenFileName(
-            self, "Select lecture PDF", "", "PDF Files (*.pdf)"
-        )
+        title = _prompt_name(self, "New Lecture", "Lecture title:", noun="Title")
+        if title is None:
+            return
+        _pick_pdf(self, partial(self._create_lecture, title))
+
+    def _create_lecture(self, title: str, pdf_path: str):
         if not pdf_path:
             return
-        storage.create_lecture(self._course_id, title.strip(), pdf_path)
-        self.refresh_needed.emit()
+        _run_storage(
+            storage.create_lecture, self._course_id, title, pdf_path,
+            done=self._emit_changed,
+        )
 
+    @Slot(str)
     def _rename_lecture(self, lecture_id: str):
         existing = self._lectures_by_id[lecture_id].title if lecture_id in self._lectures_by_id else ""
-        prefill = existing
-        while True:
-            new_title, ok = _get_text(self,"Rename Lecture", "New title:", text=prefill)
-            if not ok or not new_title.strip():
-                return
-            if len(new_title.strip()) > MAX_NAME_LENGTH:
-                _warning(self, "Title too long", f"Title must be {MAX_NAME_LENGTH} characters or fewer.")
-                prefill = new_title
-                continue
-            break
-        storage.rename_lecture(self._course_id, lecture_id, new_title.strip())
-        self.refresh_needed.emit()
+        new_title = _prompt_name(self, "Rename Lecture", "New title:", prefill=existing, noun="Title")
+        if new_title is None:
+            return
+        # Only the label changes — patch it directly rather than reloading the course
+        _rename_row(self._rows, self._lectures_by_id, lecture_id, new_title)
+        self._drag_snapshot = None
+        _run_storage(storage.rename_lecture, self._course_id, lecture_id, new_title)
 
+    @Slot(str)
     def _delete_lecture(self, lecture_id: str):
         if _confirm(self, "Delete lecture", "Delete this lecture and all its notes?"):
-            storage.delete_lecture(self._course_id, lecture_id)
-            self.refresh_needed.emit()
+            _run_storage(
+                storage.delete_lecture, self._course_id, lecture_id,
+                done=self._emit_changed,
+            )
 
     # -- Group CRUD ----------------------------------------------------------
 
+    @Slot()
     def _add_group(self):
-        prefill = ""
-        while True:
-            name, ok = _get_text(self, "New Group", "Group name:", text=prefill)
-            if not ok or not name.strip():
-                return
-            if len(name.strip()) > MAX_NAME_LENGTH:
-                _warning(self, "Name too long", f"Name must be {MAX_NAME_LENGTH} characters or fewer.")
-                prefill = name
-                continue
-            break
-        storage.create_group(self._course_id, name.strip())
-        self.refresh_needed.emit()
-
-    def _context_menu(self, pos):
+        name = _prompt_name(self, "New Group", "Group name:")
+        if name is None:
+            return
+        _run_storage(storage.create_group, self._course_id, name, done=self._emit_changed)
+
+    @Slot(QPoint)
+    def _context_menu(self, pos: QPoint):
         menu = QMenu(self)
-        menu.setStyleSheet(_MENU_QSS)
         rename_action = menu.addAction("Rename course")
         delete_action = menu.addAction("Delete course")
         action = menu.exec(self.mapToGlobal(pos))
         if action == rename_action:
-            prefill = self._course_name
-            while True:
-                new_name, ok = _get_text(self,"Rename Course", "New name:", text=prefill)
-                if not ok or not new_name.strip():
-                    break
-                if len(new_name.strip()) > MAX_NAME_LENGTH:
-                    _warning(self, "Name too long", f"Name must be {MAX_NAME_LENGTH} characters or fewer.")
-                    prefill = new_name
-                    continue
-                storage.rename_course(self._course_id, new_name.strip())
-                self.refresh_needed.emit()
-                break
+            new_name = _prompt_name(self, "Rename Course", "New name:", prefill=self._course_name)
+            if new_name is not None:
+                # Only the header changes — patch it rather than reloading every course
+                self._course_name = new_name
+                self._name_label.setText(new_name)
+                self._drag_snapshot = None
+                _run_storage(storage.rename_course, self._course_id, new_name)
         elif action == delete_action:
             if _confirm(self, "Delete course", "Delete this course and all its lectures?"):
-                storage.delete_course(self._course_id)
-                self.refresh_needed.emit()
+                _forget_collapsed(self._course_id)
+                _run_storage(storage.delete_course, self._course_id)
+                self.course_removed.emit(self._course_id)
 
 
 _SETTINGS_QSS = """
@@ -881,6 +1412,19 @@ _MODEL_BTN_ON_BLUE = (
     "QPushButton:hover { border-color: #89b4fa; }"
 )
 
+_HEADER_QSS = "font-size: 12pt; font-weight: bold; color: {color};"
+_HEADER_OFF = _HEADER_QSS.format(color="#45475a")
+_HEADER_ON = _HEADER_QSS.format(color="#fab387")
+_HEADER_ON_GREEN = _HEADER_QSS.format(color="#a6e3a1")
+_HEADER_ON_BLUE = _HEADER_QSS.format(color="#89b4fa")
+
+
+def _set_qss(widget: QWidget, qss: str):
+    """Apply *qss* only if it differs — every setStyleSheet() re-polishes the widget."""
+    if widget.styleSheet() != qss:
+        widget.setStyleSheet(qss)
+
+
 class _ProviderHeader(QLabel):
     """Clickable section header label — avoids QPushButton sizing quirks on macOS."""
 
@@ -888,16 +1432,60 @@ class _ProviderHeader(QLabel):
 
     def __init__(self, text: str, parent=None):
         super().__init__(text, parent)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.setStyleSheet("font-size: 12pt; font-weight: bold;")
+        self.setCursor(_hand_cursor())
+        self.setStyleSheet(_HEADER_OFF)
 
     def mousePressEvent(self, event):
         self.clicked.emit()
         super().mousePressEvent(event)
 
 
+class _ProviderSpec(NamedTuple):
+    id: str
+    label: str
+    key_placeholder: str
+    load_key: Callable[[], str]
+    save_key: Callable[[str], None]
+    load_model: Callable[[], str]
+    save_model: Callable[[str], None]
+    models: list[tuple[str, str, str]]
+    btn_on_qss: str
+    header_on_qss: str
+
+
+_PROVIDERS = [
+    _ProviderSpec(
+        "anthropic", "Anthropic", "sk-ant-...",
+        load_api_key, save_api_key, load_model, save_model,
+        AVAILABLE_MODELS, _MODEL_BTN_ON, _HEADER_ON,
+    ),
+    _ProviderSpec(
+        "openai", "OpenAI", "sk-...",
+        load_openai_api_key, save_openai_api_key, load_openai_model, save_openai_model,
+        AVAILABLE_OPENAI_MODELS, _MODEL_BTN_ON_GREEN, _HEADER_ON_GREEN,
+    ),
+    _ProviderSpec(
+        "gemini", "Google", "AIza...",
+        load_gemini_api_key, save_gemini_api_key, load_gemini_model, save_gemini_model,
+        AVAILABLE_GEMINI_MODELS, _MODEL_BTN_ON_BLUE, _HEADER_ON_BLUE,
+    ),
+]
+
+
+@dataclass
+class _ProviderUI:
+    """Widgets and state for one provider section of the settings dialog."""
+
+    spec: _ProviderSpec
+    header: _ProviderHeader
+    selected_model: str = ""
+    section: QWidget | None = None  # built on first activation
+    key: QLineEdit | None = None
+    model_buttons: list[tuple[str, QPushButton]] = field(default_factory=list)
+
+
 class _SettingsDialog(QDialog):
-    """Settings dialog — Anthropic and OpenAI provider configuration."""
+    """Settings dialog — Anthropic, OpenAI and Gemini provider configuration."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -914,142 +1502,19 @@ class _SettingsDialog(QDialog):
         layout.addWidget(title)
         layout.addSpacing(4)
 
-        self._active_provider = load_provider()
-        self._selected_anthropic_model = load_model()
-        self._selected_openai_model = load_openai_model()
-        self._selected_gemini_model = load_gemini_model()
-        self._anthropic_model_buttons: list[tuple[str, QPushButton]] = []
-        self._openai_model_buttons: list[tuple[str, QPushButton]] = []
-        self._gemini_model_buttons: list[tuple[str, QPushButton]] = []
-
-        # ── Anthropic section ──────────────────────────────────────────────
-        self._anthropic_header = _ProviderHeader("Anthropic")
-        self._anthropic_header.clicked.connect(lambda: self._set_provider("anthropic"))
-        layout.addWidget(self._anthropic_header)
-
-        key_label_a = QLabel("API Key")
-        key_label_a.setStyleSheet("color: #a6adc8;")
-        layout.addWidget(key_label_a)
-
-        key_row_a = QHBoxLayout()
-        key_row_a.setSpacing(6)
-        self._anthropic_key = QLineEdit()
-        self._anthropic_key.setEchoMode(QLineEdit.EchoMode.Password)
-        self._anthropic_key.setPlaceholderText("sk-ant-...")
-        self._anthropic_key.setText(load_api_key())
-        self._anthropic_key.setStyleSheet(_INPUT_QSS)
-        key_row_a.addWidget(self._anthropic_key)
-        show_a = QCheckBox("Show")
-        show_a.setStyleSheet("color: #585b70;")
-        show_a.toggled.connect(
-            lambda on: self._anthropic_key.setEchoMode(
-                QLineEdit.EchoMode.Normal if on else QLineEdit.EchoMode.Password
-            )
-        )
-        key_row_a.addWidget(show_a)
-        layout.addLayout(key_row_a)
+        self._active_provider = ""
 
-        model_label_a = QLabel("Model")
-        model_label_a.setStyleSheet("color: #a6adc8;")
-        layout.addWidget(model_label_a)
-
-        model_group_a = QVBoxLayout()
-        model_group_a.setSpacing(6)
-        for model_id, display_name, description in AVAILABLE_MODELS:
-            btn = QPushButton(f"{display_name}  —  {description}")
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.clicked.connect(lambda _, mid=model_id: self._select_anthropic_model(mid))
-            self._anthropic_model_buttons.append((model_id, btn))
-            model_group_a.addWidget(btn)
-        layout.addLayout(model_group_a)
-
-        layout.addSpacing(8)
-
-        # ── OpenAI section ─────────────────────────────────────────────────
-        self._openai_header = _ProviderHeader("OpenAI")
-        self._openai_header.clicked.connect(lambda: self._set_provider("openai"))
-        layout.addWidget(self._openai_header)
-
-        key_label_o = QLabel("API Key")
-        key_label_o.setStyleSheet("color: #a6adc8;")
-        layout.addWidget(key_label_o)
-
-        key_row_o = QHBoxLayout()
-        key_row_o.setSpacing(6)
-        self._openai_key = QLineEdit()
-        self._openai_key.setEchoMode(QLineEdit.EchoMode.Password)
-        self._openai_key.setPlaceholderText("sk-...")
-        self._openai_key.setText(load_openai_api_key())
-        self._openai_key.setStyleSheet(_INPUT_QSS)
-        key_row_o.addWidget(self._openai_key)
-        show_o = QCheckBox("Show")
-        show_o.setStyleSheet("color: #585b70;")
-        show_o.toggled.connect(
-            lambda on: self._openai_key.setEchoMode(
-                QLineEdit.EchoMode.Normal if on else QLineEdit.EchoMode.Password
-            )
-        )
-        key_row_o.addWidget(show_o)
-        layout.addLayout(key_row_o)
-
-        model_label_o = QLabel("Model")
-        model_label_o.setStyleSheet("color: #a6adc8;")
-        layout.addWidget(model_label_o)
-
-        model_group_o = QVBoxLayout()
-        model_group_o.setSpacing(6)
-        for model_id, display_name, description in AVAILABLE_OPENAI_MODELS:
-            btn = QPushButton(f"{display_name}  —  {description}")
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.clicked.connect(lambda _, mid=model_id: self._select_openai_model(mid))
-            self._openai_model_buttons.append((model_id, btn))
-            model_group_o.addWidget(btn)
-        layout.addLayout(model_group_o)
-
-        layout.addSpacing(8)
-
-        # ── Gemini section ─────────────────────────────────────────────────
-        self._gemini_header = _ProviderHeader("Google")
-        self._gemini_header.clicked.connect(lambda: self._set_provider("gemini"))
-        layout.addWidget(self._gemini_header)
-
-        key_label_g = QLabel("API Key")
-        key_label_g.setStyleSheet("color: #a6adc8;")
-        layout.addWidget(key_label_g)
-
-        key_row_g = QHBoxLayout()
-        key_row_g.setSpacing(6)
-        self._gemini_key = QLineEdit()
-        self._gemini_key.setEchoMode(QLineEdit.EchoMode.Password)
-        self._gemini_key.setPlaceholderText("AIza...")
-        self._gemini_key.setText(load_gemini_api_key())
-        self._gemini_key.setStyleSheet(_INPUT_QSS)
-        key_row_g.addWidget(self._gemini_key)
-        show_g = QCheckBox("Show")
-        show_g.setStyleSheet("color: #585b70;")
-        show_g.toggled.connect(
-            lambda on: self._gemini_key.setEchoMode(
-                QLineEdit.EchoMode.Normal if on else QLineEdit.EchoMode.Password
-            )
-        )
-        key_row_g.addWidget(show_g)
-        layout.addLayout(key_row_g)
-
-        model_label_g = QLabel("Model")
-        model_label_g.setStyleSheet("color: #a6adc8;")
-        layout.addWidget(model_label_g)
-
-        model_group_g = QVBoxLayout()
-        model_group_g.setSpacing(6)
-        for model_id, display_name, description in AVAILABLE_GEMINI_MODELS:
-            btn = QPushButton(f"{display_name}  —  {description}")
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.clicked.connect(lambda _, mid=model_id: self._select_gemini_model(mid))
-            self._gemini_model_buttons.append((model_id, btn))
-            model_group_g.addWidget(btn)
-        layout.addLayout(model_group_g)
-
-        layout.addSpacing(12)
+        # ── Provider sections ──────────────────────────────────────────────
+        # Only headers are built up front; the key field and model list of a
+        # provider are built the first time it becomes active.
+        self._providers: dict[str, _ProviderUI] = {}
+        self._key_field_provider: dict[QLineEdit, str] = {}  # event-filter dispatch
+        for spec in _PROVIDERS:
+            header = _ProviderHeader(spec.label)
+            header.clicked.connect(lambda p=spec.id: self._set_provider(p))
+            layout.addWidget(header)
+            layout.addSpacing(12 if spec is _PROVIDERS[-1] else 8)
+            self._providers[spec.id] = _ProviderUI(spec, header)
 
         # ── Save / Cancel ──────────────────────────────────────────────────
         btn_row = QHBoxLayout()
@@ -1073,12 +1538,78 @@ class _SettingsDialog(QDialog):
 
         layout.addLayout(btn_row)
 
-        # Install event filters so clicking anywhere in a section activates it
-        self._anthropic_key.installEventFilter(self)
-        self._openai_key.installEventFilter(self)
-        self._gemini_key.installEventFilter(self)
-
         # Initial render
+        self.reload()
+
+    def _build_provider_section(self, ui: _ProviderUI) -> QWidget:
+        """Key field + model buttons for one provider, inserted below its header."""
+        spec = ui.spec
+
+        section = QWidget()
+        section_layout = QVBoxLayout(section)
+        section_layout.setContentsMargins(0, 0, 0, 0)
+        section_layout.setSpacing(12)
+
+        key_label = QLabel("API Key")
+        key_label.setStyleSheet("color: #a6adc8;")
+        section_layout.addWidget(key_label)
+
+        key_row = QHBoxLayout()
+        key_row.setSpacing(6)
+        key = QLineEdit()
+        key.setEchoMode(QLineEdit.EchoMode.Password)
+        key.setPlaceholderText(spec.key_placeholder)
+        key.setText(spec.load_key())
+        key.setStyleSheet(_INPUT_QSS)
+        # Clicking into the key field activates the section
+        key.installEventFilter(self)
+        key_row.addWidget(key)
+        show = QCheckBox("Show")
+        show.setStyleSheet("color: #585b70;")
+        show.toggled.connect(
+            lambda on: key.setEchoMode(
+                QLineEdit.EchoMode.Normal if on else QLineEdit.EchoMode.Password
+            )
+        )
+        key_row.addWidget(show)
+        section_layout.addLayout(key_row)
+
+        model_label = QLabel("Model")
+        model_label.setStyleSheet("color: #a6adc8;")
+        section_layout.addWidget(model_label)
+
+        model_group = QVBoxLayout()
+        model_group.setSpacing(6)
+        for model_id, display_name, description in spec.models:
+            btn = QPushButton(f"{display_name}  —  {description}")
+            btn.setCursor(_hand_cursor())
+            btn.clicked.connect(lambda _, p=spec.id, mid=model_id: self._select_model(p, mid))
+            ui.model_buttons.append((model_id, btn))
+            model_group.addWidget(btn)
+        section_layout.addLayout(model_group)
+
+        ui.key = key
+        self._key_field_provider[key] = spec.id
+        layout = self.layout()
+        layout.insertWidget(layout.indexOf(ui.header) + 1, section)
+        return section
+
+    def _ensure_section(self, provider: str) -> bool:
+        """Build *provider*'s section if needed. Returns True if it was just built."""
+        ui = self._providers.get(provider)
+        if ui is None or ui.section is not None:
+            return False
+        ui.section = self._build_provider_section(ui)
+        return True
+
+    def reload(self):
+        """Re-read saved settings into the existing widgets."""
+        self._active_provider = load_provider()
+        for ui in self._providers.values():
+            ui.selected_model = ui.spec.load_model()
+            if ui.key is not None:
+                ui.key.setText(ui.spec.load_key())
+        self._ensure_section(self._active_provider)
         self._refresh_ui()
 
     def showEvent(self, event):
@@ -1092,81 +1623,80 @@ class _SettingsDialog(QDialog):
 
     def eventFilter(self, obj, event):
         if event.type() == QEvent.Type.MouseButtonPress:
-            if obj is self._anthropic_key:
-                self._set_provider("anthropic")
-            elif obj is self._openai_key:
-                self._set_provider("openai")
-            elif obj is self._gemini_key:
-                self._set_provider("gemini")
+            provider = self._key_field_provider.get(obj)
+            if provider:
+                self._set_provider(provider)
         return super().eventFilter(obj, event)
 
     # ── Provider selection ─────────────────────────────────────────────────
 
+    @Slot(str)
     def _set_provider(self, provider: str):
         self._active_provider = provider
+        if self._ensure_section(provider) and self.isVisible():
+            QTimer.singleShot(0, self._fix_layout)
         self._refresh_ui()
 
-    def _select_anthropic_model(self, model_id: str):
-        self._selected_anthropic_model = model_id
-        self._set_provider("anthropic")
+    @Slot(str, str)
+    def _select_model(self, provider: str, model_id: str):
+        self._providers[provider].selected_model = model_id
+        self._set_provider(provider)
 
-    def _select_openai_model(self, model_id: str):
-        self._selected_openai_model = model_id
-        self._set_provider("openai")
+    def _refresh_ui(self):
+        for provider, ui in self._providers.items():
+            active = provider == self._active_provider
+            _set_qss(ui.header, ui.spec.header_on_qss if active else _HEADER_OFF)
+            for mid, btn in ui.model_buttons:
+                on = active and mid == ui.selected_model
+                _set_qss(btn, ui.spec.btn_on_qss if on else _MODEL_BTN_OFF)
+
+    @Slot()
+    def _save(self):
+        for ui in self._providers.values():
+            # Sections that were never opened keep their saved keys untouched
+            if ui.key is not None:
+                ui.spec.save_key(ui.key.text().strip())
+            ui.spec.save_model(ui.selected_model)
+        save_provider(self._active_provider)
+        self.accept()
 
-    def _select_gemini_model(self, model_id: str):
-        self._selected_gemini_model = model_id
-        self._set_provider("gemini")
 
-    def _refresh_ui(self):
-        anthropic_active = self._active_provider == "anthropic"
-        openai_active = self._active_provider == "openai"
-        gemini_active = self._active_provider == "gemini"
-
-        # Section headers
-        self._anthropic_header.setStyleSheet(
-            "font-size: 12pt; font-weight: bold; color: "
-            + ("#fab387;" if anthropic_active else "#45475a;")
-        )
-        self._openai_header.setStyleSheet(
-            "font-size: 12pt; font-weight: bold; color: "
-            + ("#a6e3a1;" if openai_active else "#45475a;")
-        )
-        self._gemini_header.setStyleSheet(
-            "font-size: 12pt; font-weight: bold; color: "
-            + ("#89b4fa;" if gemini_active else "#45475a;")
-        )
+class _CourseDropContainer(QWidget):
+    """Scroll-area content widget that accepts course drops for its HomeView."""
 
-        # Model buttons — Anthropic (orange when selected)
-        for mid, btn in self._anthropic_model_buttons:
-            if mid == self._selected_anthropic_model and anthropic_active:
-                btn.setStyleSheet(_MODEL_BTN_ON)
-            else:
-                btn.setStyleSheet(_MODEL_BTN_OFF)
+    def __init__(self, host: HomeView):
+        super().__init__()
+        self._host = host
+        self.setAcceptDrops(True)
 
-        # Model buttons — OpenAI (green when selected)
-        for mid, btn in self._openai_model_buttons:
-            if mid == self._selected_openai_model and openai_active:
-                btn.setStyleSheet(_MODEL_BTN_ON_GREEN)
-            else:
-                btn.setStyleSheet(_MODEL_BTN_OFF)
+    def dragEnterEvent(self, event):
+        self._host._course_drag_enter(event)
 
-        # Model buttons — Gemini (blue when selected)
-        for mid, btn in self._gemini_model_buttons:
-            if mid == self._selected_gemini_model and gemini_active:
-                btn.setStyleSheet(_MODEL_BTN_ON_BLUE)
-            else:
-                btn.setStyleSheet(_MODEL_BTN_OFF)
+    def dragMoveEvent(self, event):
+        self._host._course_drag_move(event)
 
-    def _save(self):
-        save_api_key(self._anthropic_key.text().strip())
-        save_model(self._selected_anthropic_model)
-        save_openai_api_key(self._openai_key.text().strip())
-        save_openai_model(self._selected_openai_model)
-        save_gemini_api_key(self._gemini_key.text().strip())
-        save_gemini_model(self._selected_gemini_model)
-        save_provider(self._active_provider)
-        self.accept()
+    def dragLeaveEvent(self, event):
+        self._host._course_drag_leave()
+
+    def dropEvent(self, event):
+        self._host._course_drop(event)
+
+
+_SECTION_OFFSET = 2  # title label + spacing precede the course sections
+
+
+def _snapshot_key(snap: storage.CourseSnapshot, color: str) -> tuple:
+    """Everything a _CourseSection renders — equal keys mean the section can be reused."""
+    def lectures_key(lectures: list[Session]) -> tuple:
+        return tuple((s.id, s.title, s.created_at) for s in lectures)
+
+    return (
+        snap.course.name,
+        color,
+        cfg.font_size,
+        lectures_key(snap.lectures),
+        tuple((g.id, g.name, lectures_key(lectures)) for g, lectures in snap.groups),
+    )
 
 
 class HomeView(QWidget):
@@ -1178,8 +1708,19 @@ class HomeView(QWidget):
         super().__init__(parent)
         self._sections: list[_CourseSection] = []
         self._drop_indicator = _DropIndicator()
+        self._section_keys: dict[str, tuple] = {}
+        self._drop_y_centers: list[int] | None = None  # cached per drag
+        self._last_drop_idx = -1  # index the indicator currently marks
+        self._settings_dialog: _SettingsDialog | None = None
+
+        # refresh() requests made in one event-loop turn collapse into one rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
         self._init_ui()
-        self.refresh()
+        self._do_refresh()
 
     def _init_ui(self):
         outer = QVBoxLayout(self)
@@ -1191,15 +1732,41 @@ class HomeView(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QScrollArea.Shape.NoFrame)
         outer.addWidget(scroll)
+        self._scroll = scroll
+
+        # Lecture rows are built only once they scroll into view
+        vbar = scroll.verticalScrollBar()
+        vbar.valueChanged.connect(self._materialize_visible)
+        vbar.rangeChanged.connect(self._materialize_visible)
 
-        self._container = QWidget()
-        self._container.setAcceptDrops(True)
+        self._container = _CourseDropContainer(self)
+        self._container.setStyleSheet(_HOME_QSS)
         scroll.setWidget(self._container)
 
         self._layout = QVBoxLayout(self._container)
         self._layout.setContentsMargins(32, 32, 32, 32)
         self._layout.setSpacing(8)
 
+        # Static chrome — course sections are inserted between title and button
+        self._title = QLabel("gloss v0")
+        self._layout.addWidget(self._title)
+        self._layout.addSpacing(16)
+
+        add_course_btn = QPushButton("+ New Course")
+        add_course_btn.setStyleSheet(
+            "QPushButton { padding: 8px 16px; color: #585b70; background: transparent; }"
+            "QPushButton:hover { color: #a6e3a1; }"
+        )
+        add_course_btn.setCursor(_hand_cursor())
+        add_course_btn.clicked.connect(self._add_course)
+        self._layout.addWidget(add_course_btn, alignment=Qt.AlignmentFlag.AlignLeft)
+
+        self._layout.addStretch()
+
+        # Drop indicator lives in the container, outside the layout
+        self._drop_indicator.setParent(self._container)
+        self._drop_indicator.hide()
+
         # Bottom bar
         bottom_bar = QWidget()
         bottom_bar.setFixedHeight(44)
@@ -1212,7 +1779,7 @@ class HomeView(QWidget):
             "QPushButton { color: #585b70; background: transparent; padding: 4px 12px; }"
             "QPushButton:hover { color: #cdd6f4; }"
         )
-        settings_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        settings_btn.setCursor(_hand_cursor())
         settings_btn.clicked.connect(self._open_settings)
         bottom_layout.addWidget(settings_btn)
 
@@ -1222,141 +1789,175 @@ class HomeView(QWidget):
             "QPushButton { color: #585b70; background: transparent; padding: 4px 12px; }"
             "QPushButton:hover { color: #89b4fa; }"
         )
-        github_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        github_btn.setCursor(_hand_cursor())
         github_btn.clicked.connect(
             lambda: QDesktopServices.openUrl(QUrl("https://github.com/marcosdiazvazquez/gloss"))
         )
         bottom_layout.addWidget(github_btn)
         outer.addWidget(bottom_bar)
 
+    @Slot()
     def refresh(self):
-        # Clear existing widgets
-        self._sections.clear()
-        while self._layout.count():
-            item = self._layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Title
-        title = QLabel("gloss v0")
-        base = cfg.font_size
-        title.setStyleSheet(f"font-weight: bold; font-size: {base * 3}pt; color: #b4befe;")
-        self._layout.addWidget(title)
-        self._layout.addSpacing(16)
-
-        # Course sections
-        courses = storage.list_courses()
-        for i, course in enumerate(courses):
-            color = COURSE_COLORS[i % len(COURSE_COLORS)]
-            lectures = storage.list_lectures(course.id)
-            groups_data = []
-            for group in storage.list_groups(course.id):
-                group_lectures = storage.list_lectures(course.id, group_id=group.id)
-                groups_data.append((group, group_lectures))
-            section = _CourseSection(course.id, course.name, lectures, groups_data, color, self._container)
-            section.lecture_clicked.connect(self.lecture_opened.emit)
-            section.refresh_needed.connect(self.refresh)
-            self._layout.addWidget(section)
+        """Schedule a rebuild of the course list on the next event-loop turn."""
+        self._refresh_timer.start()
+
+    @Slot()
+    def _do_refresh(self):
+        snapshots = storage.load_home_snapshot()
+        # Hold repaints until every section is in place, then paint once
+        with _updates_paused(self._container):
+            self._apply_snapshots(snapshots)
+        QTimer.singleShot(0, self._materialize_visible)
+
+    def _apply_snapshots(self, snapshots: list[storage.CourseSnapshot]):
+        _set_qss(self._title, _title_qss(cfg.font_size))
+
+        # Diff course sections by id: reuse unchanged ones, rebuild changed ones
+        old_sections = {section.course_id: section for section in self._sections}
+        old_keys = self._section_keys
+        self._sections = []
+        self._section_keys = {}
+        for snap in snapshots:
+            color = course_color(snap.course)
+            key = _snapshot_key(snap, color)
+            section = old_sections.pop(snap.course.id, None)
+            old_key = old_keys.get(snap.course.id)
+            if section is not None and old_key != key:
+                if old_key[1:3] == key[1:3]:
+                    # Same color and font size — patch rows in place
+                    section.update_data(snap)
+                else:
+                    self._discard_section(section)
+                    section = None
+            if section is None:
+                section = self._make_section(snap, color)
             self._sections.append(section)
-
-        # "+ New Course" button
-        add_course_btn = QPushButton("+ New Course")
-        add_course_btn.setStyleSheet(
-            "QPushButton { padding: 8px 16px; color: #585b70; background: transparent; }"
-            "QPushButton:hover { color: #a6e3a1; }"
+            self._section_keys[snap.course.id] = key
+        for section in old_sections.values():
+            self._discard_section(section)
+
+        # Place sections in order, moving only the ones that are out of place
+        _place_widgets(self._layout, self._sections, _SECTION_OFFSET)
+
+    @Slot(str)
+    def _refresh_course(self, course_id: str):
+        """Reload a single course after a change confined to its contents."""
+        snap = storage.load_course_snapshot(course_id)
+        section = next((s for s in self._sections if s.course_id == course_id), None)
+        if snap is None or section is None:
+            self.refresh()
+            return
+        old_key = self._section_keys[course_id]
+        key = _snapshot_key(snap, old_key[1])
+        if old_key != key:
+            section.update_data(snap)
+            self._section_keys[course_id] = key
+            QTimer.singleShot(0, self._materialize_visible)
+
+    def _make_section(self, snap: storage.CourseSnapshot, color: str) -> _CourseSection:
+        section = _CourseSection(
+            snap.course.id, snap.course.name, snap.lectures, snap.groups, color,
+            self._drop_indicator, self._container,
         )
-        add_course_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        add_course_btn.clicked.connect(self._add_course)
-        self._layout.addWidget(add_course_btn, alignment=Qt.AlignmentFlag.AlignLeft)
-
-        self._layout.addStretch()
-
-        # Re-parent drop indicator into the container
-        self._drop_indicator.setParent(self._container)
-        self._drop_indicator.hide()
-
-        # Event filter to intercept course drops on the container
-        self._container.installEventFilter(self)
+        section.lecture_clicked.connect(self.lecture_opened)
+        section.course_changed.connect(self._refresh_course)
+        section.course_removed.connect(self._remove_course)
+        return section
+
+    @Slot(str)
+    def _remove_course(self, course_id: str):
+        """Drop a deleted course's section without reloading the others."""
+        section = next((s for s in self._sections if s.course_id == course_id), None)
+        if section is None:
+            return
+        self._sections.remove(section)
+        self._section_keys.pop(course_id, None)
+        self._discard_section(section)
+        QTimer.singleShot(0, self._materialize_visible)
+
+    def _discard_section(self, section: _CourseSection):
+        _discard_widget(self._layout, section)
+
+    @Slot()
+    def _materialize_visible(self, *_):
+        """Build real lecture rows for every placeholder inside the viewport."""
+        self._layout.activate()
+        viewport = self._scroll.viewport()
+        visible = QRect(0, self._scroll.verticalScrollBar().value(), viewport.width(), viewport.height())
+        for section in self._sections:
+            geo = section.geometry()
+            if geo.intersects(visible):
+                section.materialize_visible(visible.translated(-geo.x(), -geo.y()))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._materialize_visible()
 
     # -- Course drop target --------------------------------------------------
 
     def _course_drop_index(self, pos: QPoint) -> int:
         """Return the insertion index for a course drop at the given position."""
-        for i, section in enumerate(self._sections):
-            section_rect = section.geometry()
-            if pos.y() < section_rect.center().y():
-                return i
-        return len(self._sections)
+        if self._drop_y_centers is None:
+            self._drop_y_centers = _center_ys(self._sections)
+        return bisect.bisect_right(self._drop_y_centers, pos.y())
+
+    def _course_drag_enter(self, event):
+        # Section geometry is fixed for the duration of a drag
+        self._drop_y_centers = None
+        self._last_drop_idx = -1
+        if _drag_kind(event) == _COURSE_MIME:
+            event.acceptProposedAction()
 
-    def eventFilter(self, obj, event):
-        if obj is not self._container:
-            return super().eventFilter(obj, event)
-        if not hasattr(event, "mimeData") or event.type() not in (
-            QEvent.Type.DragEnter, QEvent.Type.DragMove,
-            QEvent.Type.DragLeave, QEvent.Type.Drop,
-        ):
-            return super().eventFilter(obj, event)
-
-        is_course = (
-            event.type() != QEvent.Type.DragLeave
-            and event.mimeData().hasFormat("application/x-gloss-course")
-        )
+    def _course_drag_move(self, event):
+        if _drag_kind(event) != _COURSE_MIME:
+            return
+        event.acceptProposedAction()
+        sections = self._sections
+        if sections:
+            idx = self._course_drop_index(event.position().toPoint())
+            if idx == self._last_drop_idx:
+                return
+            self._last_drop_idx = idx
+            if idx < len(sections):
+                y = sections[idx].geometry().top() - 2
+            else:
+                y = sections[-1].geometry().bottom() + 1
+            self._drop_indicator.show_at(self._container, 32, y, self._container.width() - 64)
 
-        if event.type() == QEvent.Type.DragEnter:
-            if is_course:
-                event.acceptProposedAction()
-                return True
+    def _course_drag_leave(self):
+        self._drop_indicator.hide()
+        self._drop_y_centers = None
+        self._last_drop_idx = -1
 
-        elif event.type() == QEvent.Type.DragMove:
-            if is_course:
+    def _course_drop(self, event):
+        self._drop_indicator.hide()
+        if _drag_kind(event) == _COURSE_MIME:
+            course_id = bytes(event.mimeData().data(_COURSE_MIME)).decode()
+            idx = self._course_drop_index(event.position().toPoint())
+            current = {s.course_id: s for s in self._sections}
+            if course_id in current:
+                new_ids = [cid for cid in current if cid != course_id]
+                new_ids.insert(idx, course_id)
+                self._sections = list(_reorder_widgets(self._layout, current, new_ids).values())
+                _run_storage(storage.move_course, course_id, idx)
                 event.acceptProposedAction()
-                idx = self._course_drop_index(event.position().toPoint())
-                if self._sections:
-                    if idx < len(self._sections):
-                        ref = self._sections[idx]
-                        y = ref.geometry().top() - 2
-                    else:
-                        ref = self._sections[-1]
-                        y = ref.geometry().bottom() + 1
-                    self._drop_indicator.setGeometry(32, y, self._container.width() - 64, 3)
-                    self._drop_indicator.show()
-                return True
-
-        elif event.type() == QEvent.Type.DragLeave:
-            self._drop_indicator.hide()
-            return True
-
-        elif event.type() == QEvent.Type.Drop:
-            self._drop_indicator.hide()
-            if is_course:
-                course_id = bytes(event.mimeData().data("application/x-gloss-course")).decode()
-                idx = self._course_drop_index(event.position().toPoint())
-                current_ids = [s.course_id for s in self._sections]
-                if course_id in current_ids:
-                    ids = [cid for cid in current_ids if cid != course_id]
-                    ids.insert(idx, course_id)
-                    storage.reorder_courses(ids)
-                    event.acceptProposedAction()
-                    self.refresh()
-                return True
-
-        return super().eventFilter(obj, event)
+        self._drop_y_centers = None
+        self._last_drop_idx = -1
 
     # -- Course CRUD ---------------------------------------------------------
 
+    @Slot()
     def _add_course(self):
-        prefill = ""
-        while True:
-            name, ok = _get_text(self,"New Course", "Course name:", text=prefill)
-            if not ok or not name.strip():
-                return
-            if len(name.strip()) > MAX_NAME_LENGTH:
-                _warning(self, "Name too long", f"Name must be {MAX_NAME_LENGTH} characters or fewer.")
-                prefill = name
-                continue
-            break
-        storage.create_course(name.strip())
-        self.refresh()
+        name = _prompt_name(self, "New Course", "Course name:")
+        if name is None:
+            return
+        _run_storage(storage.create_course, name, done=self.refresh)
 
+    @Slot()
     def _open_settings(self):
-        _SettingsDialog(self).exec()
+        # Built once and reused; later opens only re-read the saved values
+        if self._settings_dialog is None:
+            self._settings_dialog = _SettingsDialog(self)
+        else:
+            self._settings_dialog.reload()
+        self._settings_dialog.exec()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -10,17 +12,37 @@ from PySide6.QtWidgets import (
     QPushButton,
     QSplitter,
 )
-from PySide6.QtCore import Signal, Qt, QEvent
+from PySide6.QtCore import Signal, Qt, QTimer
 from PySide6.QtGui import QShortcut, QKeySequence
-from PySide6.QtWidgets import QApplication
 
 from src.models import storage
 from src.models.session import Session, SlideData
-from src.views.home_view import COURSE_COLORS
+from src.views.home_view import course_color
 from src.widgets.slide_viewer import SlideViewer
 from src.widgets.notes_editor import NotesEditor
 
 
+# Static chrome for the whole view, parsed once when set on LectureView
+_LECTURE_QSS = """
+    QWidget#navBar, QWidget#navBar QWidget,
+    QWidget#bottomBar, QWidget#bottomBar QWidget { background-color: #181825; }
+    QLabel#pageLabel { color: #cdd6f4; }
+    QPushButton#prevButton, QPushButton#nextButton { padding: 4px 12px; color: #89b4fa; }
+    QPushButton#prevButton:hover, QPushButton#nextButton:hover { background-color: #313244; color: #b4befe; }
+    QPushButton#homeButton { padding: 4px 16px; color: #94e2d5; }
+    QPushButton#homeButton:hover { background-color: #313244; color: #a6e3a1; }
+    QPushButton#editButton { padding: 4px 16px; color: #fab387; }
+    QPushButton#editButton:hover { background-color: #313244; color: #f9e2af; }
+    QPushButton#normalButton { padding: 4px 16px; color: #a6e3a1; }
+    QPushButton#normalButton:hover { background-color: #313244; color: #94e2d5; }
+    QPushButton#reviewButton { padding: 4px 16px; color: #cba6f7; }
+    QPushButton#reviewButton:hover { background-color: #313244; color: #f5c2e7; }
+    SlideViewer { background-color: #181825; border: 1px solid #313244; border-radius: 8px; }
+    QSplitter::handle { background-color: #45475a; }
+    QSplitter::handle:hover { background-color: #89b4fa; }
+"""
+
+
 class LectureView(QWidget):
     """Slide viewer + notes panel — the core lecture experience."""
 
@@ -33,48 +55,56 @@ class LectureView(QWidget):
         self._lecture_id: str = ""
         self._group_id: str | None = None
         self._session: Session | None = None
+        self._notes_page = 0  # page whose notes the editor is showing
+        self._notes_key = "1"  # its slide key, computed once per page change
+        self._notes_slide: SlideData | None = None  # its entry in the session, if any
+        self._dirty = False  # in-memory session has notes not yet on disk
+        # Coalesce autosaves: at most one session write per interval while typing
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._write_session)
         self._init_ui()
-        QApplication.instance().installEventFilter(self)
-
-    def eventFilter(self, obj, event):
-        # Only yield to the editor when it's editable and actively focused.
-        # A read-only (normal mode) editor that happens to have focus should not
-        # block slide navigation — the user can't type there anyway.
-        editor_active = self._editor.hasFocus() and not self._editor.isReadOnly()
-        if event.type() == QEvent.Type.KeyPress and self.isVisible() and not editor_active:
-            if event.key() == Qt.Key.Key_Tab:
-                if not self._editor.isReadOnly():
-                    self._editor.setFocus()
-                return True
-            elif event.key() in (Qt.Key.Key_Left, Qt.Key.Key_K):
-                self._prev_slide()
-                return True
-            elif event.key() in (Qt.Key.Key_Right, Qt.Key.Key_J):
-                self._next_slide()
-                return True
-            elif event.key() == Qt.Key.Key_I and self._editor.isReadOnly():
-                self._enter_edit_mode()
-                self._editor.setFocus()
-                return True
-        return super().eventFilter(obj, event)
+        self._init_shortcuts()
+
+    def _init_shortcuts(self):
+        # Window-wide while this view is shown. An editable, focused editor claims
+        # these keys itself (ShortcutOverride), so they only navigate when the user
+        # isn't typing; a read-only editor with focus doesn't block them.
+        for key, slot in (
+            (Qt.Key.Key_Left, self._prev_slide),
+            (Qt.Key.Key_K, self._prev_slide),
+            (Qt.Key.Key_Right, self._next_slide),
+            (Qt.Key.Key_J, self._next_slide),
+            (Qt.Key.Key_Tab, self._focus_editor),
+            (Qt.Key.Key_I, self._start_editing),
+        ):
+            QShortcut(QKeySequence(key), self, slot)
+
+    def _focus_editor(self):
+        if not self._editor.isReadOnly():
+            self._editor.setFocus()
+
+    def _start_editing(self):
+        if self._editor.isReadOnly():
+            self._enter_edit_mode()
+            self._editor.setFocus()
 
     def _init_ui(self):
+        self.setStyleSheet(_LECTURE_QSS)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
         # -- Top navigation bar --
         nav_bar = QWidget()
+        nav_bar.setObjectName("navBar")
         nav_bar.setFixedHeight(50)
-        nav_bar.setStyleSheet("background-color: #181825;")
         nav_layout = QHBoxLayout(nav_bar)
         nav_layout.setContentsMargins(12, 4, 12, 4)
 
         self._prev_btn = QPushButton("< Prev")
-        self._prev_btn.setStyleSheet(
-            "QPushButton { padding: 4px 12px; color: #89b4fa; }"
-            "QPushButton:hover { background-color: #313244; color: #b4befe; }"
-        )
+        self._prev_btn.setObjectName("prevButton")
         self._prev_btn.clicked.connect(self._prev_slide)
         sp = self._prev_btn.sizePolicy()
         sp.setRetainSizeWhenHidden(True)
@@ -84,16 +114,13 @@ class LectureView(QWidget):
         nav_layout.addStretch()
 
         self._page_label = QLabel("Slide 0 of 0")
-        self._page_label.setStyleSheet("color: #cdd6f4;")
+        self._page_label.setObjectName("pageLabel")
         nav_layout.addWidget(self._page_label)
 
         nav_layout.addStretch()
 
         self._next_btn = QPushButton("Next >")
-        self._next_btn.setStyleSheet(
-            "QPushButton { padding: 4px 12px; color: #89b4fa; }"
-            "QPushButton:hover { background-color: #313244; color: #b4befe; }"
-        )
+        self._next_btn.setObjectName("nextButton")
         self._next_btn.clicked.connect(self._next_slide)
         sp = self._next_btn.sizePolicy()
         sp.setRetainSizeWhenHidden(True)
@@ -111,9 +138,6 @@ class LectureView(QWidget):
         self._splitter = QSplitter(Qt.Orientation.Horizontal)
 
         self._viewer = SlideViewer()
-        self._viewer.setStyleSheet(
-            "SlideViewer { background-color: #181825; border: 1px solid #313244; border-radius: 8px; }"
-        )
         self._editor = NotesEditor()
         self._editor.setStyleSheet(
             "NotesEditor { background-color: #1e1e2e; border: none; border-radius: 8px; padding: 8px; }"
@@ -129,58 +153,38 @@ class LectureView(QWidget):
         self._splitter.setStretchFactor(1, 2)
         self._splitter.setChildrenCollapsible(False)
         self._splitter.setHandleWidth(4)
-        self._splitter.setStyleSheet(
-            "QSplitter::handle {"
-            "  background-color: #45475a;"
-            "}"
-            "QSplitter::handle:hover {"
-            "  background-color: #89b4fa;"
-            "}"
-        )
 
         content_layout.addWidget(self._splitter)
         layout.addWidget(content_area, 1)
 
         # -- Bottom bar --
         bottom_bar = QWidget()
+        bottom_bar.setObjectName("bottomBar")
         bottom_bar.setFixedHeight(50)
-        bottom_bar.setStyleSheet("background-color: #181825;")
         bottom_layout = QHBoxLayout(bottom_bar)
         bottom_layout.setContentsMargins(40, 4, 40, 4)
 
         home_btn = QPushButton("Home")
-        home_btn.setStyleSheet(
-            "QPushButton { padding: 4px 16px; color: #94e2d5; }"
-            "QPushButton:hover { background-color: #313244; color: #a6e3a1; }"
-        )
-        home_btn.clicked.connect(self.back_requested.emit)
+        home_btn.setObjectName("homeButton")
+        home_btn.clicked.connect(self._go_home)
         bottom_layout.addWidget(home_btn)
 
         bottom_layout.addStretch()
 
         # Normal / Edit mode toggle
         self._edit_btn = QPushButton("Edit Mode")
-        self._edit_btn.setStyleSheet(
-            "QPushButton { padding: 4px 16px; color: #fab387; }"
-            "QPushButton:hover { background-color: #313244; color: #f9e2af; }"
-        )
+        self._edit_btn.setObjectName("editButton")
         self._edit_btn.clicked.connect(self._enter_edit_mode)
         bottom_layout.addWidget(self._edit_btn)
 
         self._normal_btn = QPushButton("Normal Mode")
-        self._normal_btn.setStyleSheet(
-            "QPushButton { padding: 4px 16px; color: #a6e3a1; }"
-            "QPushButton:hover { background-color: #313244; color: #94e2d5; }"
-        )
+        self._normal_btn.setObjectName("normalButton")
         self._normal_btn.clicked.connect(self._enter_normal_mode)
         self._normal_btn.hide()
         bottom_layout.addWidget(self._normal_btn)
 
         self._review_btn = QPushButton("Enter Review Mode")
-        self._review_btn.setStyleSheet(
-            "QPushButton { padding: 4px 16px; color: #cba6f7; }"
-            "QPushButton:hover { background-color: #313244; color: #f5c2e7; }"
-        )
+        self._review_btn.setObjectName("reviewButton")
         self._review_btn.clicked.connect(
             lambda: self.review_requested.emit(
                 self._course_id, self._lecture_id,
@@ -204,8 +208,16 @@ class LectureView(QWidget):
             self._enter_normal_mode()
             self._viewer.setFocus()
         else:
-            self._flush_notes()
-            self.back_requested.emit()
+            self._go_home()
+
+    def _go_home(self):
+        # Land any coalesced autosave before leaving rather than when the timer fires
+        self._flush_notes()
+        self.back_requested.emit()
+
+    def flush(self):
+        """Write any unsaved notes to disk (e.g. before the app quits)."""
+        self._flush_notes()
 
     def load(self, course_id: str, lecture_id: str, group_id: str | None = None):
         # Save notes from previous session if any
@@ -216,18 +228,14 @@ class LectureView(QWidget):
         self._group_id = group_id
         self._session = storage.load_session(course_id, lecture_id, group_id=group_id)
 
-        # Determine course color (same index logic as home view)
-        courses = storage.list_courses()
-        color = "#cdd6f4"  # fallback
-        for i, c in enumerate(courses):
-            if c.id == course_id:
-                color = COURSE_COLORS[i % len(COURSE_COLORS)]
-                break
+        # Course color (same stored color as the home view)
+        color = course_color(storage.load_course(course_id))
         self._page_label.setStyleSheet(f"color: {color};")
 
+        # Notes first, so the page_changed(0) emitted once the PDF is ready finds them in place
+        self._load_notes_for_page(0)
         pdf_path = storage.lecture_dir_path(course_id, lecture_id, group_id) / self._session.pdf_filename
         self._viewer.load_pdf(pdf_path)
-        self._load_notes_for_page(0)
 
         # Always start in Normal Mode (read-only)
         self._apply_normal_ui()
@@ -235,64 +243,84 @@ class LectureView(QWidget):
     # -- Slide navigation ---------------------------------------------------
 
     def _prev_slide(self):
-        self._flush_notes()
         self._viewer.prev_page()
 
     def _next_slide(self):
-        self._flush_notes()
         self._viewer.next_page()
 
     def _on_page_changed(self, page: int):
+        # Every page change lands here (buttons, keys, thumbnails), so save the
+        # outgoing slide's notes once and swap the editor before relabelling
+        if page != self._notes_page:
+            self._flush_notes()
+            self._load_notes_for_page(page)
         total = self._viewer.page_count
         self._page_label.setText(f"Slide {page + 1} of {total}")
         self._prev_btn.setVisible(page > 0)
         self._next_btn.setVisible(page < total - 1)
         if not self._editor.hasFocus():
             self._viewer.setFocus()
-        self._load_notes_for_page(page)
 
     # -- Per-slide notes ----------------------------------------------------
 
     def _slide_key(self, page: int) -> str:
-        """1-indexed string key matching the session JSON schema."""
-        return str(page + 1)
+        """1-indexed string key matching the session JSON schema (interned, like the loaded keys)."""
+        return sys.intern(str(page + 1))
 
     def _load_notes_for_page(self, page: int):
+        self._notes_page = page
+        self._notes_key = self._slide_key(page)
         if not self._session:
             return
-        key = self._slide_key(page)
-        slide_data = self._session.slides.get(key)
+        self._notes_slide = slide_data = self._session.slides.get(self._notes_key)
         self._editor.set_notes(slide_data.raw_notes if slide_data else "")
 
-    def _flush_notes(self):
-        """Save current editor text into the session and persist to disk."""
-        if not self._session:
-            return
-        key = self._slide_key(self._viewer.current_page)
-        text = self._editor.get_notes()
-        if key not in self._session.slides:
+    def _store_notes(self, text: str):
+        """Put *text* into the session for the editor's slide, marking it dirty if it changed."""
+        slide = self._notes_slide
+        if slide is None:
             if not text:
                 return  # don't create empty slide entries
-            self._session.slides[key] = SlideData()
-        self._session.slides[key].raw_notes = text
+            slide = self._notes_slide = self._session.slides[self._notes_key] = SlideData()
+        if slide.raw_notes != text:
+            slide.raw_notes = text
+            self._dirty = True
+
+    def _take_editor_notes(self):
+        """Store the editor's text if the user changed it since the last store."""
+        if self._editor.is_dirty():
+            self._store_notes(self._editor.get_notes())
+            self._editor.mark_clean()
+
+    def _write_session(self):
+        self._save_timer.stop()
+        self._dirty = False
         storage.save_session(self._course_id, self._session, group_id=self._group_id)
 
+    def _flush_notes(self):
+        """Save current editor text into the session and persist it now if it changed."""
+        if not self._session:
+            return
+        self._take_editor_notes()
+        if self._dirty:
+            self._write_session()
+
     def _save_current_notes(self, text: str):
         """Called by the editor's debounced notes_changed signal."""
         if not self._session:
             return
-        key = self._slide_key(self._viewer.current_page)
-        if key not in self._session.slides:
-            if not text:
-                return
-            self._session.slides[key] = SlideData()
-        self._session.slides[key].raw_notes = text
-        storage.save_session(self._course_id, self._session, group_id=self._group_id)
+        self._store_notes(text)
+        self._editor.mark_clean()
+        if self._dirty and not self._save_timer.isActive():
+            self._save_timer.start()
 
     def refresh_session(self):
         """Reload session from disk to pick up changes (e.g. reviews saved by ReviewView)."""
+        if self._session and self._dirty:
+            self._write_session()
         if self._course_id and self._lecture_id:
             self._session = storage.load_session(self._course_id, self._lecture_id, group_id=self._group_id)
+            self._notes_slide = self._session.slides.get(self._notes_key)
 
     # -- Normal / Edit mode toggle --------------------------------------------
 
@@ -306,37 +334,36 @@ class LectureView(QWidget):
         """Lock editing, snapshot notes, clear stale reviews."""
         if not self._session:
             return
-        self._flush_notes()
+        self._take_editor_notes()
 
         # Snapshot current notes — clear reviews only for changed slides
         old_snapshot = self._session.finalized_notes
         new_snapshot: dict[str, str] = {}
+        changed = False
         for key, slide in self._session.slides.items():
-            if slide.raw_notes.strip():
-                new_snapshot[key] = slide.raw_notes
-        for key in new_snapshot:
-            if new_snapshot[key] != old_snapshot.get(key, ""):
-                if key in self._session.slides:
-                    self._session.slides[key].review = []
-
-        self._session.finalized_notes = new_snapshot
-        storage.save_session(self._course_id, self._session, group_id=self._group_id)
+            raw = slide.raw_notes
+            if not raw or raw.isspace():
+                continue
+            new_snapshot[key] = raw
+            if raw != old_snapshot.get(key, ""):
+                slide.review = []
+                changed = True
+
+        if changed or len(new_snapshot) != len(old_snapshot):
+            self._session.finalized_notes = new_snapshot
+            self._dirty = True
+        if self._dirty:
+            self._write_session()
         self._apply_normal_ui()
 
     def _apply_normal_ui(self):
         self._editor.setReadOnly(True)
-        self._editor.setStyleSheet(
-            "NotesEditor { background-color: #1e1e2e; border: none; border-radius: 8px; padding: 8px; }"
-        )
         self._edit_btn.show()
         self._normal_btn.hide()
         self._review_btn.show()
 
     def _apply_edit_ui(self):
         self._editor.setReadOnly(False)
-        self._editor.setStyleSheet(
-            "NotesEditor { background-color: #1e1e2e; border: none; border-radius: 8px; padding: 8px; }"
-        )
         self._edit_btn.hide()
         self._normal_btn.show()
         self._review_btn.hide()
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import NamedTuple
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -14,14 +18,14 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QCheckBox,
 )
-from PySide6.QtCore import Signal, Qt, QEvent
-from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QThread, Signal, Qt, QTimer
+from PySide6.QtGui import QKeySequence, QShortcut
 
 from src.models import storage
-from src.models.session import Session, ReviewItem, FollowupMessage
-from src.services.note_parser import parse_notes
+from src.models.session import Session, SlideData, ReviewItem, FollowupMessage
+from src.services.note_parser import ParsedNote, parse_notes
+from src.services.llm_service import ReviewWorker, LLMProvider, run_llm_task
 from src.services.pdf_service import load_pdf_base64
-from src.services.llm_service import ReviewWorker, FollowupWorker, LLMProvider
 from src.services.claude_provider import ClaudeProvider
 from src.services.openai_provider import OpenAIProvider
 from src.services.gemini_provider import GeminiProvider
@@ -31,10 +35,79 @@ from src.utils.config import (
     load_gemini_api_key, save_gemini_api_key, load_gemini_model,
     load_provider,
 )
-from src.widgets.review_card import ReviewCard
+from src.widgets.review_card import REVIEW_CARD_QSS, ReviewCard
 from src.widgets.slide_viewer import SlideViewer
 
 
+# Static chrome for the whole view, parsed once when set on ReviewView
+# (together with the cards' REVIEW_CARD_QSS)
+_REVIEW_QSS = """
+    QWidget#navBar, QWidget#navBar QWidget,
+    QWidget#bottomBar, QWidget#bottomBar QWidget { background-color: #181825; }
+    QLabel#pageLabel { color: #cba6f7; font-weight: bold; }
+    QLabel#statusLabel, QLabel#emptyLabel { color: #585b70; }
+    QLabel#errorLabel { color: #f38ba8; }
+    QPushButton#prevButton, QPushButton#nextButton { padding: 4px 12px; color: #89b4fa; }
+    QPushButton#backButton { padding: 4px 16px; color: #89b4fa; }
+    QPushButton#prevButton:hover, QPushButton#nextButton:hover,
+    QPushButton#backButton:hover { background-color: #313244; color: #b4befe; }
+    SlideViewer { background-color: #181825; border: 1px solid #313244; border-radius: 8px; }
+    QScrollArea#reviewScroll { border: 1px solid #313244; border-radius: 8px; background-color: #1e1e2e; }
+    QScrollArea#reviewScroll QScrollBar:vertical { background: #181825; width: 8px; }
+    QScrollArea#reviewScroll QScrollBar::handle:vertical { background: #45475a; border-radius: 4px; }
+    QScrollArea#reviewScroll QScrollBar::add-line:vertical,
+    QScrollArea#reviewScroll QScrollBar::sub-line:vertical { height: 0; }
+    QWidget#reviewContent, QWidget#reviewContent QWidget { background-color: #1e1e2e; }
+    QWidget#reviewContent ReviewCard { background-color: #181825; border-radius: 8px; }
+    QSplitter::handle { background-color: #45475a; }
+    QSplitter::handle:hover { background-color: #89b4fa; }
+"""
+
+
+class PdfEncodeWorker(QThread):
+    """Run load_pdf_base64 in the background so large PDFs don't block the UI."""
+
+    done = Signal(str)   # base64 content
+    error = Signal(str)  # user-facing message
+
+    def __init__(self, pdf_path: Path, parent=None):
+        super().__init__(parent)
+        self._pdf_path = pdf_path
+
+    def run(self):
+        try:
+            self.done.emit(load_pdf_base64(self._pdf_path))
+        except (OSError, ValueError) as exc:
+            self.error.emit(str(exc))
+
+
+class _Origin(NamedTuple):
+    """The load a regenerate/follow-up request was issued from."""
+
+    session: Session | None
+    course_id: str
+    lecture_id: str
+    group_id: str | None
+
+
+@lru_cache(maxsize=1024)
+def _parsed_notes(raw_notes: str) -> tuple[ParsedNote, ...]:
+    """parse_notes, remembered per note text across review-mode entries."""
+    return tuple(parse_notes(raw_notes))
+
+
+_API_KEY_DIALOG_QSS = """
+    * { background-color: #1e1e2e; color: #cdd6f4; }
+    QLineEdit#keyInput { background-color: #313244; border: 1px solid #45475a;
+                         border-radius: 4px; padding: 6px; color: #cdd6f4; }
+    QCheckBox#showKey { color: #585b70; }
+    QPushButton[role="cancel"] { padding: 4px 16px; color: #585b70; }
+    QPushButton[role="cancel"]:hover { color: #cdd6f4; }
+    QPushButton[role="save"] { padding: 4px 16px; color: #a6e3a1; }
+    QPushButton[role="save"]:hover { background-color: #313244; }
+"""
+
+
 class ApiKeyDialog(QDialog):
     """Simple dialog to prompt for an API key."""
 
@@ -42,7 +115,7 @@ class ApiKeyDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("API Key Required")
         self.setFixedWidth(420)
-        self.setStyleSheet("background-color: #1e1e2e; color: #cdd6f4;")
+        self.setStyleSheet(_API_KEY_DIALOG_QSS)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
@@ -55,14 +128,11 @@ class ApiKeyDialog(QDialog):
         self._key_input = QLineEdit()
         self._key_input.setEchoMode(QLineEdit.EchoMode.Password)
         self._key_input.setPlaceholderText(placeholder)
-        self._key_input.setStyleSheet(
-            "QLineEdit { background-color: #313244; border: 1px solid #45475a; "
-            "border-radius: 4px; padding: 6px; color: #cdd6f4; }"
-        )
+        self._key_input.setObjectName("keyInput")
         layout.addWidget(self._key_input)
 
         show_cb = QCheckBox("Show key")
-        show_cb.setStyleSheet("color: #585b70;")
+        show_cb.setObjectName("showKey")
         show_cb.toggled.connect(
             lambda on: self._key_input.setEchoMode(
                 QLineEdit.EchoMode.Normal if on else QLineEdit.EchoMode.Password
@@ -74,18 +144,12 @@ class ApiKeyDialog(QDialog):
         btn_row.addStretch()
 
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet(
-            "QPushButton { padding: 4px 16px; color: #585b70; }"
-            "QPushButton:hover { color: #cdd6f4; }"
-        )
+        cancel_btn.setProperty("role", "cancel")
         cancel_btn.clicked.connect(self.reject)
         btn_row.addWidget(cancel_btn)
 
         save_btn = QPushButton("Save")
-        save_btn.setStyleSheet(
-            "QPushButton { padding: 4px 16px; color: #a6e3a1; }"
-            "QPushButton:hover { background-color: #313244; }"
-        )
+        save_btn.setProperty("role", "save")
         save_btn.clicked.connect(self.accept)
         btn_row.addWidget(save_btn)
 
@@ -107,45 +171,61 @@ class ReviewView(QWidget):
         self._group_id: str | None = None
         self._session: Session | None = None
         self._worker: ReviewWorker | None = None
-        self._cards: dict[str, list[ReviewCard]] = {}  # slide_key -> [ReviewCard]
+        self._pdf_worker: PdfEncodeWorker | None = None
+        self._cards: dict[str, list[ReviewCard]] = {}  # slide_key -> [ReviewCard], built on first view
+        self._card_keys: set[str] = set()  # slides that have notes to show
+        self._pending: dict[str, list] = {}  # slide_key -> parsed notes still awaiting review
+        self._slide_errors: dict[str, str] = {}  # slide_key -> last review error
+        self._shown_key: str | None = None  # slide whose cards the right panel shows
+        self._cards_built = False  # False while the PDF encodes, until _build_cards runs
         self._pdf_base64: str = ""
         self._api_key: str = ""
         self._provider_name: str = "anthropic"
+        self._provider: LLMProvider | None = None
+        self._provider_args: tuple[str, str, str] = ("", "", "")
+
+        # Reviews, regenerations and follow-ups arrive one at a time; coalesce their saves
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._write_session)
+
+        # Holding J/K flips through slides; only swap cards for the one it stops on
+        self._page_timer = QTimer(self)
+        self._page_timer.setSingleShot(True)
+        self._page_timer.setInterval(60)
+        self._page_timer.timeout.connect(self._show_current_cards)
+
         self._init_ui()
-        QApplication.instance().installEventFilter(self)
-
-    def eventFilter(self, obj, event):
-        if event.type() == QEvent.Type.KeyPress and self.isVisible():
-            # Don't steal keys while the user is typing in any text widget
-            focused = QApplication.focusWidget()
-            from PySide6.QtWidgets import QLineEdit, QTextEdit
-            if isinstance(focused, (QLineEdit, QTextEdit)):
-                return super().eventFilter(obj, event)
-            if event.key() in (Qt.Key.Key_Left, Qt.Key.Key_K):
-                self._prev_slide()
-                return True
-            elif event.key() in (Qt.Key.Key_Right, Qt.Key.Key_J):
-                self._next_slide()
-                return True
-        return super().eventFilter(obj, event)
+        self._init_shortcuts()
+
+    def _init_shortcuts(self):
+        # Window-wide while this view is shown. A focused text input (follow-up
+        # box, API key field) claims these keys itself via ShortcutOverride, so
+        # they only navigate when the user isn't typing.
+        for key, slot in (
+            (Qt.Key.Key_Left, self._prev_slide),
+            (Qt.Key.Key_K, self._prev_slide),
+            (Qt.Key.Key_Right, self._next_slide),
+            (Qt.Key.Key_J, self._next_slide),
+        ):
+            QShortcut(QKeySequence(key), self, slot)
 
     def _init_ui(self):
+        self.setStyleSheet(_REVIEW_QSS + REVIEW_CARD_QSS)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
         # -- Top navigation bar --
         nav_bar = QWidget()
+        nav_bar.setObjectName("navBar")
         nav_bar.setFixedHeight(50)
-        nav_bar.setStyleSheet("background-color: #181825;")
         nav_layout = QHBoxLayout(nav_bar)
         nav_layout.setContentsMargins(12, 4, 12, 4)
 
         self._prev_btn = QPushButton("< Prev")
-        self._prev_btn.setStyleSheet(
-            "QPushButton { padding: 4px 12px; color: #89b4fa; }"
-            "QPushButton:hover { background-color: #313244; color: #b4befe; }"
-        )
+        self._prev_btn.setObjectName("prevButton")
         self._prev_btn.clicked.connect(self._prev_slide)
         sp = self._prev_btn.sizePolicy()
         sp.setRetainSizeWhenHidden(True)
@@ -155,20 +235,17 @@ class ReviewView(QWidget):
         nav_layout.addStretch()
 
         self._page_label = QLabel("Slide 0 of 0")
-        self._page_label.setStyleSheet("color: #cba6f7; font-weight: bold;")
+        self._page_label.setObjectName("pageLabel")
         nav_layout.addWidget(self._page_label)
 
         nav_layout.addStretch()
 
         self._status_label = QLabel()
-        self._status_label.setStyleSheet("color: #585b70;")
+        self._status_label.setObjectName("statusLabel")
         nav_layout.addWidget(self._status_label)
 
         self._next_btn = QPushButton("Next >")
-        self._next_btn.setStyleSheet(
-            "QPushButton { padding: 4px 12px; color: #89b4fa; }"
-            "QPushButton:hover { background-color: #313244; color: #b4befe; }"
-        )
+        self._next_btn.setObjectName("nextButton")
         self._next_btn.clicked.connect(self._next_slide)
         sp = self._next_btn.sizePolicy()
         sp.setRetainSizeWhenHidden(True)
@@ -186,30 +263,16 @@ class ReviewView(QWidget):
         self._splitter = QSplitter(Qt.Orientation.Horizontal)
 
         self._viewer = SlideViewer()
-        self._viewer.setStyleSheet(
-            "SlideViewer { background-color: #181825; border: 1px solid #313244; border-radius: 8px; }"
-        )
         self._viewer.setMinimumWidth(250)
 
         # Right panel: scrollable review cards for the current slide
         self._right_scroll = QScrollArea()
+        self._right_scroll.setObjectName("reviewScroll")
         self._right_scroll.setWidgetResizable(True)
         self._right_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self._right_scroll.setStyleSheet(
-            "QScrollArea { border: 1px solid #313244; border-radius: 8px; background-color: #1e1e2e; }"
-            "QScrollBar:vertical { background: #181825; width: 8px; }"
-            "QScrollBar::handle:vertical { background: #45475a; border-radius: 4px; }"
-            "QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }"
-        )
         self._right_scroll.setMinimumWidth(250)
 
-        self._right_content = QWidget()
-        self._right_content.setStyleSheet("background-color: #1e1e2e;")
-        self._right_layout = QVBoxLayout(self._right_content)
-        self._right_layout.setContentsMargins(16, 16, 16, 16)
-        self._right_layout.setSpacing(12)
-        self._right_layout.addStretch()
-        self._right_scroll.setWidget(self._right_content)
+        self._new_right_content()
 
         self._splitter.addWidget(self._viewer)
         self._splitter.addWidget(self._right_scroll)
@@ -218,26 +281,19 @@ class ReviewView(QWidget):
         self._splitter.setStretchFactor(1, 2)
         self._splitter.setChildrenCollapsible(False)
         self._splitter.setHandleWidth(4)
-        self._splitter.setStyleSheet(
-            "QSplitter::handle { background-color: #45475a; }"
-            "QSplitter::handle:hover { background-color: #89b4fa; }"
-        )
 
         content_layout.addWidget(self._splitter)
         layout.addWidget(content_area, 1)
 
         # -- Bottom bar --
         bottom_bar = QWidget()
+        bottom_bar.setObjectName("bottomBar")
         bottom_bar.setFixedHeight(50)
-        bottom_bar.setStyleSheet("background-color: #181825;")
         bottom_layout = QHBoxLayout(bottom_bar)
         bottom_layout.setContentsMargins(40, 4, 40, 4)
 
         back_btn = QPushButton("Back to Slides")
-        back_btn.setStyleSheet(
-            "QPushButton { padding: 4px 16px; color: #89b4fa; }"
-            "QPushButton:hover { background-color: #313244; color: #b4befe; }"
-        )
+        back_btn.setObjectName("backButton")
         back_btn.clicked.connect(self._go_back)
         bottom_layout.addWidget(back_btn)
 
@@ -256,6 +312,11 @@ class ReviewView(QWidget):
         self._group_id = group_id
         self._session = storage.load_session(course_id, lecture_id, group_id=group_id)
         self._cards.clear()
+        self._card_keys.clear()
+        self._shown_key = None
+        self._cards_built = False
+        # The previous lecture's cards go now; page changes leave this alone until cards are built
+        self._show_right_message("Loading PDF...")
 
         # Resolve provider and credentials
         self._provider_name = load_provider()
@@ -283,15 +344,30 @@ class ReviewView(QWidget):
         if initial_page > 0:
             self._viewer.go_to_page(initial_page)
 
-        # Also encode for LLM
-        try:
-            self._pdf_base64 = load_pdf_base64(pdf_path)
-        except ValueError as exc:
-            self._show_right_error(str(exc))
-            return
+        # Also encode for LLM, off the GUI thread; cards are built once it's ready
+        self._pdf_base64 = ""
+        self._status_label.setText("Loading PDF...")
+        worker = PdfEncodeWorker(pdf_path, self)
+        worker.done.connect(partial(self._on_pdf_ready, worker))
+        worker.error.connect(partial(self._on_pdf_error, worker))
+        worker.finished.connect(worker.deleteLater)
+        self._pdf_worker = worker
+        worker.start()
 
+    def _on_pdf_ready(self, worker: PdfEncodeWorker, pdf_base64: str):
+        if worker is not self._pdf_worker:
+            return  # a newer load (or leaving the view) superseded this one
+        self._pdf_worker = None
+        self._pdf_base64 = pdf_base64
         self._build_cards()
 
+    def _on_pdf_error(self, worker: PdfEncodeWorker, message: str):
+        if worker is not self._pdf_worker:
+            return
+        self._pdf_worker = None
+        self._status_label.clear()
+        self._show_right_error(message)
+
     # -- Slide navigation -----------------------------------------------------
 
     def _prev_slide(self):
@@ -305,67 +381,100 @@ class ReviewView(QWidget):
         self._page_label.setText(f"Slide {page + 1} of {total}")
         self._prev_btn.setVisible(page > 0)
         self._next_btn.setVisible(page < total - 1)
-        self._show_slide_cards(str(page + 1))
+        if not self._cards_built:
+            return  # still encoding the PDF (or it failed); _build_cards shows the slide
+        if str(page + 1) == self._shown_key:
+            self._page_timer.stop()  # back on the slide already shown (or a repeat emit)
+        else:
+            self._page_timer.start()
 
     # -- Card building --------------------------------------------------------
 
     def _build_cards(self):
-        """Pre-build all ReviewCard widgets and store in _cards; show current slide."""
-        self._cards.clear()
-
-        slides_needing_review: dict[str, list] = {}
+        """Work out which slides have cards and which need review; show current slide.
 
-        sorted_keys = sorted(self._session.slides.keys(), key=lambda k: int(k))
+        Card widgets are only created when their slide is first shown, so a
+        long lecture doesn't allocate hundreds of cards up front.
+        """
+        self._cards.clear()
+        self._card_keys.clear()
+        self._shown_key = None
+        self._pending = {}
+        self._slide_errors.clear()
+        self._cards_built = True
+
+        # Slides without notes can't produce cards; drop them before sorting and parsing
+        noted = sorted(
+            (int(k), k, sd) for k, sd in self._session.slides.items() if sd.raw_notes
+        )
 
-        for slide_key in sorted_keys:
-            slide_data = self._session.slides[slide_key]
-            parsed = parse_notes(slide_data.raw_notes)
+        for _, slide_key, slide_data in noted:
+            if slide_data.review:
+                self._card_keys.add(slide_key)  # cached; cards come from the review items
+                continue
+            parsed = _parsed_notes(slide_data.raw_notes)
             if not parsed:
                 continue
+            self._card_keys.add(slide_key)
+            self._pending[slide_key] = list(parsed)
 
-            slide_cards: list[ReviewCard] = []
+        self._show_current_cards()
 
-            if slide_data.review:
-                for i, item in enumerate(slide_data.review):
+        if self._pending:
+            self._start_review(dict(self._pending))  # the worker iterates its own copy
+        else:
+            self._status_label.setText("All reviews cached")
+
+    def _slide_cards(self, slide_key: str) -> list[ReviewCard]:
+        """Return the slide's cards, creating them the first time it is shown."""
+        cards = self._cards.get(slide_key)
+        if cards is not None:
+            return cards
+        cards = []
+        if slide_key in self._card_keys:
+            if slide_key in self._pending:
+                for note in self._pending[slide_key]:
+                    card = ReviewCard(note.note_type, note.text)
+                    if slide_key in self._slide_errors:
+                        card.set_error(self._slide_errors[slide_key])
+                    cards.append(card)
+            else:
+                for i, item in enumerate(self._session.slides[slide_key].review):
                     card = ReviewCard(item.note_type, item.original)
                     card.set_response(item.response)
                     card.load_followups(item.followups)
-                    card.regenerate_requested.connect(
-                        lambda sk=slide_key, c=card, n=item: self._regenerate_card(sk, c, n)
-                    )
-                    card.followup_submitted.connect(
-                        lambda q, sk=slide_key, c=card, idx=i: self._on_followup(sk, c, idx, q)
-                    )
-                    slide_cards.append(card)
-            else:
-                for note in parsed:
-                    card = ReviewCard(note.note_type, note.text)
-                    slide_cards.append(card)
-                slides_needing_review[slide_key] = parsed
-
-            self._cards[slide_key] = slide_cards
-
-        # Show cards for whichever slide is currently visible
+                    self._connect_card(card, slide_key, i, item)
+                    cards.append(card)
+        self._cards[slide_key] = cards
+        return cards
+
+    def _show_current_cards(self):
+        """Show cards for whichever slide is currently visible."""
+        self._page_timer.stop()
         self._show_slide_cards(str(self._viewer.current_page + 1))
 
-        if slides_needing_review:
-            self._start_review(slides_needing_review)
-        else:
-            self._status_label.setText("All reviews cached")
-
     def _show_slide_cards(self, slide_key: str):
         """Populate the right panel with cards for the given slide."""
-        # Detach all widgets without deleting (cards live in _cards dict)
-        while self._right_layout.count():
-            item = self._right_layout.takeAt(0)
-            w = item.widget()
+        # One repaint for the whole swap instead of one per detached/added card
+        self._right_content.setUpdatesEnabled(False)
+        try:
+            self._fill_slide_cards(slide_key)
+        finally:
+            self._right_content.setUpdatesEnabled(True)
+        self._shown_key = slide_key
+
+    def _fill_slide_cards(self, slide_key: str):
+        # Detach all widgets without deleting (cards live in _cards dict);
+        # taking from the end avoids shifting the remaining layout items
+        for i in reversed(range(self._right_layout.count())):
+            w = self._right_layout.takeAt(i).widget()
             if w:
                 w.setParent(None)
 
-        cards = self._cards.get(slide_key, [])
+        cards = self._slide_cards(slide_key)
         if not cards:
             empty = QLabel("No notes for this slide.")
-            empty.setStyleSheet("color: #585b70;")
+            empty.setObjectName("emptyLabel")
             empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self._right_layout.addWidget(empty)
         else:
@@ -382,7 +491,7 @@ class ReviewView(QWidget):
         self._total_to_review = total
         self._status_label.setText(f"Reviewing 0/{total} slides...")
 
-        provider = self._make_provider()
+        provider = self._get_provider()
         self._worker = ReviewWorker(provider, self._pdf_base64, slides_to_review)
         self._worker.slide_reviewed.connect(self._on_slide_reviewed)
         self._worker.slide_error.connect(self._on_slide_error)
@@ -390,112 +499,180 @@ class ReviewView(QWidget):
         self._worker.start()
 
     def _stop_worker(self):
-        if self._worker and self._worker.isRunning():
-            self._worker.cancel()
-            self._worker.wait()
+        self._pdf_worker = None  # parented to self, so it finishes and deletes itself
+        worker = self._worker
+        if worker:
+            # Nothing from this run may reach the next lecture's cards
+            worker.slide_reviewed.disconnect(self._on_slide_reviewed)
+            worker.slide_error.disconnect(self._on_slide_error)
+            worker.all_done.disconnect(self._on_all_done)
+            if worker.isRunning():
+                worker.cancel()
+                worker.wait()
         self._worker = None
+        self.flush()
 
     def _on_slide_reviewed(self, slide_key: str, items: list):
+        if self.sender() is not self._worker:
+            return  # queued before the worker was stopped
         self._reviewed_count += 1
         self._status_label.setText(
             f"Reviewing {self._reviewed_count}/{self._total_to_review} slides..."
         )
 
+        # Slides not yet shown build their cards from the session later
+        self._pending.pop(slide_key, None)
+        self._slide_errors.pop(slide_key, None)
         cards = self._cards.get(slide_key, [])
         for i, card in enumerate(cards):
             if i < len(items):
                 card.set_response(items[i].response)
-                item = items[i]
-                try:
-                    card.regenerate_requested.disconnect()
-                except (TypeError, RuntimeError):
-                    pass
-                card.regenerate_requested.connect(
-                    lambda sk=slide_key, c=card, n=item: self._regenerate_card(sk, c, n)
-                )
-                card.followup_submitted.connect(
-                    lambda q, sk=slide_key, c=card, idx=i: self._on_followup(sk, c, idx, q)
-                )
-
-        if self._session and slide_key in self._session.slides:
-            self._session.slides[slide_key].review = items
-            storage.save_session(self._course_id, self._session, group_id=self._group_id)
+                # Cards awaiting their first review were built without connections
+                self._connect_card(card, slide_key, i, items[i])
+
+        slide = self._slide(slide_key)
+        if slide is not None:
+            slide.review = items
+            self._save_later()
+
+    def _connect_card(self, card: ReviewCard, slide_key: str, idx: int, item: ReviewItem):
+        card.regenerate_requested.connect(partial(self._regenerate_card, slide_key, card, item))
+        card.followup_submitted.connect(partial(self._on_followup, slide_key, card, idx))
 
     def _on_slide_error(self, slide_key: str, error_msg: str):
+        if self.sender() is not self._worker:
+            return
         self._reviewed_count += 1
         self._status_label.setText(
             f"Reviewing {self._reviewed_count}/{self._total_to_review} slides..."
         )
+        self._slide_errors[slide_key] = error_msg
         for card in self._cards.get(slide_key, []):
             card.set_error(error_msg)
 
     def _on_all_done(self):
+        if self.sender() is not self._worker:
+            return
         self._status_label.setText("Review complete")
+        self.flush()
+
+    def _save_later(self):
+        """Schedule a session write; results landing within the window share it."""
+        if not self._save_timer.isActive():
+            self._save_timer.start()
+
+    def _write_session(self):
+        self._save_timer.stop()
+        if self._session:
+            storage.save_session(self._course_id, self._session, group_id=self._group_id)
+
+    def shutdown(self):
+        """Before quitting: finish PDF encodes still running and write pending results."""
+        self._stop_worker()
+        for worker in self.findChildren(PdfEncodeWorker):
+            worker.wait()  # a running QThread must not be destroyed with its parent
+
+    def flush(self):
+        """Write any review results still waiting on the save timer."""
+        if self._save_timer.isActive():
+            self._write_session()
 
     # -- Regenerate -----------------------------------------------------------
 
     def _regenerate_card(self, slide_key: str, card: ReviewCard, old_item: ReviewItem):
         card.set_loading()
-        from src.services.note_parser import ParsedNote
         note = ParsedNote(note_type=old_item.note_type, text=old_item.original)
-        slides = {slide_key: [note]}
+        origin = self._origin()
 
-        provider = self._make_provider()
-        worker = ReviewWorker(provider, self._pdf_base64, slides)
+        def replace(slide: SlideData, new_item: ReviewItem):
+            for i, r in enumerate(slide.review):
+                if r.original == old_item.original and r.note_type == old_item.note_type:
+                    slide.review[i] = new_item
+                    break
 
-        def on_done(sk, items):
-            if items:
+        def on_done(items):
+            if not items:
+                return
+            if self._apply_result(origin, slide_key, lambda slide: replace(slide, items[0])):
                 card.set_response(items[0].response)
-                if self._session and sk in self._session.slides:
-                    review_list = self._session.slides[sk].review
-                    for i, r in enumerate(review_list):
-                        if r.original == old_item.original and r.note_type == old_item.note_type:
-                            review_list[i] = items[0]
-                            break
-                    storage.save_session(self._course_id, self._session, group_id=self._group_id)
-
-        def on_error(sk, msg):
-            card.set_error(msg)
-
-        worker.slide_reviewed.connect(on_done)
-        worker.slide_error.connect(on_error)
-        card._regen_worker = worker
-        worker.start()
+
+        run_llm_task(
+            self._get_provider().review_notes, self._pdf_base64, int(slide_key), [note],
+            done=on_done, error=partial(self._on_card_error, origin, card.set_error),
+        )
 
     # -- Follow-up conversations -----------------------------------------------
 
     def _on_followup(self, slide_key: str, card, item_idx: int, question: str):
-        if not self._session or slide_key not in self._session.slides:
+        slide = self._slide(slide_key)
+        if slide is None:
             return
-        item = self._session.slides[slide_key].review[item_idx]
-        provider = self._make_provider()
-        worker = FollowupWorker(
-            provider, self._pdf_base64, int(slide_key),
+        item = slide.review[item_idx]
+        origin = self._origin()
+        run_llm_task(
+            self._get_provider().follow_up, self._pdf_base64, int(slide_key),
             item.note_type, item.original, item.response,
             item.followups, question,
+            done=partial(self._on_followup_done, origin, slide_key, item_idx, card, question),
+            error=partial(self._on_card_error, origin, card.set_followup_error),
         )
-        worker.done.connect(
-            lambda ans, sk=slide_key, idx=item_idx, c=card, q=question:
-                self._on_followup_done(sk, idx, c, q, ans)
-        )
-        worker.error.connect(lambda msg, c=card: c.set_followup_error(msg))
-        card._followup_worker = worker
-        worker.start()
 
     def _on_followup_done(
-        self, slide_key: str, item_idx: int, card, question: str, answer: str
+        self, origin: _Origin, slide_key: str, item_idx: int, card, question: str, answer: str
     ):
+        def append(slide: SlideData):
+            if item_idx < len(slide.review):
+                followups = slide.review[item_idx].followups
+                followups.append(FollowupMessage(role="user", text=question))
+                followups.append(FollowupMessage(role="assistant", text=answer))
+
+        if not self._apply_result(origin, slide_key, append):
+            return
         card.add_followup_response(question, answer)
         # Scroll to bottom so the user can see the full response
-        from PySide6.QtCore import QTimer
         QTimer.singleShot(50, lambda: self._right_scroll.verticalScrollBar().setValue(
             self._right_scroll.verticalScrollBar().maximum()
         ))
-        if self._session and slide_key in self._session.slides:
-            item = self._session.slides[slide_key].review[item_idx]
-            item.followups.append(FollowupMessage(role="user", text=question))
-            item.followups.append(FollowupMessage(role="assistant", text=answer))
-            storage.save_session(self._course_id, self._session, group_id=self._group_id)
+
+    # -- Late results ---------------------------------------------------------
+
+    def _origin(self) -> _Origin:
+        return _Origin(self._session, self._course_id, self._lecture_id, self._group_id)
+
+    def _apply_result(self, origin: _Origin, slide_key: str, apply) -> bool:
+        """Write a regenerate/follow-up result into the lecture it was requested for.
+
+        Returns True if that load is still the one on screen, i.e. its cards are
+        alive and may be updated. Otherwise the result goes into the lecture as
+        currently held (the live session if it was reopened, else the stored one).
+        """
+        if origin.session is self._session:
+            slide = self._slide(slide_key)
+            if slide is not None:
+                apply(slide)
+                self._save_later()
+            return True
+        if (origin.course_id, origin.lecture_id, origin.group_id) == (
+            self._course_id, self._lecture_id, self._group_id
+        ):
+            slide = self._slide(slide_key)  # same lecture, opened again since
+            if slide is not None:
+                apply(slide)
+                self._save_later()
+            return False
+        try:
+            stored = storage.load_session(origin.course_id, origin.lecture_id, group_id=origin.group_id)
+        except OSError:
+            return False  # lecture deleted meanwhile
+        slide = stored.slides.get(slide_key)
+        if slide is not None:
+            apply(slide)
+            storage.save_session(origin.course_id, stored, group_id=origin.group_id)
+        return False
+
+    def _on_card_error(self, origin: _Origin, show_error, message: str):
+        if origin.session is self._session:  # else the card is gone with its load
+            show_error(message)
 
     # -- Navigation -----------------------------------------------------------
 
@@ -505,6 +682,18 @@ class ReviewView(QWidget):
 
     # -- Helpers --------------------------------------------------------------
 
+    def _slide(self, slide_key: str) -> SlideData | None:
+        """The loaded session's data for *slide_key*, if any."""
+        return self._session.slides.get(slide_key) if self._session else None
+
+    def _get_provider(self) -> LLMProvider:
+        """Reuse one provider (and its HTTP client) until the provider, key or model changes."""
+        args = (self._provider_name, self._api_key, self._model)
+        if self._provider is None or args != self._provider_args:
+            self._provider = self._make_provider()
+            self._provider_args = args
+        return self._provider
+
     def _make_provider(self) -> LLMProvider:
         if self._provider_name == "openai":
             return OpenAIProvider(self._api_key, self._model)
@@ -533,14 +722,30 @@ class ReviewView(QWidget):
                 return True
         return False
 
+    def _new_right_content(self):
+        """Give the right scroll area a fresh, empty content widget.
+
+        The old one (and everything still in it) goes in a single deleteLater.
+        """
+        old = self._right_scroll.takeWidget()
+        self._shown_key = None
+        self._right_content = QWidget()
+        self._right_content.setObjectName("reviewContent")
+        self._right_layout = QVBoxLayout(self._right_content)
+        self._right_layout.setContentsMargins(16, 16, 16, 16)
+        self._right_layout.setSpacing(12)
+        self._right_scroll.setWidget(self._right_content)
+        if old is not None:
+            old.deleteLater()
+
     def _show_right_error(self, message: str):
-        while self._right_layout.count():
-            item = self._right_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
+        self._show_right_message(message, "errorLabel")
+
+    def _show_right_message(self, message: str, object_name: str = "emptyLabel"):
+        """Replace the right panel's contents with a single centered label."""
+        self._new_right_content()
         label = QLabel(message)
-        label.setStyleSheet("color: #f38ba8;")
+        label.setObjectName(object_name)
         label.setWordWrap(True)
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._right_layout.addWidget(label)
@@ -3,17 +3,17 @@
 from __future__ import annotations
 
 from PySide6.QtWidgets import QPlainTextEdit
-from PySide6.QtCore import Signal, Qt, QTimer
+from PySide6.QtCore import Signal, Qt, QEvent, QTimer
 from PySide6.QtGui import (
     QColor,
     QFont,
+    QFontMetrics,
     QPainter,
     QSyntaxHighlighter,
     QTextBlockFormat,
     QTextCharFormat,
     QTextCursor,
 )
-import re
 
 # Catppuccin Mocha colors for markup symbols
 SYMBOL_COLORS = {
@@ -23,8 +23,22 @@ SYMBOL_COLORS = {
     "!": QColor("#f38ba8"),  # red — important
 }
 
+
+def _symbol_format(color: QColor) -> QTextCharFormat:
+    fmt = QTextCharFormat()
+    fmt.setForeground(color)
+    fmt.setFontWeight(QFont.Weight.Bold)
+    return fmt
+
+
+# Built once; the highlighter runs on every block after each keystroke
+_SYMBOL_FORMATS = {sym: _symbol_format(color) for sym, color in SYMBOL_COLORS.items()}
+
 GHOST_COLOR = QColor("#585b70")
 
+_LINE_SPACING = QTextBlockFormat()
+_LINE_SPACING.setLineHeight(160, 1)  # 1 = ProportionalHeight (160%)
+
 PLACEHOLDER_TEXT = (
     "  - your notes here\n"
     "  ? questions you have\n"
@@ -32,28 +46,21 @@ PLACEHOLDER_TEXT = (
     "  ! important stuff"
 )
 
+_PLACEHOLDER_LINES = tuple(PLACEHOLDER_TEXT.split("\n"))
+
 INLINE_HINT = "  - note  |  ? question  |  ~ unsure  |  ! important"
 
 
 class _NoteHighlighter(QSyntaxHighlighter):
     """Colors the leading markup symbol on each line."""
 
-    _pattern = re.compile(r"^(\s*)([-?~!])(\s?)")
-
     def highlightBlock(self, text: str):
-        m = self._pattern.match(text)
-        if not m:
-            return
-        sym = m.group(2)
-        color = SYMBOL_COLORS.get(sym)
-        if not color:
+        stripped = text.lstrip()
+        if not stripped:
             return
-        fmt = QTextCharFormat()
-        fmt.setForeground(color)
-        fmt.setFontWeight(QFont.Weight.Bold)
-        start = m.start(2)
-        length = m.end(2) - start
-        self.setFormat(start, length, fmt)
+        fmt = _SYMBOL_FORMATS.get(stripped[0])
+        if fmt is not None:
+            self.setFormat(len(text) - len(stripped), 1, fmt)
 
 
 class NotesEditor(QPlainTextEdit):
@@ -64,6 +71,9 @@ class NotesEditor(QPlainTextEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setPlaceholderText("")  # we paint our own
+        self._dirty = False  # text changed since set_notes / mark_clean
+        self._ghost = None  # last painted _ghost_state()
+        self._ghost_cache: tuple[QFont, QFontMetrics] | None = None  # reset on FontChange
         self._highlighter = _NoteHighlighter(self.document())
 
         # Auto-save debounce
@@ -73,16 +83,10 @@ class NotesEditor(QPlainTextEdit):
         self._save_timer.timeout.connect(lambda: self.notes_changed.emit(self.toPlainText()))
 
         # Extra line spacing
-        fmt = QTextBlockFormat()
-        fmt.setLineHeight(160, 1)  # 1 = ProportionalHeight (160%)
-        cursor = self.textCursor()
-        cursor.select(QTextCursor.SelectionType.Document)
-        cursor.mergeBlockFormat(fmt)
-        cursor.clearSelection()
-        self.setTextCursor(cursor)
+        self._set_spaced_text("")
 
         self.textChanged.connect(self._on_text_changed)
-        self.cursorPositionChanged.connect(lambda: self.viewport().update())
+        self.cursorPositionChanged.connect(self._update_ghost)
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Tab:
@@ -97,73 +101,91 @@ class NotesEditor(QPlainTextEdit):
 
     def focusInEvent(self, event):
         super().focusInEvent(event)
-        self.viewport().update()
+        self._update_ghost()
 
     def focusOutEvent(self, event):
         super().focusOutEvent(event)
-        self.viewport().update()
+        self._update_ghost()
 
-    def mouseReleaseEvent(self, event):
-        super().mouseReleaseEvent(event)
-        self.viewport().update()
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.ReadOnlyChange:
+            self._update_ghost()
+        elif event.type() == QEvent.Type.FontChange:
+            self._ghost_cache = None
 
     def _on_text_changed(self):
+        self._dirty = True
         self._save_timer.start()
-        self.viewport().update()  # repaint to toggle placeholder/hint visibility
+        self._update_ghost()
 
     # -- Ghost placeholder & inline hint ------------------------------------
 
+    def _ghost_state(self):
+        """What ghost text is due: None, "placeholder", or the inline hint's block number."""
+        if self.isReadOnly() or not self.hasFocus():
+            return None
+        if self.document().isEmpty():
+            return "placeholder"
+        cursor = self.textCursor()
+        if cursor.atBlockEnd() and not cursor.block().text().strip():
+            return cursor.blockNumber()
+        return None
+
+    def _update_ghost(self):
+        """Repaint only when the placeholder or hint appears, moves, or disappears."""
+        state = self._ghost_state()
+        if state != self._ghost:
+            self._ghost = state
+            self.viewport().update()
+
     def paintEvent(self, event):
         super().paintEvent(event)
 
-        if self.isReadOnly() or not self.hasFocus():
+        state = self._ghost_state()
+        if state is None:
             return
-
-        if self.toPlainText():
-            # If there's text, check if current line is empty for inline hint
-            cursor = self.textCursor()
-            block = cursor.block()
-            if block.text().strip() == "" and cursor.atBlockEnd():
-                self._paint_inline_hint(block)
-        else:
-            # No text at all — show full ghost placeholder
-            self._paint_placeholder()
-
-    def _ghost_font(self):
-        font = QFont(self.font())
-        font.setPointSize(max(font.pointSize() - 2, 8))
-        return font
-
-    def _paint_placeholder(self):
+        font, fm = self._ghost_font()
         painter = QPainter(self.viewport())
-        painter.setPen(GHOST_COLOR)
-        painter.setFont(self._ghost_font())
-
+        try:
+            painter.setPen(GHOST_COLOR)
+            painter.setFont(font)
+            if state == "placeholder":
+                # No text at all — show full ghost placeholder
+                self._draw_placeholder(painter, fm)
+            else:
+                # Current line is empty — inline hint
+                self._draw_inline_hint(painter, fm, self.textCursor().block())
+        finally:
+            painter.end()
+
+    def _ghost_font(self) -> tuple[QFont, QFontMetrics]:
+        """Ghost text font (two points smaller) and its metrics."""
+        if self._ghost_cache is None:
+            font = QFont(self.font())
+            font.setPointSize(max(font.pointSize() - 2, 8))
+            self._ghost_cache = (font, QFontMetrics(font))
+        return self._ghost_cache
+
+    def _draw_placeholder(self, painter: QPainter, fm: QFontMetrics):
         # Use the first block's geometry so ghost text aligns with real text
         block = self.document().firstBlock()
         rect = self.blockBoundingGeometry(block).translated(self.contentOffset())
         doc_margin = self.document().documentMargin()
-        fm = painter.fontMetrics()
         x = int(rect.left() + doc_margin)
         y = int(rect.top())
 
-        for line in PLACEHOLDER_TEXT.split("\n"):
+        for line in _PLACEHOLDER_LINES:
             painter.drawText(x, y + fm.ascent(), line)
             y += fm.lineSpacing()
-        painter.end()
 
-    def _paint_inline_hint(self, block):
+    def _draw_inline_hint(self, painter: QPainter, fm: QFontMetrics, block):
         rect = self.blockBoundingGeometry(block).translated(self.contentOffset())
         if rect.height() <= 0:
             return
-        painter = QPainter(self.viewport())
-        painter.setPen(GHOST_COLOR)
-        painter.setFont(self._ghost_font())
-        fm = painter.fontMetrics()
         x = int(rect.left() + self.document().documentMargin())
         y = int(rect.top() + fm.ascent())
         painter.drawText(x, y, INLINE_HINT)
-        painter.end()
 
     # -- Public API ---------------------------------------------------------
 
@@ -171,19 +193,33 @@ class NotesEditor(QPlainTextEdit):
         """Set editor content without triggering the save signal."""
         self._save_timer.stop()
         self.blockSignals(True)
-        self.setPlainText(text)
-        self._apply_line_spacing()
+        self._set_spaced_text(text)
         self.blockSignals(False)
-        self.viewport().update()
-
-    def _apply_line_spacing(self):
-        fmt = QTextBlockFormat()
-        fmt.setLineHeight(160, 1)  # 1 = ProportionalHeight (160%)
-        cursor = self.textCursor()
-        cursor.select(QTextCursor.SelectionType.Document)
-        cursor.mergeBlockFormat(fmt)
-        cursor.clearSelection()
+        self._dirty = False
+        self._update_ghost()  # cursorPositionChanged was blocked
+
+    def _set_spaced_text(self, text: str):
+        """Replace the text with every block at 160% line height, cursor at the end.
+
+        The spacing goes on the empty first block before inserting, so each
+        new line inherits it instead of a second pass over the whole document.
+        """
+        doc = self.document()
+        doc.setUndoRedoEnabled(False)  # like setPlainText: no undo into the previous slide
+        self.setPlainText("")
+        cursor = QTextCursor(doc)
+        cursor.setBlockFormat(_LINE_SPACING)
+        cursor.insertText(text)
+        doc.setUndoRedoEnabled(True)
         self.setTextCursor(cursor)
 
     def get_notes(self) -> str:
         return self.toPlainText()
+
+    def is_dirty(self) -> bool:
+        """True if the user edited the text since it was last set or saved."""
+        return self._dirty
+
+    def mark_clean(self):
+        """Called once the current text has been taken for saving."""
+        self._dirty = False
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import html
+import threading
+from functools import lru_cache
+
 import markdown as md_lib
 
 from PySide6.QtWidgets import (
@@ -14,7 +18,7 @@ from PySide6.QtWidgets import (
     QFrame,
     QSizePolicy,
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import QObject, QRunnable, QSizeF, QThreadPool, QTimer, Signal, Slot, Qt
 
 from src.models.session import FollowupMessage
 
@@ -46,17 +50,103 @@ h1,h2,h3   { color: #cba6f7; margin: 8px 0 4px 0; }
 </style>
 """
 
+# Card chrome lives in one sheet set by the view that hosts the cards, parsed
+# once instead of per card and per child widget. Children are matched by
+# objectName, and by role / noteType / state properties. Every rule is scoped
+# under ReviewCard, which also lets it win ties with the host's own
+# descendant rules (later rule wins).
+
+def _build_card_qss() -> str:
+    subtle = 'ReviewCard QPushButton[role="subtle"]'
+    rules = [
+        "ReviewCard QLabel#cardBadge { font-weight: bold; font-size: 18pt; "
+        "background-color: #313244; border-radius: 4px; padding: 2px; }",
+        "ReviewCard QLabel#cardNote { color: #cdd6f4; }",
+        'ReviewCard QLabel#cardResponse[state="loading"] { color: #585b70; }',
+        'ReviewCard QLabel#cardResponse[state="ok"] { color: #cdd6f4; }',
+        'ReviewCard QLabel#cardResponse[state="error"] { color: #f38ba8; }',
+        "ReviewCard QLabel#followupQuestion { color: #585b70; }",
+        "ReviewCard QLabel#followupError { color: #f38ba8; }",
+        "ReviewCard QFrame#cardSep { color: #313244; border: none; "
+        "background-color: #313244; max-height: 1px; }",
+        f"{subtle} {{ padding: 2px 10px; color: #585b70; border: 1px solid #45475a; border-radius: 4px; }}",
+        f"{subtle}:hover {{ color: #cdd6f4; border-color: #89b4fa; }}",
+        "ReviewCard QPushButton#sendButton { padding: 4px 12px; color: #89b4fa; "
+        "border: 1px solid #45475a; border-radius: 4px; }",
+        "ReviewCard QPushButton#sendButton:hover { background-color: #313244; }",
+        "ReviewCard QPushButton#sendButton:disabled { color: #45475a; border-color: #313244; }",
+        "ReviewCard QTextEdit#followupInput { background-color: #313244; border: 1px solid #45475a; "
+        "border-radius: 4px; padding: 4px 8px; color: #cdd6f4; }",
+        "ReviewCard QTextEdit#followupInput:focus { border-color: #89b4fa; }",
+    ]
+    for note_type, color in TYPE_COLORS.items():
+        rules += [
+            f'ReviewCard QLabel#cardBadge[noteType="{note_type}"] {{ color: {color}; }}',
+            f'ReviewCard QLabel#cardNote[noteType="{note_type}"] {{ color: {color}; }}',
+        ]
+    return "\n".join(rules)
+
+
+REVIEW_CARD_QSS = _build_card_qss()
+
+
+def _set_state(widget: QWidget, state: str):
+    """Switch a widget's "state" property and re-apply the rules that depend on it."""
+    if widget.property("state") != state:
+        widget.setProperty("state", state)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+
+# Longer responses are shown as plain text; markdown + rich-text layout on
+# text this size stalls the UI thread
+_MARKDOWN_MAX_CHARS = 20_000
+
+# Follow-up answers past this length start collapsed behind "Show more"
+_FOLLOWUP_PREVIEW_CHARS = 5_000
+
+# One converter for every card; reset() clears per-document state between calls.
+# Restored follow-ups are converted on a worker thread, hence the lock.
+_MD = md_lib.Markdown(extensions=["fenced_code", "nl2br"])
+_MD_LOCK = threading.Lock()
+
+_ANSWER_PLACEHOLDER = "Loading..."
+
+
+@lru_cache(maxsize=512)
 def _to_html(text: str) -> str:
-    body = md_lib.markdown(text, extensions=["fenced_code", "nl2br"])
+    """Markdown -> HTML for a response; cached since restored cards replay the same text."""
+    if len(text) > _MARKDOWN_MAX_CHARS:
+        return _RESPONSE_CSS + '<p style="white-space: pre-wrap;">' + html.escape(text) + "</p>"
+    with _MD_LOCK:
+        body = _MD.reset().convert(text)
     return _RESPONSE_CSS + body
 
 
+class _MarkdownSignals(QObject):
+    converted = Signal(int, str)  # answer index, html
+
+
+class _MarkdownTask(QRunnable):
+    """Convert restored follow-up answers to HTML and hand each back to the GUI thread."""
+
+    def __init__(self, first_index: int, texts: list[str]):
+        super().__init__()
+        self.signals = _MarkdownSignals()
+        self._first_index = first_index
+        self._texts = texts
+
+    def run(self):
+        for i, text in enumerate(self._texts):
+            self.signals.converted.emit(self._first_index + i, _to_html(text))
+
+
 def _make_sep() -> QFrame:
     """Return a subtle horizontal rule styled for the dark theme."""
     sep = QFrame()
     sep.setFrameShape(QFrame.Shape.HLine)
     sep.setFrameShadow(QFrame.Shadow.Plain)
-    sep.setStyleSheet("color: #313244; border: none; background-color: #313244; max-height: 1px;")
+    sep.setObjectName("cardSep")
     sep.setFixedHeight(1)
     return sep
 
@@ -78,21 +168,31 @@ class _FollowupInput(QTextEdit):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self._want_h: int = _MIN_INPUT_H
+        self._next_h: int = _MIN_INPUT_H
+        self._geometry_pending = False
         self.document().documentLayout().documentSizeChanged.connect(
             self._on_doc_size_changed
         )
 
     # -- Dynamic height -------------------------------------------------
 
-    def _on_doc_size_changed(self, new_size):
+    @Slot(QSizeF)
+    def _on_doc_size_changed(self, new_size: QSizeF):
         # Measure border+padding from live geometry so we never have to
         # hard-code what the stylesheet contributes.
         overhead = self.height() - self.viewport().height()
         if overhead <= 0:
             overhead = 10  # fallback before first show: 1px border×2 + 4px padding×2
-        h = max(_MIN_INPUT_H, min(_MAX_INPUT_H, int(new_size.height()) + overhead))
-        if h != self._want_h:
-            self._want_h = h
+        self._next_h = max(_MIN_INPUT_H, min(_MAX_INPUT_H, int(new_size.height()) + overhead))
+        # A paste or fast typing emits a burst of size changes; relayout once
+        if self._next_h != self._want_h and not self._geometry_pending:
+            self._geometry_pending = True
+            QTimer.singleShot(0, self._flush_geometry)
+
+    def _flush_geometry(self):
+        self._geometry_pending = False
+        if self._next_h != self._want_h:
+            self._want_h = self._next_h
             self.updateGeometry()
 
     def sizeHint(self):
@@ -116,7 +216,10 @@ class _FollowupInput(QTextEdit):
 
 
 class ReviewCard(QWidget):
-    """Single note + Claude response card with regenerate and follow-up support."""
+    """Single note + Claude response card with regenerate and follow-up support.
+
+    Styled by REVIEW_CARD_QSS, which the hosting view sets on an ancestor.
+    """
 
     regenerate_requested = Signal()
     followup_submitted = Signal(str)  # question text
@@ -125,11 +228,11 @@ class ReviewCard(QWidget):
         super().__init__(parent)
         self._note_type = note_type
         self._original_text = original_text
+        self._restored_answers: list[QLabel] = []  # filled in by _MarkdownTask
         self._init_ui()
         self.set_loading()
 
     def _init_ui(self):
-        color = TYPE_COLORS.get(self._note_type, "#cdd6f4")
         symbol = TYPE_SYMBOLS.get(self._note_type, "-")
 
         layout = QVBoxLayout(self)
@@ -143,15 +246,15 @@ class ReviewCard(QWidget):
         badge = QLabel(symbol)
         badge.setFixedWidth(24)
         badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        badge.setStyleSheet(
-            f"color: {color}; font-weight: bold; font-size: 18pt; "
-            f"background-color: #313244; border-radius: 4px; padding: 2px;"
-        )
+        badge.setObjectName("cardBadge")
+        badge.setProperty("noteType", self._note_type)
         header.addWidget(badge)
 
         note_label = QLabel(self._original_text)
+        note_label.setTextFormat(Qt.TextFormat.PlainText)  # user text, never markup
         note_label.setWordWrap(True)
-        note_label.setStyleSheet(f"color: {color};")
+        note_label.setObjectName("cardNote")
+        note_label.setProperty("noteType", self._note_type)
         note_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         header.addWidget(note_label, 1)
 
@@ -162,6 +265,7 @@ class ReviewCard(QWidget):
 
         # -- Response area --
         self._response = QLabel()
+        self._response.setObjectName("cardResponse")
         self._response.setWordWrap(True)
         self._response.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
         self._response.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
@@ -174,19 +278,13 @@ class ReviewCard(QWidget):
         btn_row.addStretch()
 
         self._regen_btn = QPushButton("Regenerate")
-        self._regen_btn.setStyleSheet(
-            "QPushButton { padding: 2px 10px; color: #585b70; border: 1px solid #45475a; border-radius: 4px; }"
-            "QPushButton:hover { color: #cdd6f4; border-color: #89b4fa; }"
-        )
+        self._regen_btn.setProperty("role", "subtle")
         self._regen_btn.clicked.connect(self.regenerate_requested.emit)
         self._regen_btn.hide()
         btn_row.addWidget(self._regen_btn)
 
         self._followup_btn = QPushButton("Follow up")
-        self._followup_btn.setStyleSheet(
-            "QPushButton { padding: 2px 10px; color: #585b70; border: 1px solid #45475a; border-radius: 4px; }"
-            "QPushButton:hover { color: #cdd6f4; border-color: #89b4fa; }"
-        )
+        self._followup_btn.setProperty("role", "subtle")
         self._followup_btn.clicked.connect(self._toggle_followup)
         self._followup_btn.hide()
         btn_row.addWidget(self._followup_btn)
@@ -210,61 +308,55 @@ class ReviewCard(QWidget):
 
         self._followup_input = _FollowupInput()
         self._followup_input.setPlaceholderText("Ask a follow-up question...")
-        self._followup_input.setStyleSheet(
-            "QTextEdit { background-color: #313244; border: 1px solid #45475a; "
-            "border-radius: 4px; padding: 4px 8px; color: #cdd6f4; }"
-            "QTextEdit:focus { border-color: #89b4fa; }"
-        )
+        self._followup_input.setObjectName("followupInput")
         self._followup_input.submitted.connect(self._submit_followup)
         input_row.addWidget(self._followup_input, 1)
 
         self._send_btn = QPushButton("Send")
-        self._send_btn.setStyleSheet(
-            "QPushButton { padding: 4px 12px; color: #89b4fa; border: 1px solid #45475a; border-radius: 4px; }"
-            "QPushButton:hover { background-color: #313244; }"
-            "QPushButton:disabled { color: #45475a; border-color: #313244; }"
-        )
+        self._send_btn.setObjectName("sendButton")
         self._send_btn.clicked.connect(self._submit_followup)
         input_row.addWidget(self._send_btn)
 
         fu_layout.addLayout(input_row)
 
         self._followup_error = QLabel()
-        self._followup_error.setStyleSheet("color: #f38ba8;")
+        self._followup_error.setTextFormat(Qt.TextFormat.PlainText)
+        self._followup_error.setObjectName("followupError")
         self._followup_error.setWordWrap(True)
         self._followup_error.hide()
         fu_layout.addWidget(self._followup_error)
 
         layout.addWidget(self._followup_area)
 
-        self.setStyleSheet(
-            "ReviewCard { background-color: #181825; border-radius: 8px; }"
-        )
-
     def set_loading(self):
-        self._response.setStyleSheet("color: #585b70;")
+        _set_state(self._response, "loading")
+        self._response.setTextFormat(Qt.TextFormat.PlainText)
         self._response.setText("Reviewing...")
         self._regen_btn.hide()
         self._followup_btn.hide()
 
     def set_response(self, text: str):
-        self._response.setStyleSheet("color: #cdd6f4;")
+        _set_state(self._response, "ok")
+        self._response.setTextFormat(Qt.TextFormat.RichText)
         self._response.setText(_to_html(text))
         self._regen_btn.show()
         self._followup_btn.show()
 
     def set_error(self, message: str):
-        self._response.setStyleSheet("color: #f38ba8;")
+        _set_state(self._response, "error")
+        self._response.setTextFormat(Qt.TextFormat.PlainText)
         self._response.setText(f"Error: {message}")
         self._regen_btn.show()
         self._regen_btn.setText("Retry")
 
+    @Slot()
     def _toggle_followup(self):
         visible = self._followup_area.isVisible()
         self._followup_area.setVisible(not visible)
         if not visible:
             self._followup_input.setFocus()
 
+    @Slot()
     def _submit_followup(self):
         text = self._followup_input.toPlainText().strip()  # toPlainText works on QTextEdit
         if not text:
@@ -280,6 +372,7 @@ class ReviewCard(QWidget):
         if not followups:
             return
         self._followup_area.show()
+        pending: list[tuple[QLabel, str]] = []
         i = 0
         while i < len(followups):
             user_msg = followups[i]
@@ -287,8 +380,20 @@ class ReviewCard(QWidget):
             if user_msg.role == "user":
                 question = user_msg.text
                 answer = asst_msg.text if asst_msg and asst_msg.role == "assistant" else ""
-                self._append_exchange(question, answer)
+                self._append_exchange(question, answer, pending)
             i += 2
+        if pending:
+            # The thread shows up at once; answers fill in as their markdown is converted
+            task = _MarkdownTask(len(self._restored_answers), [text for _, text in pending])
+            self._restored_answers.extend(label for label, _ in pending)
+            task.signals.converted.connect(self._on_answer_converted)
+            QThreadPool.globalInstance().start(task)
+
+    @Slot(int, str)
+    def _on_answer_converted(self, index: int, html_text: str):
+        label = self._restored_answers[index]
+        if label.text() == _ANSWER_PLACEHOLDER:  # not already expanded via "Show more"
+            label.setText(html_text)
 
     def add_followup_response(self, question: str, answer: str):
         """Append a new completed exchange and re-enable the input."""
@@ -305,23 +410,51 @@ class ReviewCard(QWidget):
         self._send_btn.setEnabled(True)
         self._send_btn.setText("Send")
 
-    def _append_exchange(self, question: str, answer: str):
+    def _append_exchange(
+        self, question: str, answer: str, pending: list[tuple[QLabel, str]] | None = None
+    ):
+        """Add a question/answer pair to the thread.
+
+        With *pending*, the answer label shows a placeholder and is queued there
+        with the text to convert, instead of running markdown here.
+        """
         container = QWidget()
         c_layout = QVBoxLayout(container)
         c_layout.setContentsMargins(0, 0, 0, 0)
         c_layout.setSpacing(4)
 
         q_label = QLabel(f"You: {question}")
+        q_label.setTextFormat(Qt.TextFormat.PlainText)
         q_label.setWordWrap(True)
-        q_label.setStyleSheet("color: #585b70;")
+        q_label.setObjectName("followupQuestion")
         q_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         c_layout.addWidget(q_label)
 
         a_label = QLabel()
+        a_label.setTextFormat(Qt.TextFormat.RichText)
         a_label.setWordWrap(True)
         a_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
         a_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        a_label.setText(_to_html(answer))
         c_layout.addWidget(a_label)
 
+        shown = answer
+        if len(answer) > _FOLLOWUP_PREVIEW_CHARS:
+            # Lay out only a preview; the full answer is rendered on demand
+            shown = answer[:_FOLLOWUP_PREVIEW_CHARS] + "…"
+            more_btn = QPushButton("Show more")
+            more_btn.setProperty("role", "subtle")
+
+            def expand():
+                a_label.setText(_to_html(answer))
+                more_btn.deleteLater()
+
+            more_btn.clicked.connect(expand)
+            c_layout.addWidget(more_btn, 0, Qt.AlignmentFlag.AlignLeft)
+
+        if pending is None:
+            a_label.setText(_to_html(shown))
+        else:
+            a_label.setText(_ANSWER_PLACEHOLDER)
+            pending.append((a_label, shown))
+
         self._thread_layout.addWidget(container)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
 
-from PySide6.QtCore import QSize, Signal, Qt
-from PySide6.QtGui import QPixmap, QPainter, QColor, QPen
+from PySide6.QtCore import QObject, QRunnable, QSize, QSizeF, QThreadPool, Signal, Slot, Qt, QTimer
+from PySide6.QtGui import QImage, QPixmap, QPainter, QColor, QPen
 from PySide6.QtPdf import QPdfDocument
 from PySide6.QtWidgets import (
     QLabel,
@@ -19,6 +20,11 @@ THUMB_HEIGHT = 80
 THUMB_BORDER_ACTIVE = "#89b4fa"
 THUMB_BORDER_INACTIVE = "#313244"
 CAROUSEL_BG = "#11111b"
+_THUMB_QSS_ACTIVE = f"border: 2px solid {THUMB_BORDER_ACTIVE}; border-radius: 3px; padding: 1px;"
+_THUMB_QSS_INACTIVE = f"border: 2px solid {THUMB_BORDER_INACTIVE}; border-radius: 3px; padding: 1px;"
+PAGE_CACHE_SIZE = 8  # full-size page pixmaps kept for paging back and forth
+THUMB_MAX_DPR = 1.25  # thumbnails are tiny; finer rasters aren't visible
+THUMB_CACHE_DECKS = 3  # recently shown decks whose thumbnails are kept
 
 
 class _Thumbnail(QLabel):
@@ -32,15 +38,14 @@ class _Thumbnail(QLabel):
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setFixedHeight(THUMB_HEIGHT)
-        self.setStyleSheet(
-            f"border: 2px solid {THUMB_BORDER_INACTIVE}; border-radius: 3px; padding: 1px;"
-        )
+        self._active = False
+        self.setStyleSheet(_THUMB_QSS_INACTIVE)
 
     def set_active(self, active: bool):
-        color = THUMB_BORDER_ACTIVE if active else THUMB_BORDER_INACTIVE
-        self.setStyleSheet(
-            f"border: 2px solid {color}; border-radius: 3px; padding: 1px;"
-        )
+        if active == self._active:
+            return  # unchanged; skip the stylesheet re-parse and repolish
+        self._active = active
+        self.setStyleSheet(_THUMB_QSS_ACTIVE if active else _THUMB_QSS_INACTIVE)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -48,6 +53,53 @@ class _Thumbnail(QLabel):
         super().mousePressEvent(event)
 
 
+class _PrefetchRenderer:
+    """Private QPdfDocument for the prefetch thread.
+
+    Only ever touched from the viewer's single-thread prefetch pool, so
+    background renders never share state with the document on screen.
+    """
+
+    def __init__(self):
+        self._doc: QPdfDocument | None = None
+        self._path = ""
+
+    def render(self, path: str, page: int, size: QSize) -> QImage | None:
+        if self._doc is None:
+            self._doc = QPdfDocument()
+        if path != self._path:
+            self._doc.close()
+            self._doc.load(path)
+            self._path = path
+        if self._doc.status() != QPdfDocument.Status.Ready:
+            return None
+        return self._doc.render(page, size)
+
+
+class _PrefetchSignals(QObject):
+    rendered = Signal(str, int, QSize, QImage)  # pdf path, page index, requested size, image (null on failure)
+
+
+class _PrefetchTask(QRunnable):
+    """Render one page ahead of time and hand the image back to the GUI thread.
+
+    Always emits, with a null image if the page couldn't be rendered, so the
+    viewer can forget the request either way.
+    """
+
+    def __init__(self, renderer: _PrefetchRenderer, path: str, page: int, size: QSize):
+        super().__init__()
+        self.signals = _PrefetchSignals()
+        self._renderer = renderer
+        self._path = path
+        self._page = page
+        self._size = size
+
+    def run(self):
+        image = self._renderer.render(self._path, self._page, self._size)
+        self.signals.rendered.emit(self._path, self._page, self._size, image or QImage())
+
+
 class SlideViewer(QWidget):
     """Renders a single PDF page at a time, scaled to fit the available space."""
 
@@ -57,7 +109,31 @@ class SlideViewer(QWidget):
         super().__init__(parent)
         self._doc = QPdfDocument(self)
         self._current_page = 0
+        self._path = ""  # file behind self._doc
+        self._page_sizes: list[QSizeF] = []  # point sizes, read once when the document is ready
         self._thumbnails: list[_Thumbnail] = []
+        self._page_cache: OrderedDict[tuple[int, int, int], QPixmap] = OrderedDict()
+        self._prefetching: set[tuple[int, int, int]] = set()
+        self._prefetcher = _PrefetchRenderer()
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(1)  # the renderer's document is not shared
+        # A drag-resize fires many resizeEvents; only rasterize the size it settles on
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(80)
+        self._resize_timer.timeout.connect(self._render)
+        # Thumbnails are rendered once they scroll into view (coalesced)
+        self._thumb_sizes: list[QSize | None] = []  # device-pixel render size per page
+        self._thumbs_requested: set[int] = set()
+        self._active_thumb = -1  # index of the highlighted thumbnail, -1 if none
+        # Rendered thumbnails per (path, page count, dpr), so switching back to
+        # a recent lecture doesn't re-rasterize its strip
+        self._thumb_cache: OrderedDict[tuple[str, int, float], dict[int, QPixmap]] = OrderedDict()
+        self._thumb_pixmaps: dict[int, QPixmap] = {}  # entry for the current deck
+        self._thumb_timer = QTimer(self)
+        self._thumb_timer.setSingleShot(True)
+        self._thumb_timer.setInterval(30)
+        self._thumb_timer.timeout.connect(self._render_visible_thumbnails)
         self._init_ui()
         self._doc.statusChanged.connect(self._on_status_changed)
 
@@ -90,23 +166,31 @@ class SlideViewer(QWidget):
         self._carousel_scroll.setFixedHeight(THUMB_HEIGHT)
         self._carousel_scroll.setStyleSheet(f"background-color: {CAROUSEL_BG};")
         carousel_outer.addWidget(self._carousel_scroll)
-
-        self._carousel_container = QWidget()
-        self._carousel_container.setStyleSheet(f"background-color: {CAROUSEL_BG};")
-        self._carousel_layout = QHBoxLayout(self._carousel_container)
-        self._carousel_layout.setContentsMargins(0, 0, 0, 0)
-        self._carousel_layout.setSpacing(6)
-        self._carousel_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._carousel_scroll.setWidget(self._carousel_container)
+        self._new_carousel_container()
+        # (a lambda, since valueChanged's int would reach QTimer.start(msec))
+        self._carousel_scroll.horizontalScrollBar().valueChanged.connect(
+            lambda _value: self._thumb_timer.start()
+        )
 
         layout.addWidget(carousel_wrapper)
 
     # -- Public API --
 
     def load_pdf(self, path: str | Path):
+        path = str(path)
+        if path == self._path and self._doc.status() == QPdfDocument.Status.Ready:
+            # Reopening the same lecture — keep the parsed document and thumbnails
+            self._current_page = 0
+            self._render()
+            self._update_carousel()
+            self.page_changed.emit(self._current_page)
+            return
         self._doc.close()
+        self._page_cache.clear()
+        self._prefetching.clear()
         self._current_page = 0
-        self._doc.load(str(path))
+        self._path = path
+        self._doc.load(path)
 
     @property
     def current_page(self) -> int:
@@ -116,6 +200,7 @@ class SlideViewer(QWidget):
     def page_count(self) -> int:
         return self._doc.pageCount()
 
+    @Slot()
     def next_page(self):
         if self._current_page < self._doc.pageCount() - 1:
             self._current_page += 1
@@ -123,6 +208,7 @@ class SlideViewer(QWidget):
             self._update_carousel()
             self.page_changed.emit(self._current_page)
 
+    @Slot()
     def prev_page(self):
         if self._current_page > 0:
             self._current_page -= 1
@@ -130,6 +216,7 @@ class SlideViewer(QWidget):
             self._update_carousel()
             self.page_changed.emit(self._current_page)
 
+    @Slot(int)
     def go_to_page(self, page: int):
         if 0 <= page < self._doc.pageCount() and page != self._current_page:
             self._current_page = page
@@ -139,27 +226,30 @@ class SlideViewer(QWidget):
 
     # -- Internal --
 
+    @Slot(QPdfDocument.Status)
     def _on_status_changed(self, status):
         if status == QPdfDocument.Status.Ready:
+            self._page_sizes = [self._doc.pagePointSize(i) for i in range(self._doc.pageCount())]
             self._build_carousel()
             self._render()
             self._update_carousel()
             self.page_changed.emit(self._current_page)
         elif status == QPdfDocument.Status.Null:
+            self._page_sizes = []
             self._label.clear()
             self._clear_carousel()
 
-    def _render(self):
-        if self._doc.status() != QPdfDocument.Status.Ready:
-            return
-
+    def _render_size(self, page: int) -> QSize | None:
+        """Device-pixel size that fits *page* into the label, or None if it can't be drawn yet."""
         available = self._label.size()
         if available.width() <= 0 or available.height() <= 0:
-            return
+            return None
 
-        page_size = self._doc.pagePointSize(self._current_page)
+        if page >= len(self._page_sizes):
+            return None
+        page_size = self._page_sizes[page]
         if page_size.width() <= 0 or page_size.height() <= 0:
-            return
+            return None
 
         # Scale to fit while preserving aspect ratio
         dpr = self.devicePixelRatioF()
@@ -167,28 +257,93 @@ class SlideViewer(QWidget):
             available.width() / page_size.width(),
             available.height() / page_size.height(),
         )
-        render_size = QSize(
+        return QSize(
             int(page_size.width() * scale * dpr),
             int(page_size.height() * scale * dpr),
         )
 
-        image = self._doc.render(self._current_page, render_size)
-        pixmap = QPixmap.fromImage(image)
-        pixmap.setDevicePixelRatio(dpr)
+    @Slot()
+    def _render(self):
+        if self._doc.status() != QPdfDocument.Status.Ready:
+            return
+        render_size = self._render_size(self._current_page)
+        if render_size is None:
+            return
+
+        key = (self._current_page, render_size.width(), render_size.height())
+        pixmap = self._page_cache.get(key)
+        if pixmap is None:
+            image = self._doc.render(self._current_page, render_size)
+            pixmap = self._cache_page(key, image)
+        else:
+            self._page_cache.move_to_end(key)
         self._label.setPixmap(pixmap)
+        self._prefetch_neighbours()
+
+    def _cache_page(self, key: tuple[int, int, int], image: QImage) -> QPixmap:
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self._page_cache[key] = pixmap
+        if len(self._page_cache) > PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+        return pixmap
+
+    def _prefetch_neighbours(self):
+        """Render the pages either side of the current one on the prefetch thread."""
+        for page in (self._current_page + 1, self._current_page - 1):
+            if not 0 <= page < self._doc.pageCount():
+                continue
+            size = self._render_size(page)
+            if size is None:
+                continue
+            key = (page, size.width(), size.height())
+            if key in self._page_cache or key in self._prefetching:
+                continue
+            self._prefetching.add(key)
+            task = _PrefetchTask(self._prefetcher, self._path, page, size)
+            task.signals.rendered.connect(self._on_prefetched)
+            self._prefetch_pool.start(task)
+
+    @Slot(str, int, QSize, QImage)
+    def _on_prefetched(self, path: str, page: int, size: QSize, image: QImage):
+        key = (page, size.width(), size.height())
+        self._prefetching.discard(key)
+        if image.isNull():
+            return  # failed; the key is free to be requested again
+        if path == self._path and key not in self._page_cache:
+            self._cache_page(key, image)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._render()
+        self._resize_timer.start()
+        self._thumb_timer.start()  # a wider strip may reveal more thumbnails
 
     # -- Carousel --
 
+    def _new_carousel_container(self):
+        """Give the carousel a fresh, empty container widget.
+
+        The old one takes its thumbnails with it in a single deleteLater.
+        """
+        old = self._carousel_scroll.takeWidget()
+        self._carousel_container = QWidget()
+        self._carousel_container.setStyleSheet(f"background-color: {CAROUSEL_BG};")
+        self._carousel_layout = QHBoxLayout(self._carousel_container)
+        self._carousel_layout.setContentsMargins(0, 0, 0, 0)
+        self._carousel_layout.setSpacing(6)
+        self._carousel_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._carousel_scroll.setWidget(self._carousel_container)
+        if old is not None:
+            old.deleteLater()
+
     def _clear_carousel(self):
-        self._thumbnails.clear()
-        while self._carousel_layout.count():
-            item = self._carousel_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self._thumb_sizes.clear()
+        self._thumbs_requested.clear()
+        self._thumb_pixmaps = {}
+        self._active_thumb = -1
+        if self._thumbnails:
+            self._thumbnails.clear()
+            self._new_carousel_container()
 
     def _build_carousel(self):
         self._clear_carousel()
@@ -196,13 +351,16 @@ class SlideViewer(QWidget):
         if total <= 0:
             return
 
-        dpr = self.devicePixelRatioF()
+        # Size every thumbnail up front (no rendering) so the strip's layout is
+        # final; pixmaps are filled in as thumbnails scroll into view
+        dpr = self._thumb_dpr()
+        self._thumb_pixmaps = self._cached_thumbnails((self._path, total, dpr))
         for i in range(total):
             thumb = _Thumbnail(i, self._carousel_container)
             thumb.clicked.connect(self.go_to_page)
 
-            # Render thumbnail
-            page_size = self._doc.pagePointSize(i)
+            render_size = None
+            page_size = self._page_sizes[i]
             if page_size.width() > 0 and page_size.height() > 0:
                 thumb_h = THUMB_HEIGHT - 6  # account for border/padding
                 scale = thumb_h / page_size.height()
@@ -213,17 +371,70 @@ class SlideViewer(QWidget):
                     int(page_size.width() * scale * dpr),
                     int(page_size.height() * scale * dpr),
                 )
-                image = self._doc.render(i, render_size)
-                pixmap = QPixmap.fromImage(image)
-                pixmap.setDevicePixelRatio(dpr)
-                thumb.setPixmap(pixmap)
+
+            cached = self._thumb_pixmaps.get(i)
+            if cached is not None:
+                thumb.setPixmap(cached)
+                self._thumbs_requested.add(i)
 
             self._carousel_layout.addWidget(thumb)
             self._thumbnails.append(thumb)
+            self._thumb_sizes.append(render_size)
+        self._thumb_timer.start()
+
+    def _thumb_dpr(self) -> float:
+        return min(self.devicePixelRatioF(), THUMB_MAX_DPR)
+
+    def _cached_thumbnails(self, key: tuple[str, int, float]) -> dict[int, QPixmap]:
+        """The thumbnail pixmaps kept for a deck, most-recently-used last."""
+        pixmaps = self._thumb_cache.get(key)
+        if pixmaps is None:
+            pixmaps = self._thumb_cache[key] = {}
+            while len(self._thumb_cache) > THUMB_CACHE_DECKS:
+                self._thumb_cache.popitem(last=False)
+        else:
+            self._thumb_cache.move_to_end(key)
+        return pixmaps
+
+    @Slot()
+    def _render_visible_thumbnails(self):
+        """Queue background renders for thumbnails inside the carousel's viewport."""
+        if not self._thumbnails:
+            return
+        left = self._carousel_scroll.horizontalScrollBar().value()
+        right = left + self._carousel_scroll.viewport().width()
+        for i, thumb in enumerate(self._thumbnails):
+            if i in self._thumbs_requested or self._thumb_sizes[i] is None:
+                continue
+            geo = thumb.geometry()
+            if geo.right() < left or geo.left() > right:
+                continue
+            self._thumbs_requested.add(i)
+            task = _PrefetchTask(self._prefetcher, self._path, i, self._thumb_sizes[i])
+            task.signals.rendered.connect(self._on_thumbnail_rendered)
+            self._prefetch_pool.start(task)
+
+    @Slot(str, int, QSize, QImage)
+    def _on_thumbnail_rendered(self, path: str, page: int, size: QSize, image: QImage):
+        if path != self._path or page >= len(self._thumbnails):
+            return
+        if image.isNull():
+            self._thumbs_requested.discard(page)  # retried next time it scrolls into view
+            return
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self._thumb_dpr())  # Qt scales it up to the thumbnail's size
+        self._thumb_pixmaps[page] = pixmap
+        self._thumbnails[page].setPixmap(pixmap)
 
     def _update_carousel(self):
-        for i, thumb in enumerate(self._thumbnails):
-            thumb.set_active(i == self._current_page)
+        # Only the previously and newly highlighted thumbnails change state
+        if self._active_thumb != self._current_page:
+            if 0 <= self._active_thumb < len(self._thumbnails):
+                self._thumbnails[self._active_thumb].set_active(False)
+            self._active_thumb = -1
+            if self._current_page < len(self._thumbnails):
+                self._thumbnails[self._current_page].set_active(True)
+                self._active_thumb = self._current_page
 
         # Scroll to make current thumbnail visible
         if self._current_page < len(self._thumbnails):
@@ -0,0 +1,54 @@
+"""Tests for run_llm_task callback delivery."""
+
+import os
+from functools import partial
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QCoreApplication, QDeadlineTimer, QEventLoop  # noqa: E402
+
+from src.services.llm_service import run_llm_task  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def _wait_for(predicate, timeout_ms=5000):
+    deadline = QDeadlineTimer(timeout_ms)
+    while not predicate() and not deadline.hasExpired():
+        QCoreApplication.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 50)
+    return predicate()
+
+
+def test_partial_and_closure_callbacks_receive_results(app):
+    received = []
+
+    def record(tag, value):
+        received.append((tag, value))
+
+    def closure(value):
+        received.append(("closure", value))
+
+    for i in range(4):
+        run_llm_task(lambda x: x * 2, i, done=partial(record, "partial"), error=partial(record, "err"))
+    run_llm_task(str.upper, "answer", done=closure, error=partial(record, "err"))
+
+    assert _wait_for(lambda: len(received) == 5)
+    assert sorted(v for tag, v in received if tag == "partial") == [0, 2, 4, 6]
+    assert ("closure", "ANSWER") in received
+
+
+def test_errors_reach_error_callback(app):
+    errors = []
+
+    def boom():
+        raise RuntimeError("provider exploded")
+
+    run_llm_task(boom, done=lambda _result: errors.append("done?"), error=errors.append)
+
+    assert _wait_for(lambda: len(errors) == 1)
+    assert errors == ["provider exploded"]
@@ -0,0 +1,59 @@
+"""Tests for parse_notes."""
+
+from src.services.note_parser import ParsedNote, parse_notes
+
+
+def test_empty_and_blank_notes():
+    assert parse_notes("") == []
+    assert parse_notes("   \n\n  ") == []
+
+
+def test_notes_without_symbols_produce_nothing():
+    assert parse_notes("just some text\nanother line") == []
+    assert parse_notes("no markup at all, only words") == []
+
+
+def test_each_symbol_maps_to_its_type():
+    notes = parse_notes("- general\n? question\n~ unsure\n! important")
+    assert notes == [
+        ParsedNote("general", "general"),
+        ParsedNote("question", "question"),
+        ParsedNote("uncertain", "unsure"),
+        ParsedNote("important", "important"),
+    ]
+
+
+def test_continuation_lines_join_the_current_block():
+    notes = parse_notes("- first line\n  continues here\n? next")
+    assert notes == [
+        ParsedNote("general", "first line\ncontinues here"),
+        ParsedNote("question", "next"),
+    ]
+
+
+def test_blank_line_ends_a_block():
+    notes = parse_notes("! warning\n\ntrailing text without symbol")
+    assert notes == [ParsedNote("important", "warning")]
+
+
+def test_text_before_the_first_symbol_is_ignored():
+    notes = parse_notes("intro words\n- the note")
+    assert notes == [ParsedNote("general", "the note")]
+
+
+def test_symbol_only_inside_a_line_starts_no_block():
+    # The early return sees "?" but no line begins with it
+    assert parse_notes("is this right? maybe - not sure") == []
+
+
+def test_leading_whitespace_and_missing_space_after_symbol():
+    notes = parse_notes("   ?why\n  -   spaced")
+    assert notes == [
+        ParsedNote("question", "why"),
+        ParsedNote("general", "spaced"),
+    ]
+
+
+def test_bare_symbol_without_text_is_dropped():
+    assert parse_notes("-\n?") == []
+    assert parse_notes("-\ncontinued") == [ParsedNote("general", "continued")]
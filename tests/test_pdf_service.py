@@ -0,0 +1,108 @@
+"""Tests for PDF size validation and the cached base64 encoding."""
+
+import base64
+import os
+
+import pytest
+
+from src.services import pdf_service
+from src.services.pdf_service import MAX_PDF_SIZE, load_pdf_base64, validate_pdf
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    pdf_service._encode_pdf.cache_clear()
+    yield
+    pdf_service._encode_pdf.cache_clear()
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Count how often a PDF is actually read from disk."""
+    calls = []
+    real = pdf_service.Path.read_bytes
+
+    def counting(self):
+        calls.append(self)
+        return real(self)
+
+    monkeypatch.setattr(pdf_service.Path, "read_bytes", counting)
+    return calls
+
+
+def _b64(data: bytes) -> str:
+    return base64.standard_b64encode(data).decode("ascii")
+
+
+def test_encodes_file_contents(tmp_path):
+    pdf = tmp_path / "slides.pdf"
+    pdf.write_bytes(b"%PDF-1.4 first")
+    assert load_pdf_base64(pdf) == _b64(b"%PDF-1.4 first")
+
+
+def test_unchanged_file_is_read_once(tmp_path, reads):
+    pdf = tmp_path / "slides.pdf"
+    pdf.write_bytes(b"%PDF-1.4 first")
+    load_pdf_base64(pdf)
+    load_pdf_base64(pdf)
+    assert len(reads) == 1
+
+
+def test_size_change_invalidates(tmp_path, reads):
+    pdf = tmp_path / "slides.pdf"
+    pdf.write_bytes(b"%PDF-1.4 first")
+    st = pdf.stat()
+    load_pdf_base64(pdf)
+
+    pdf.write_bytes(b"%PDF-1.4 second, longer")
+    os.utime(pdf, ns=(st.st_atime_ns, st.st_mtime_ns))  # same mtime, new size
+    assert load_pdf_base64(pdf) == _b64(b"%PDF-1.4 second, longer")
+    assert len(reads) == 2
+
+
+def test_mtime_change_invalidates(tmp_path, reads):
+    pdf = tmp_path / "slides.pdf"
+    pdf.write_bytes(b"%PDF-1.4 aaaa")
+    st = pdf.stat()
+    load_pdf_base64(pdf)
+
+    pdf.write_bytes(b"%PDF-1.4 bbbb")  # same size
+    os.utime(pdf, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_pdf_base64(pdf) == _b64(b"%PDF-1.4 bbbb")
+    assert len(reads) == 2
+
+
+def test_only_latest_pdf_is_kept(tmp_path, reads):
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    first.write_bytes(b"%PDF a")
+    second.write_bytes(b"%PDF b")
+    load_pdf_base64(first)
+    load_pdf_base64(second)
+    load_pdf_base64(first)
+    assert len(reads) == 3
+    assert pdf_service._encode_pdf.cache_info().currsize == 1
+
+
+def test_oversized_pdf_is_rejected(tmp_path, reads):
+    pdf = tmp_path / "huge.pdf"
+    with open(pdf, "wb") as f:
+        f.truncate(MAX_PDF_SIZE + 1)  # sparse; nothing is read
+
+    with pytest.raises(ValueError, match="exceeds the 32 MB limit"):
+        validate_pdf(pdf)
+    with pytest.raises(ValueError, match="exceeds the 32 MB limit"):
+        load_pdf_base64(pdf)
+    assert reads == []
+
+
+def test_pdf_at_limit_is_accepted(tmp_path):
+    pdf = tmp_path / "max.pdf"
+    with open(pdf, "wb") as f:
+        f.truncate(MAX_PDF_SIZE)
+    validate_pdf(pdf)
+
+
+def test_missing_pdf_raises_oserror(tmp_path):
+    with pytest.raises(OSError):
+        load_pdf_base64(tmp_path / "gone.pdf")
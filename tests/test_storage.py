@@ -0,0 +1,201 @@
+"""Tests for session saving and course ordering in storage."""
+
+import json
+import threading
+
+import pytest
+
+from src.models import storage
+from src.models.session import Session, SlideData
+
+
+@pytest.fixture(autouse=True)
+def courses_dir(tmp_path, monkeypatch):
+    root = tmp_path / "courses"
+    root.mkdir()
+    monkeypatch.setattr(storage, "COURSES_DIR", root)
+    monkeypatch.setattr(storage, "_saved_sessions", {})
+    monkeypatch.setattr(storage, "_json_cache", {})
+    yield root
+    storage.flush_writes()
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Record every session-file write the background writer performs."""
+    calls = []
+    real = storage._write_text
+
+    def recording(path, text):
+        calls.append((path, text))
+        real(path, text)
+
+    monkeypatch.setattr(storage, "_write_text", recording)
+    return calls
+
+
+def _session(lecture_id="lec", notes="- hello") -> Session:
+    storage.lecture_dir_path("course", lecture_id).mkdir(parents=True, exist_ok=True)
+    session = Session(
+        id=lecture_id, title="Lecture", pdf_filename="slides.pdf",
+        created_at="2024-01-01T00:00:00", updated_at="",
+    )
+    session.slides = {}
+    if notes:
+        session.slides = {"1": SlideData(raw_notes=notes)}
+    return session
+
+
+def _saved_notes(lecture_id="lec") -> str:
+    path = storage.lecture_dir_path("course", lecture_id) / "session.json"
+    return json.loads(path.read_text())["slides"]["1"]["raw_notes"]
+
+
+# -- save_session ---------------------------------------------------------------
+
+
+def test_identical_saves_are_skipped(writes):
+    session = _session()
+    storage.save_session("course", session)
+    storage.save_session("course", session)
+    storage.flush_writes()
+    assert len(writes) == 1
+
+    session.slides["1"].raw_notes = "- changed"
+    storage.save_session("course", session)
+    storage.flush_writes()
+    assert len(writes) == 2
+    assert _saved_notes() == "- changed"
+
+
+def test_failed_write_is_retried_by_next_identical_save(monkeypatch, writes):
+    real = storage._write_text
+    failures = []
+
+    def fail_once(path, text):
+        if not failures:
+            failures.append(path)
+            raise OSError("disk full")
+        real(path, text)
+
+    monkeypatch.setattr(storage, "_write_text", fail_once)
+    session = _session()
+    storage.save_session("course", session)
+    storage.flush_writes()
+    assert failures
+    path = storage.lecture_dir_path("course", "lec") / "session.json"
+    assert not path.exists()
+
+    storage.save_session("course", session)  # same content as the failed write
+    storage.flush_writes()
+    assert _saved_notes() == "- hello"
+
+
+def test_deleted_lecture_forgets_saved_content(writes):
+    session = _session()
+    storage.save_session("course", session)
+    storage.flush_writes()
+    storage.delete_lecture("course", "lec")
+    assert not storage._saved_sessions
+
+    _session()  # recreated with the same id
+    storage.save_session("course", session)
+    storage.flush_writes()
+    assert len(writes) == 2
+    assert _saved_notes() == "- hello"
+
+
+def test_moved_lecture_forgets_saved_content():
+    session = _session()
+    storage.save_session("course", session)
+    storage.flush_writes()
+    storage.move_lecture("course", "lec", None, "group")
+    assert not storage._saved_sessions
+
+
+# -- _SessionWriter ---------------------------------------------------------------
+
+
+def test_writer_latest_write_wins(tmp_path, monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    written = []
+    real = storage._write_text
+
+    def slow_first(path, text):
+        if not written:
+            started.set()
+            release.wait(5)
+        written.append(text)
+        real(path, text)
+
+    monkeypatch.setattr(storage, "_write_text", slow_first)
+    writer = storage._SessionWriter()
+    path = tmp_path / "session.json"
+
+    writer.submit(path, "a")
+    assert started.wait(5)
+    writer.submit(path, "b")
+    writer.submit(path, "c")
+    assert writer.get(path) == "c"
+
+    release.set()
+    writer.flush()
+    assert written == ["a", "c"]
+    assert path.read_text() == "c"
+    assert writer.get(path) is None
+
+
+def test_load_session_sees_pending_write(monkeypatch):
+    release = threading.Event()
+    real = storage._write_text
+
+    def blocked(path, text):
+        release.wait(5)
+        real(path, text)
+
+    monkeypatch.setattr(storage, "_write_text", blocked)
+    session = _session(notes="- pending")
+    storage.save_session("course", session)
+    try:
+        assert storage.load_session("course", "lec").slides["1"].raw_notes == "- pending"
+    finally:
+        release.set()
+    storage.flush_writes()
+    assert _saved_notes() == "- pending"
+
+
+# -- Courses ------------------------------------------------------------------------
+
+
+def test_move_course_reorders(courses_dir):
+    ids = [storage.create_course(name).id for name in ("Alpha", "Beta", "Gamma")]
+    storage.move_course(ids[2], 0)
+    assert [c.id for c in storage.list_courses()] == [ids[2], ids[0], ids[1]]
+    storage.move_course(ids[2], 2)
+    assert [c.id for c in storage.list_courses()] == ids
+    storage.move_course("missing", 0)
+    assert [c.id for c in storage.list_courses()] == ids
+
+
+def test_create_course_assigns_next_color_and_keeps_it(courses_dir):
+    first = storage.create_course("Alpha")
+    second = storage.create_course("Beta")
+    assert (first.color, second.color) == (0, 1)
+
+    storage.move_course(second.id, 0)
+    assert {c.id: c.color for c in storage.list_courses()} == {first.id: 0, second.id: 1}
+
+    storage.delete_course(first.id)
+    assert storage.create_course("Gamma").color == 2
+
+
+def test_courses_without_color_get_their_position(courses_dir):
+    legacy = storage.create_course("Legacy")
+    cj = courses_dir / legacy.id / "course.json"
+    data = json.loads(cj.read_text())
+    del data["color"]
+    cj.write_text(json.dumps(data))
+
+    assert storage.list_courses()[0].color == 0
+    assert json.loads(cj.read_text())["color"] == 0